@@ -2,34 +2,70 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
-from .api import SeatApiClient, SeatApiClientProtocol
+from .api import (
+    SeatApiClient,
+    SeatApiClientProtocol,
+    SeatApiError,
+    SeatCommand,
+    SeatVehicleData,
+)
+from .cassette import SeatCassetteRecorder
 from .config_flow import SeatConnectOptionsFlowHandler
 from .const import (
+    CASSETTE_FILENAME,
+    CONF_ACTIVE_INTERVAL,
+    CONF_ASLEEP_INTERVAL,
+    CONF_PARKED_INTERVAL,
+    CONF_RECORD_TRAFFIC,
     CONF_UPDATE_INTERVAL,
     DATA_ENTRIES,
+    DATA_RATE_LIMITER,
     DATA_SERVICES_REGISTERED,
+    DATA_VINS,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_ASLEEP_INTERVAL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_PARKED_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     PLATFORMS,
+    SERVICE_CONFIG_ENTRY_ID,
     SERVICE_LOCK,
     SERVICE_START_CLIMATE,
     SERVICE_STOP_CLIMATE,
     SERVICE_UNLOCK,
     SERVICE_VIN,
+    STORAGE_KEY,
+    STORAGE_VERSION,
 )
-from .coordinator import SeatDataUpdateCoordinator
+from .coordinator import SeatDataUpdateCoordinator, SeatPollingPolicy
+from .ratelimit import SeatRateLimiter
+from .session import async_create_seat_session
+from .token import SeatTokenManager
 
 
 @dataclass(slots=True)
@@ -38,6 +74,8 @@ class SeatConnectRuntimeData:
 
     client: SeatApiClientProtocol
     coordinator: SeatDataUpdateCoordinator
+    # Options the runtime was last configured with.
+    options: dict[str, Any] = field(default_factory=dict)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -46,6 +84,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     store = hass.data.setdefault(DOMAIN, {})
     store.setdefault(DATA_ENTRIES, {})
     store.setdefault(DATA_SERVICES_REGISTERED, False)
+    store.setdefault(DATA_VINS, {})
+    if DATA_RATE_LIMITER not in store:
+        store[DATA_RATE_LIMITER] = SeatRateLimiter()
     return True
 
 
@@ -55,24 +96,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     store = hass.data.setdefault(DOMAIN, {})
     store.setdefault(DATA_ENTRIES, {})
     store.setdefault(DATA_SERVICES_REGISTERED, False)
+    store.setdefault(DATA_VINS, {})
+    if DATA_RATE_LIMITER not in store:
+        store[DATA_RATE_LIMITER] = SeatRateLimiter()
 
     implementation = await config_entry_oauth2_flow.async_get_config_entry_implementation(
         hass, entry
     )
     oauth_session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
-    client = SeatApiClient(oauth_session)
+    session, connection_stats = async_create_seat_session(concurrency=DEFAULT_CONCURRENCY)
+    entry.async_on_unload(session.close)
+
+    @callback
+    def _async_close_session(_event: Event) -> None:
+        hass.async_create_task(session.close())
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+    token_manager = SeatTokenManager(oauth_session)
+    token_manager.async_start()
+    entry.async_on_unload(token_manager.async_stop)
+    recorder = None
+    if entry.options.get(CONF_RECORD_TRAFFIC, False):
+        recorder = SeatCassetteRecorder()
+        _async_setup_cassette(hass, entry, recorder)
+    client = SeatApiClient(
+        oauth_session,
+        rate_limiter=store[DATA_RATE_LIMITER],
+        session=session,
+        connection_stats=connection_stats,
+        recorder=recorder,
+        token_manager=token_manager,
+    )
 
-    update_interval = _async_get_update_interval(entry)
+    policy = _async_get_polling_policy(entry)
     coordinator = SeatDataUpdateCoordinator(
         hass,
         client=client,
         entry=entry,
-        update_interval=update_interval,
+        update_interval=policy.normal,
+        policy=policy,
+    )
+    if await coordinator.async_restore():
+        # Entities load from the snapshot; the cloud is queried off the boot path.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{coordinator.name} first refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+    runtime = SeatConnectRuntimeData(
+        client=client, coordinator=coordinator, options=dict(entry.options)
     )
-    await coordinator.async_config_entry_first_refresh()
+    hass.data[DOMAIN][DATA_ENTRIES][entry.entry_id] = runtime
+    _async_index_vins(hass, runtime, coordinator.data or {})
+
+    @callback
+    def _async_vehicles_changed(vehicles: Mapping[str, SeatVehicleData]) -> None:
+        _async_index_vins(hass, runtime, vehicles)
 
-    hass.data[DOMAIN][DATA_ENTRIES][entry.entry_id] = SeatConnectRuntimeData(
-        client=client, coordinator=coordinator
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.signal_vehicles_changed(), _async_vehicles_changed
+        )
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -89,73 +176,151 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not unload_ok:
         return False
 
-    hass.data[DOMAIN][DATA_ENTRIES].pop(entry.entry_id, None)
+    if (runtime := hass.data[DOMAIN][DATA_ENTRIES].pop(entry.entry_id, None)) is not None:
+        _async_unindex_vins(hass, runtime)
     if not hass.data[DOMAIN][DATA_ENTRIES]:
         await _async_unregister_services(hass)
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted vehicle snapshot of a deleted entry."""
+
+    await Store(hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry.entry_id)).async_remove()
+
+
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options updates."""
 
     runtime = hass.data[DOMAIN][DATA_ENTRIES].get(entry.entry_id)
-    if not runtime:
+    if not runtime or entry.options == runtime.options:
+        # Only the entry data changed, e.g. the token was renewed.
+        return
+    runtime.options = dict(entry.options)
+    if entry.options.get(CONF_RECORD_TRAFFIC, False) != (runtime.client.recorder is not None):
+        # The recorder is wired into the client, which only a reload rebuilds.
+        await hass.config_entries.async_reload(entry.entry_id)
         return
-    runtime.coordinator.update_interval = _async_get_update_interval(entry)
+    runtime.coordinator.polling_policy = _async_get_polling_policy(entry)
     await runtime.coordinator.async_request_refresh()
 
 
-def _async_get_update_interval(entry: ConfigEntry) -> timedelta:
-    seconds = entry.options.get(CONF_UPDATE_INTERVAL)
-    if seconds is None:
-        return DEFAULT_UPDATE_INTERVAL
-    return timedelta(seconds=seconds)
+@callback
+def _async_setup_cassette(
+    hass: HomeAssistant, entry: ConfigEntry, recorder: SeatCassetteRecorder
+) -> None:
+    """Write the recorded traffic to the config directory on unload and shutdown."""
 
+    path = hass.config.path(CASSETTE_FILENAME.format(entry_id=entry.entry_id))
 
-async def _async_register_services(hass: HomeAssistant) -> None:
-    data = hass.data[DOMAIN]
-    if data.get(DATA_SERVICES_REGISTERED):
-        return
+    async def _async_write(_event: Event | None = None) -> None:
+        await hass.async_add_executor_job(recorder.write, path)
 
-    schema = vol.Schema({vol.Required(SERVICE_VIN): cv.string})
+    entry.async_on_unload(_async_write)
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_write))
 
-    async def _async_call_service(call: ServiceCall, action: str) -> None:
-        vin = call.data[SERVICE_VIN]
-        runtime = _async_get_runtime_for_vin(hass, vin)
-        if not runtime:
-            raise HomeAssistantError(f"Unknown VIN: {vin}")
 
-        if action == SERVICE_LOCK:
-            await runtime.client.async_lock_vehicle(vin)
-        elif action == SERVICE_UNLOCK:
-            await runtime.client.async_unlock_vehicle(vin)
-        elif action == SERVICE_START_CLIMATE:
-            await runtime.client.async_start_climate(vin)
-        elif action == SERVICE_STOP_CLIMATE:
-            await runtime.client.async_stop_climate(vin)
-        await runtime.coordinator.async_request_refresh()
+def _async_get_polling_policy(entry: ConfigEntry) -> SeatPollingPolicy:
+    return SeatPollingPolicy(
+        normal=_async_get_interval(entry, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        active=_async_get_interval(entry, CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL),
+        parked=_async_get_interval(entry, CONF_PARKED_INTERVAL, DEFAULT_PARKED_INTERVAL),
+        asleep=_async_get_interval(entry, CONF_ASLEEP_INTERVAL, DEFAULT_ASLEEP_INTERVAL),
+    )
 
-    async def _handle_lock(call: ServiceCall) -> None:
-        await _async_call_service(call, SERVICE_LOCK)
 
-    async def _handle_unlock(call: ServiceCall) -> None:
-        await _async_call_service(call, SERVICE_UNLOCK)
+def _async_get_interval(entry: ConfigEntry, key: str, default: timedelta) -> timedelta:
+    seconds = entry.options.get(key)
+    if seconds is None:
+        return default
+    return timedelta(seconds=seconds)
 
-    async def _handle_start_climate(call: ServiceCall) -> None:
-        await _async_call_service(call, SERVICE_START_CLIMATE)
 
-    async def _handle_stop_climate(call: ServiceCall) -> None:
-        await _async_call_service(call, SERVICE_STOP_CLIMATE)
+async def _async_register_services(hass: HomeAssistant) -> None:
+    data = hass.data[DOMAIN]
+    if data.get(DATA_SERVICES_REGISTERED):
+        return
 
-    hass.services.async_register(DOMAIN, SERVICE_LOCK, _handle_lock, schema=schema)
-    hass.services.async_register(DOMAIN, SERVICE_UNLOCK, _handle_unlock, schema=schema)
-    hass.services.async_register(
-        DOMAIN, SERVICE_START_CLIMATE, _handle_start_climate, schema=schema
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_STOP_CLIMATE, _handle_stop_climate, schema=schema
+    schema = vol.All(
+        vol.Schema(
+            {
+                vol.Exclusive(SERVICE_VIN, "target"): vol.All(cv.ensure_list, [cv.string]),
+                vol.Exclusive(SERVICE_CONFIG_ENTRY_ID, "target"): cv.string,
+            }
+        ),
+        cv.has_at_least_one_key(SERVICE_VIN, SERVICE_CONFIG_ENTRY_ID),
     )
 
+    async def _async_call_service(call: ServiceCall, action: str) -> ServiceResponse:
+        targets, unknown = _async_get_service_targets(hass, call)
+        outcomes = await asyncio.gather(
+            *(
+                _async_send_command(runtime.client, vin, action)
+                for runtime, vins in targets
+                for vin in vins
+            ),
+            return_exceptions=True,
+        )
+
+        results: dict[str, dict[str, Any]] = {
+            vin: {"success": False, "error": f"No runtime loaded for VIN {vin}"}
+            for vin in unknown
+        }
+        failures: list[str] = list(unknown)
+        remaining = iter(outcomes)
+        sent = [(runtime, {vin: next(remaining) for vin in vins}) for runtime, vins in targets]
+        try:
+            for _runtime, vin_outcomes in sent:
+                for vin, outcome in vin_outcomes.items():
+                    if isinstance(outcome, SeatApiError):
+                        failures.append(vin)
+                        results[vin] = {"success": False, "error": str(outcome)}
+                        continue
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                    results[vin] = {"success": True, "command_id": outcome.id}
+        finally:
+            # Follow every command that was sent, even if another one failed unexpectedly;
+            # one background follow-up and refresh per account for the whole batch.
+            for runtime, vin_outcomes in sent:
+                runtime.coordinator.async_track_commands(
+                    [
+                        outcome
+                        for outcome in vin_outcomes.values()
+                        if not isinstance(outcome, BaseException)
+                    ]
+                )
+
+        if failures and not call.return_response:
+            raise HomeAssistantError(f"{action} failed for {', '.join(failures)}")
+        return {"results": results}
+
+    async def _handle_lock(call: ServiceCall) -> ServiceResponse:
+        return await _async_call_service(call, SERVICE_LOCK)
+
+    async def _handle_unlock(call: ServiceCall) -> ServiceResponse:
+        return await _async_call_service(call, SERVICE_UNLOCK)
+
+    async def _handle_start_climate(call: ServiceCall) -> ServiceResponse:
+        return await _async_call_service(call, SERVICE_START_CLIMATE)
+
+    async def _handle_stop_climate(call: ServiceCall) -> ServiceResponse:
+        return await _async_call_service(call, SERVICE_STOP_CLIMATE)
+
+    for service, handler in (
+        (SERVICE_LOCK, _handle_lock),
+        (SERVICE_UNLOCK, _handle_unlock),
+        (SERVICE_START_CLIMATE, _handle_start_climate),
+        (SERVICE_STOP_CLIMATE, _handle_stop_climate),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
     data[DATA_SERVICES_REGISTERED] = True
 
 
@@ -171,12 +336,76 @@ async def _async_unregister_services(hass: HomeAssistant) -> None:
     data[DATA_SERVICES_REGISTERED] = False
 
 
-def _async_get_runtime_for_vin(hass: HomeAssistant, vin: str) -> SeatConnectRuntimeData:
+async def _async_send_command(
+    client: SeatApiClientProtocol, vin: str, action: str
+) -> SeatCommand:
+    if action == SERVICE_LOCK:
+        return await client.async_lock_vehicle(vin)
+    if action == SERVICE_UNLOCK:
+        return await client.async_unlock_vehicle(vin)
+    if action == SERVICE_START_CLIMATE:
+        return await client.async_start_climate(vin)
+    if action == SERVICE_STOP_CLIMATE:
+        return await client.async_stop_climate(vin)
+    raise HomeAssistantError(f"Unknown action: {action}")
+
+
+def _async_get_service_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> tuple[list[tuple[SeatConnectRuntimeData, list[str]]], list[str]]:
+    """Resolve the VINs of a service call, grouped by the entry they belong to.
+
+    VINs that belong to no loaded entry are returned separately.
+    """
+
+    entries: dict[str, SeatConnectRuntimeData] = hass.data[DOMAIN][DATA_ENTRIES]
+    if (entry_id := call.data.get(SERVICE_CONFIG_ENTRY_ID)) is not None:
+        runtime = entries.get(entry_id)
+        if runtime is None:
+            raise HomeAssistantError(f"No runtime loaded for config entry {entry_id}")
+        return [(runtime, list(runtime.coordinator.data or {}))], []
+
+    grouped: dict[int, tuple[SeatConnectRuntimeData, list[str]]] = {}
+    unknown: list[str] = []
+    for vin in dict.fromkeys(call.data[SERVICE_VIN]):
+        if (runtime := _async_get_runtime_for_vin(hass, vin)) is None:
+            unknown.append(vin)
+            continue
+        grouped.setdefault(id(runtime), (runtime, []))[1].append(vin)
+    return list(grouped.values()), unknown
+
+
+def _async_get_runtime_for_vin(hass: HomeAssistant, vin: str) -> SeatConnectRuntimeData | None:
+    index: dict[str, SeatConnectRuntimeData] = hass.data[DOMAIN][DATA_VINS]
+    if (runtime := index.get(vin)) is not None:
+        return runtime
+    # VINs that appeared since the last index update are picked up on a miss.
     entries: dict[str, SeatConnectRuntimeData] = hass.data[DOMAIN][DATA_ENTRIES]
     for runtime in entries.values():
         if runtime.coordinator.data and vin in runtime.coordinator.data:
+            index[vin] = runtime
             return runtime
-    raise HomeAssistantError(f"No runtime loaded for VIN {vin}")
+    return None
+
+
+@callback
+def _async_index_vins(
+    hass: HomeAssistant, runtime: SeatConnectRuntimeData, vins: Collection[str]
+) -> None:
+    """Point the VINs of the runtime's last successful refresh at it."""
+
+    index: dict[str, SeatConnectRuntimeData] = hass.data[DOMAIN][DATA_VINS]
+    for vin in [vin for vin, owner in index.items() if owner is runtime and vin not in vins]:
+        del index[vin]
+    for vin in vins:
+        index[vin] = runtime
+
+
+@callback
+def _async_unindex_vins(hass: HomeAssistant, runtime: SeatConnectRuntimeData) -> None:
+    index: dict[str, SeatConnectRuntimeData] = hass.data[DOMAIN][DATA_VINS]
+    for vin in [vin for vin, owner in index.items() if owner is runtime]:
+        del index[vin]
 
 
 async def async_get_options_flow(entry: ConfigEntry) -> Any:
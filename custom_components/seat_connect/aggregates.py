@@ -0,0 +1,112 @@
+"""Fleet-wide aggregates of a Seat Connect account."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .api import SeatVehicleData
+
+# Vehicle fields the aggregates are derived from.
+AGGREGATE_FIELDS = frozenset(
+    {"battery_soc", "battery_range_km", "charging_power_kw", "plug_connected", "doors_closed"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _Contribution:
+    """What a single vehicle adds to the fleet totals."""
+
+    battery_soc: float | None
+    battery_range_km: float
+    charging_power_kw: float
+    plugged_in: int
+    doors_open: int
+
+    @classmethod
+    def of(cls, vehicle: SeatVehicleData) -> _Contribution:
+        return cls(
+            battery_soc=vehicle.battery_soc,
+            battery_range_km=vehicle.battery_range_km or 0.0,
+            charging_power_kw=vehicle.charging_power_kw or 0.0,
+            plugged_in=int(bool(vehicle.plug_connected)),
+            doors_open=int(vehicle.doors_closed is False),
+        )
+
+
+class SeatFleetAggregates:
+    """Running sums and counts over every vehicle of an account.
+
+    Updating a vehicle subtracts its previous contribution and adds the new
+    one, so keeping the totals current costs O(changed vehicles) per refresh
+    rather than a pass over the whole fleet.
+    """
+
+    def __init__(self) -> None:
+        self._contributions: dict[str, _Contribution] = {}
+        self._soc_sum = 0.0
+        self._soc_count = 0
+        self._range_km = 0.0
+        self._charging_power_kw = 0.0
+        self.plugged_in = 0
+        self.doors_open = 0
+
+    @property
+    def vehicles(self) -> int:
+        """Return the number of vehicles counted."""
+
+        return len(self._contributions)
+
+    @property
+    def average_soc(self) -> float | None:
+        """Return the mean state of charge of the vehicles reporting one."""
+
+        if not self._soc_count:
+            return None
+        return round(self._soc_sum / self._soc_count, 1)
+
+    @property
+    def total_range_km(self) -> float:
+        """Return the summed electric range."""
+
+        return round(self._range_km, 1)
+
+    @property
+    def charging_power_kw(self) -> float:
+        """Return the summed charging power."""
+
+        return round(self._charging_power_kw, 2)
+
+    def update(self, vin: str, vehicle: SeatVehicleData) -> bool:
+        """Replace the contribution of a vehicle; return True if a total changed."""
+
+        contribution = _Contribution.of(vehicle)
+        previous = self._contributions.get(vin)
+        if contribution == previous:
+            return False
+        if previous is not None:
+            self._apply(previous, -1)
+        self._apply(contribution, 1)
+        self._contributions[vin] = contribution
+        return True
+
+    def remove(self, vin: str) -> bool:
+        """Drop a vehicle from the totals; return True if it was counted."""
+
+        if (previous := self._contributions.pop(vin, None)) is None:
+            return False
+        self._apply(previous, -1)
+        if not self._contributions:
+            self._range_km = self._charging_power_kw = 0.0
+        return True
+
+    def _apply(self, contribution: _Contribution, sign: int) -> None:
+        if contribution.battery_soc is not None:
+            self._soc_sum += sign * contribution.battery_soc
+            self._soc_count += sign
+        self._range_km += sign * contribution.battery_range_km
+        self._charging_power_kw += sign * contribution.charging_power_kw
+        self.plugged_in += sign * contribution.plugged_in
+        self.doors_open += sign * contribution.doors_open
+        if not self._soc_count:
+            # Drop the floating point residue of the subtractions.
+            self._soc_sum = 0.0
@@ -3,19 +3,49 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from dataclasses import dataclass, field
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+from functools import partial
 from http import HTTPStatus
 from typing import Any, Protocol
+from urllib.parse import urlencode
 
 import async_timeout
-from aiohttp import ClientError, ClientResponseError
+from aiohttp import ClientError, ClientResponse, ClientResponseError, ClientSession, hdrs
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
 
-from .const import API_BASE_URL, LOGGER_NAME
+from .cassette import ERROR_NETWORK, ERROR_TIMEOUT, SeatCassetteRecorder, SeatOutcome
+from .circuit_breaker import SeatCircuitBreaker, full_jitter_backoff
+from .const import (
+    API_BASE_URL,
+    DEFAULT_CONCURRENCY,
+    LOGGER_NAME,
+    MAX_BACKOFF,
+    MAX_RETRY_AFTER,
+    ROSTER_REFRESH_INTERVAL,
+)
+from .metrics import SeatRequestMetrics
+from .parser import STATUS_FIELDS, compile_status_parser
+from .priority import SeatPrioritySemaphore, SeatRequestPriority, current_priority
+from .ratelimit import SeatRateLimiter, parse_retry_after
+from .session import SeatConnectionStats
+from .token import SeatTokenManager
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
+ROSTER_PATH = "/vehicles"
+
+ENDPOINT_ROSTER = "roster"
+ENDPOINT_STATUS = "status"
+ENDPOINT_COMMAND = "command"
+
 
 class SeatApiError(Exception):
     """General Seat API error."""
@@ -29,6 +59,37 @@ class SeatApiRateLimitError(SeatApiError):
     """Raised when the Seat backend returns HTTP 429."""
 
 
+class SeatPartialRefreshError(SeatApiError):
+    """Raised when the status of only some vehicles of the account could be fetched.
+
+    ``data`` holds the vehicles that were refreshed and ``errors`` the
+    failure of every other VIN.
+    """
+
+    def __init__(
+        self, data: dict[str, SeatVehicleData], errors: dict[str, SeatApiError]
+    ) -> None:
+        super().__init__(f"Failed to refresh {len(errors)} of {len(data) + len(errors)} vehicles")
+        self.data = data
+        self.errors = errors
+
+
+class SeatDeadlineExceededError(SeatApiError):
+    """Raised when a request cannot finish before the deadline of its refresh."""
+
+
+class SeatCircuitOpenError(SeatApiError):
+    """Raised without sending a request while its endpoint class keeps failing."""
+
+
+class SeatVehicleNotFoundError(SeatApiError):
+    """Raised when the backend refuses the status of a vehicle (HTTP 403/404).
+
+    Unlike other failures, this says the vehicle is no longer part of the
+    account, so the cached roster is out of date.
+    """
+
+
 @dataclass(slots=True)
 class SeatVehicleData:
     """Normalized vehicle representation."""
@@ -45,27 +106,113 @@ class SeatVehicleData:
     windows_closed: bool | None = None
     is_locked: bool | None = None
     climate_active: bool | None = None
-    capabilities: set[str] = field(default_factory=set)
+    # Upper-cased and shared between vehicles and refreshes; see normalize_capabilities.
+    capabilities: frozenset[str] = frozenset()
+
+
+_parse_status = compile_status_parser(SeatVehicleData, STATUS_FIELDS.values())
+
+
+class SeatCommandStatus(StrEnum):
+    """Execution state of a remote command."""
+
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+_COMMAND_STATUSES: dict[str, SeatCommandStatus] = {
+    "success": SeatCommandStatus.SUCCEEDED,
+    "succeeded": SeatCommandStatus.SUCCEEDED,
+    "completed": SeatCommandStatus.SUCCEEDED,
+    "fulfilled": SeatCommandStatus.SUCCEEDED,
+    "failed": SeatCommandStatus.FAILED,
+    "error": SeatCommandStatus.FAILED,
+    "rejected": SeatCommandStatus.FAILED,
+    "timeout": SeatCommandStatus.FAILED,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SeatCommand:
+    """Remote command accepted by the Seat backend."""
+
+    vin: str
+    command: str
+    id: str | None = None
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Validators and decoded payload of the last successful GET for a URL."""
+
+    etag: str | None
+    last_modified: str | None
+    payload: Any
+
+
+@dataclass(frozen=True, slots=True)
+class _SeatRequest:
+    """A request as sent on every attempt, with the cached response it may revalidate."""
+
+    method: str
+    path: str
+    url: str
+    endpoint: str
+    conditional: bool
+    cached: _CachedResponse | None
 
 
 class SeatApiClientProtocol(Protocol):
     """Protocol describing the Seat API client."""
 
+    @property
+    def metrics(self) -> SeatRequestMetrics:
+        """Return the per-endpoint request metrics."""
+
+    @property
+    def connection_stats(self) -> SeatConnectionStats | None:
+        """Return the connection reuse counters of the dedicated session, if any."""
+
+    @property
+    def circuit_breakers(self) -> dict[str, SeatCircuitBreaker]:
+        """Return the circuit breakers keyed by endpoint class."""
+
+    @property
+    def recorder(self) -> SeatCassetteRecorder | None:
+        """Return the traffic recorder, if recording is enabled."""
+
+    @property
+    def rate_limiter(self) -> SeatRateLimiter | None:
+        """Return the rate limiter pacing the requests, if any."""
+
     async def async_get_vehicle_data(self) -> dict[str, SeatVehicleData]:
-        """Return the latest vehicle data indexed by VIN."""
+        """Return the latest vehicle data indexed by VIN.
+
+        Raises SeatPartialRefreshError if only some vehicles could be refreshed.
+        """
+
+    async def async_get_vehicle(self, vin: str) -> SeatVehicleData:
+        """Return the latest data of a single vehicle."""
+
+    def invalidate_roster(self) -> None:
+        """Force the vehicle list to be fetched again on the next refresh."""
 
-    async def async_lock_vehicle(self, vin: str) -> None:
+    async def async_lock_vehicle(self, vin: str) -> SeatCommand:
         """Lock the vehicle."""
 
-    async def async_unlock_vehicle(self, vin: str) -> None:
+    async def async_unlock_vehicle(self, vin: str) -> SeatCommand:
         """Unlock the vehicle."""
 
-    async def async_start_climate(self, vin: str) -> None:
+    async def async_start_climate(self, vin: str) -> SeatCommand:
         """Start pre-conditioning."""
 
-    async def async_stop_climate(self, vin: str) -> None:
+    async def async_stop_climate(self, vin: str) -> SeatCommand:
         """Stop pre-conditioning."""
 
+    async def async_get_command_status(self, command: SeatCommand) -> SeatCommandStatus:
+        """Return the execution state of a previously sent command."""
+
 
 class SeatApiClient(SeatApiClientProtocol):
     """Seat Connect API client with retry/backoff handling."""
@@ -78,130 +225,596 @@ class SeatApiClient(SeatApiClientProtocol):
         request_timeout: float = 30,
         max_retries: int = 3,
         backoff_factor: float = 2.0,
-        concurrency: int = 4,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        roster_refresh_interval: timedelta = ROSTER_REFRESH_INTERVAL,
+        rate_limiter: SeatRateLimiter | None = None,
+        session: ClientSession | None = None,
+        connection_stats: SeatConnectionStats | None = None,
+        recorder: SeatCassetteRecorder | None = None,
+        token_manager: SeatTokenManager | None = None,
     ) -> None:
         self._oauth_session = oauth_session
+        self._token_manager = token_manager
+        self._recorder = recorder
+        self._session = session
+        self._connection_stats = connection_stats
         self._base_url = base_url.rstrip("/")
         self._request_timeout = request_timeout
         self._max_retries = max_retries
         self._backoff_factor = backoff_factor
-        self._semaphore = asyncio.Semaphore(concurrency)
+        self._slots = SeatPrioritySemaphore(concurrency)
+        self._rate_limiter = rate_limiter
+        self._roster_refresh_interval = roster_refresh_interval.total_seconds()
+        self._roster: dict[str, dict[str, Any]] | None = None
+        self._roster_fetched_at = 0.0
+        self._response_cache: dict[str, _CachedResponse] = {}
+        self._vehicle_cache: dict[str, tuple[dict[str, Any], Any, SeatVehicleData]] = {}
+        self._inflight: dict[
+            tuple[str, bool, SeatRequestPriority], tuple[asyncio.Task[Any], Context]
+        ] = {}
+        self._metrics = SeatRequestMetrics()
+        self._breakers = {
+            endpoint: SeatCircuitBreaker(endpoint)
+            for endpoint in (ENDPOINT_ROSTER, ENDPOINT_STATUS, ENDPOINT_COMMAND)
+        }
 
-    async def async_get_vehicle_data(self) -> dict[str, SeatVehicleData]:
-        """Return normalized vehicle data for the account."""
+    @property
+    def metrics(self) -> SeatRequestMetrics:
+        """Return the per-endpoint request metrics."""
 
-        payload = await self._request("GET", "/vehicles")
-        if isinstance(payload, dict):
-            vehicles_raw = payload.get("vehicles", payload)
-        elif isinstance(payload, list):
-            vehicles_raw = payload
-        else:
-            raise SeatApiError("Unexpected payload from Seat Connect")
-        vehicles: list[dict[str, Any]] = list(vehicles_raw)
-        tasks = [self._async_build_vehicle(entry) for entry in vehicles]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return self._metrics
+
+    @property
+    def circuit_breakers(self) -> dict[str, SeatCircuitBreaker]:
+        """Return the circuit breakers keyed by endpoint class."""
+
+        return self._breakers
+
+    @property
+    def recorder(self) -> SeatCassetteRecorder | None:
+        """Return the traffic recorder, if recording is enabled."""
+
+        return self._recorder
+
+    @property
+    def rate_limiter(self) -> SeatRateLimiter | None:
+        """Return the rate limiter pacing the requests, if any."""
+
+        return self._rate_limiter
+
+    @property
+    def connection_stats(self) -> SeatConnectionStats | None:
+        """Return the connection reuse counters of the dedicated session, if any."""
+
+        return self._connection_stats
+
+    async def async_get_vehicle_data(self) -> dict[str, SeatVehicleData]:
+        """Return normalized vehicle data for the account.
+
+        Status requests start as soon as a vehicle is listed, so they overlap
+        with the fetches of further roster pages. A vehicle whose status cannot
+        be fetched does not discard the others: SeatPartialRefreshError carries
+        both. Only when no vehicle could be refreshed does the call fail as a
+        whole.
+        """
+
+        tasks: dict[str, asyncio.Task[SeatVehicleData]] = {}
+        try:
+            async for vehicle in self._async_iter_roster():
+                tasks[vehicle["vin"]] = asyncio.create_task(self._async_build_vehicle(vehicle))
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
         data: dict[str, SeatVehicleData] = {}
-        for result in results:
+        errors: dict[str, SeatApiError] = {}
+        for vin, result in zip(tasks, results, strict=True):
             if isinstance(result, SeatVehicleData):
-                data[result.vin] = result
-                continue
-            if isinstance(result, BaseException):
-                raise SeatApiError("Failed to refresh vehicle data") from result
-            raise SeatApiError("Failed to refresh vehicle data due to unknown error")
+                data[vin] = result
+            elif isinstance(result, SeatApiAuthError):
+                raise result
+            elif isinstance(result, SeatApiError):
+                errors[vin] = result
+            elif isinstance(result, Exception):
+                error = SeatApiError(f"Failed to refresh vehicle {vin}")
+                error.__cause__ = result
+                errors[vin] = error
+            else:
+                raise result
+        if errors:
+            if any(isinstance(error, SeatVehicleNotFoundError) for error in errors.values()):
+                # A vehicle was removed from the account; make sure the next
+                # refresh does not keep asking for it from a stale roster.
+                self.invalidate_roster()
+            if not data:
+                raise SeatApiError("Failed to refresh vehicle data") from next(
+                    iter(errors.values())
+                )
+            raise SeatPartialRefreshError(data, errors)
         return data
 
-    async def async_lock_vehicle(self, vin: str) -> None:
-        await self._execute_command(vin, "lock")
+    async def async_get_vehicle(self, vin: str) -> SeatVehicleData:
+        """Return normalized data of a single vehicle of the account."""
+
+        vehicle = await self._async_find_roster_entry(vin)
+        try:
+            return await self._async_build_vehicle(vehicle)
+        except SeatVehicleNotFoundError:
+            self.invalidate_roster()
+            raise
+
+    def invalidate_roster(self) -> None:
+        """Force the vehicle list to be fetched again on the next refresh."""
+
+        self._roster = None
 
-    async def async_unlock_vehicle(self, vin: str) -> None:
-        await self._execute_command(vin, "unlock")
+    async def async_lock_vehicle(self, vin: str) -> SeatCommand:
+        return await self._execute_command(vin, "lock")
 
-    async def async_start_climate(self, vin: str) -> None:
-        await self._execute_command(vin, "start_climate")
+    async def async_unlock_vehicle(self, vin: str) -> SeatCommand:
+        return await self._execute_command(vin, "unlock")
 
-    async def async_stop_climate(self, vin: str) -> None:
-        await self._execute_command(vin, "stop_climate")
+    async def async_start_climate(self, vin: str) -> SeatCommand:
+        return await self._execute_command(vin, "start_climate")
+
+    async def async_stop_climate(self, vin: str) -> SeatCommand:
+        return await self._execute_command(vin, "stop_climate")
+
+    async def async_get_command_status(self, command: SeatCommand) -> SeatCommandStatus:
+        """Return the execution state of a previously sent command."""
+
+        if command.id is None:
+            raise SeatApiError(f"Command {command.command} cannot be tracked without an id")
+        payload = await self._request(
+            "GET",
+            f"/vehicles/{command.vin}/actions/{command.command}/{command.id}",
+            conditional=False,
+        )
+        status = payload.get("status") if isinstance(payload, dict) else None
+        if not isinstance(status, str):
+            return SeatCommandStatus.PENDING
+        return _COMMAND_STATUSES.get(status.lower(), SeatCommandStatus.PENDING)
+
+    async def _async_get_roster(self) -> dict[str, dict[str, Any]]:
+        """Return the cached vehicle list, refreshing it once it is too old."""
+
+        async for _vehicle in self._async_iter_roster():
+            pass
+        assert self._roster is not None
+        return self._roster
+
+    async def _async_iter_roster(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield the vehicles of the account, fetching the roster page by page if stale.
+
+        Pages are revalidated through the response cache, so an unchanged page
+        costs a 304; the cached roster keeps one entry per VIN and is replaced
+        once the last page was read.
+        """
+
+        now = time.monotonic()
+        if self._roster is not None and now - self._roster_fetched_at < (
+            self._roster_refresh_interval
+        ):
+            for vehicle in list(self._roster.values()):
+                yield vehicle
+            return
+
+        roster: dict[str, dict[str, Any]] = {}
+        path: str | None = ROSTER_PATH
+        seen: set[str] = set()
+        while path is not None:
+            seen.add(path)
+            payload = await self._request("GET", path)
+            vehicles_raw, path = _parse_roster_page(payload)
+            for vehicle in vehicles_raw:
+                if vehicle["vin"] in roster:
+                    continue
+                roster[vehicle["vin"]] = vehicle
+                yield vehicle
+            if path in seen:
+                raise SeatApiError("Seat Connect returned a looping vehicle list")
+        self._roster = roster
+        self._roster_fetched_at = now
+        self._prune_caches(roster, seen)
+
+    async def _async_find_roster_entry(self, vin: str) -> dict[str, Any]:
+        if vehicle := (await self._async_get_roster()).get(vin):
+            return vehicle
+        raise SeatApiError(f"Vehicle {vin} is not part of the account")
 
     async def _async_build_vehicle(self, vehicle: dict[str, Any]) -> SeatVehicleData:
         vin: str = vehicle["vin"]
         status = await self._request("GET", f"/vehicles/{vin}/status")
-        battery = status.get("battery", {})
-        charging = status.get("charging", {})
-        locks = status.get("locks", {})
-        climate = status.get("climate", {})
-        doors = status.get("doors", {})
-
-        return SeatVehicleData(
+        # A 304 hands back the very same payload object, so identity checks are
+        # enough to reuse the vehicle normalized from it on the previous poll.
+        if (cached := self._vehicle_cache.get(vin)) and (
+            cached[0] is vehicle and cached[1] is status
+        ):
+            return cached[2]
+        data = _parse_status(
+            status,
             vin=vin,
             name=vehicle.get("nickname") or vehicle.get("name") or vin,
             model=vehicle.get("model", "Unknown"),
-            battery_soc=_coerce_float(battery.get("stateOfCharge")),
-            battery_range_km=_coerce_float(battery.get("remainingRangeKm")),
-            charging_power_kw=_coerce_float(charging.get("powerKw")),
-            charging_state=charging.get("state"),
-            plug_connected=(
-                bool(charging.get("plugConnected")) if "plugConnected" in charging else None
-            ),
-            doors_closed=doors.get("allClosed"),
-            windows_closed=doors.get("windowsClosed"),
-            is_locked=locks.get("locked"),
-            climate_active=climate.get("active"),
-            capabilities=set(vehicle.get("capabilities", [])),
+            capabilities=normalize_capabilities(vehicle.get("capabilities") or ()),
         )
+        self._vehicle_cache[vin] = (vehicle, status, data)
+        return data
 
-    async def _execute_command(self, vin: str, command: str) -> None:
+    async def _execute_command(self, vin: str, command: str) -> SeatCommand:
         endpoint = f"/vehicles/{vin}/actions/{command}"
-        await self._request("POST", endpoint)
-
-    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:  # noqa: PLR0912
-        url = f"{self._base_url}{path}"
+        payload = await self._request("POST", endpoint)
+        command_id = None
+        if isinstance(payload, dict):
+            for key in ("id", "requestId", "actionId"):
+                if payload.get(key) is not None:
+                    command_id = str(payload[key])
+                    break
+        return SeatCommand(vin=vin, command=command, id=command_id)
+
+    async def _request(
+        self, method: str, path: str, *, conditional: bool = True, **kwargs: Any
+    ) -> Any:
+        """Send a request, sharing the response of an identical GET already in flight."""
+
+        if method != "GET" or kwargs:
+            return await self._async_perform_request(
+                method, path, conditional=conditional, **kwargs
+            )
+        # The request runs at the priority of the first caller; more urgent
+        # callers must not queue behind a background poll.
+        key = (path, conditional, current_priority())
+        deadline = _deadline.get()
+        if (shared := self._inflight.get(key)) is None:
+            context = copy_context()
+            task = asyncio.create_task(
+                self._async_perform_request(method, path, conditional=conditional),
+                context=context,
+            )
+            self._inflight[key] = task, context
+            task.add_done_callback(partial(self._async_shared_request_done, key))
+        else:
+            task, context = shared
+            # The shared request runs under the loosest deadline of its callers.
+            shared_deadline = context.get(_deadline)
+            if shared_deadline is not None and (deadline is None or deadline > shared_deadline):
+                context.run(_deadline.set, deadline)
+        # A caller giving up must not cancel the request for the others.
+        if deadline is None:
+            return await asyncio.shield(task)
+        try:
+            async with async_timeout.timeout(deadline - time.monotonic()):
+                return await asyncio.shield(task)
+        except asyncio.TimeoutError as err:
+            if context.get(_deadline) == deadline:
+                # The request gives up at this very deadline; let it report why.
+                return await asyncio.shield(task)
+            raise SeatDeadlineExceededError("Seat Connect refresh deadline exceeded") from err
+
+    def _async_shared_request_done(
+        self, key: tuple[str, bool, SeatRequestPriority], task: asyncio.Task[Any]
+    ) -> None:
+        self._inflight.pop(key, None)
+        # Retrieve the exception even when every caller gave up waiting for it.
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_perform_request(
+        self, method: str, path: str, *, conditional: bool = True, **kwargs: Any
+    ) -> Any:
+        request = self._prepare_request(method, path, conditional=conditional, kwargs=kwargs)
+        breaker = self._breakers[request.endpoint]
+        # Commands and their status checks jump the queue of background polls.
+        priority = (
+            SeatRequestPriority.COMMAND
+            if request.endpoint == ENDPOINT_COMMAND
+            else current_priority()
+        )
         attempt = 0
         while True:
             attempt += 1
+            if attempt > 1:
+                self._metrics.record_retry(path)
+            _ensure_budget()
+            if not breaker.allow_request():
+                raise SeatCircuitOpenError(
+                    f"Seat Connect {breaker.name} requests paused for {breaker.retry_in():.0f}s"
+                )
+            started = queued = time.perf_counter()
+            if self._rate_limiter is not None:
+                if self._rate_limiter.paused_for() > MAX_RETRY_AFTER:
+                    raise SeatApiRateLimitError("Seat Connect asked to pause requests")
+                await self._rate_limiter.async_acquire(priority)
+            attempt_timeout = self._request_timeout
             try:
-                async with self._semaphore, async_timeout.timeout(self._request_timeout):
-                    response = await self._oauth_session.async_request(method, url, **kwargs)
+                # The timeout is evaluated once a connection slot is free.
+                async with self._slots.slot(priority), async_timeout.timeout(
+                    attempt_timeout := self._attempt_timeout()
+                ):
+                    # Latency excludes the wait for a token and a free connection slot.
+                    self._metrics.record_queue_wait(priority.name.lower(), _elapsed_ms(queued))
+                    started = time.perf_counter()
+                    response = await self._async_send(method, request.url, **kwargs)
                     try:
-                        if response.content_type == "application/json":
-                            return await response.json()
-                        if response.content_length == 0:
-                            return None
-                        return await response.text()
+                        return await self._async_handle_response(request, response, started)
                     finally:
                         response.release()
             except ClientResponseError as err:
-                if err.status == HTTPStatus.UNAUTHORIZED:
-                    raise SeatApiAuthError("Authentication failed") from err
-                if err.status == HTTPStatus.TOO_MANY_REQUESTS:
-                    if attempt > self._max_retries:
-                        raise SeatApiRateLimitError("Seat Connect rate limit exceeded") from err
-                    await asyncio.sleep(self._backoff_factor * attempt)
-                    continue
-                if (
-                    HTTPStatus.INTERNAL_SERVER_ERROR
-                    <= err.status
-                    < HTTPStatus.INTERNAL_SERVER_ERROR + 100
-                    and attempt <= self._max_retries
-                ):
-                    await asyncio.sleep(self._backoff_factor * attempt)
-                    continue
-                raise SeatApiError(f"Seat Connect request failed: {err.status}") from err
+                await self._async_handle_error_status(request, err, attempt, started)
             except ClientError as err:
+                self._metrics.record_error(path, _elapsed_ms(started))
+                self._record(method, path, started, error=ERROR_NETWORK)
+                breaker.record_failure()
                 if attempt > self._max_retries:
                     raise SeatApiError("Seat Connect network error") from err
-                await asyncio.sleep(self._backoff_factor * attempt)
+                await self._async_backoff(attempt)
             except asyncio.TimeoutError as err:
+                self._metrics.record_error(path, _elapsed_ms(started))
+                self._record(method, path, started, error=ERROR_TIMEOUT)
+                if attempt_timeout < self._request_timeout:
+                    # Cut short by the deadline; the backend did not get its full time.
+                    raise SeatDeadlineExceededError(
+                        "Seat Connect refresh deadline exceeded"
+                    ) from err
+                breaker.record_failure()
                 if attempt > self._max_retries:
                     raise SeatApiError("Seat Connect request timed out") from err
-                await asyncio.sleep(self._backoff_factor * attempt)
+                await self._async_backoff(attempt)
 
+    def _prepare_request(
+        self, method: str, path: str, *, conditional: bool, kwargs: dict[str, Any]
+    ) -> _SeatRequest:
+        """Describe a request, adding the validators of a cached GET to its headers."""
 
-def _coerce_float(value: Any) -> float | None:
-    """Return a float if possible."""
+        url = f"{self._base_url}{path}"
+        conditional = conditional and method == "GET"
+        cached = self._response_cache.get(url) if conditional else None
+        if cached is not None:
+            headers = dict(kwargs.pop("headers", None) or {})
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+            kwargs["headers"] = headers
+        return _SeatRequest(method, path, url, _endpoint_class(method, path), conditional, cached)
+
+    async def _async_handle_response(
+        self, request: _SeatRequest, response: ClientResponse, started: float
+    ) -> Any:
+        """Return the payload of a response; a 304 reuses the cached payload."""
+
+        cached = request.cached
+        if not_modified := cached is not None and response.status == HTTPStatus.NOT_MODIFIED:
+            payload, size = cached.payload, 0
+        else:
+            response.raise_for_status()
+            payload, size = await _async_read_payload(response)
+        self._breakers[request.endpoint].record_success()
+        if self._rate_limiter is not None:
+            self._rate_limiter.async_update(response.headers)
+        self._metrics.record_response(request.path, response.status, _elapsed_ms(started), size)
+        self._record(
+            request.method,
+            request.path,
+            started,
+            status=response.status,
+            headers=response.headers,
+            body=None if not_modified else payload,
+        )
+        if request.conditional and not not_modified:
+            self._store_validators(request.url, response, payload)
+        return payload
 
-    if value is None:
-        return None
+    async def _async_handle_error_status(
+        self, request: _SeatRequest, err: ClientResponseError, attempt: int, started: float
+    ) -> None:
+        """Raise for an error response, or wait until the request may be retried."""
+
+        path = request.path
+        self._metrics.record_response(path, err.status, _elapsed_ms(started), None)
+        self._record(request.method, path, started, status=err.status, headers=err.headers)
+        breaker = self._breakers[request.endpoint]
+        if err.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            breaker.record_failure()
+        else:
+            # The backend answered; client errors say nothing about its health.
+            breaker.record_success()
+        if err.status == HTTPStatus.UNAUTHORIZED:
+            raise SeatApiAuthError("Authentication failed") from err
+        if request.endpoint == ENDPOINT_STATUS and err.status in (
+            HTTPStatus.FORBIDDEN,
+            HTTPStatus.NOT_FOUND,
+        ):
+            raise SeatVehicleNotFoundError(
+                f"Seat Connect has no status for this vehicle: {err.status}"
+            ) from err
+        if err.status == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = parse_retry_after(err.headers)
+            delay = self._backoff(attempt) if retry_after is None else retry_after
+            if self._rate_limiter is not None:
+                # Pause every client sharing the limiter, not just this request.
+                self._rate_limiter.async_throttle(delay)
+            if attempt > self._max_retries or delay > MAX_RETRY_AFTER:
+                raise SeatApiRateLimitError("Seat Connect rate limit exceeded") from err
+            _ensure_budget(delay)
+            if self._rate_limiter is None:
+                await asyncio.sleep(delay)
+            return
+        if (
+            HTTPStatus.INTERNAL_SERVER_ERROR <= err.status < HTTPStatus.INTERNAL_SERVER_ERROR + 100
+            and attempt <= self._max_retries
+        ):
+            await self._async_backoff(attempt)
+            return
+        raise SeatApiError(f"Seat Connect request failed: {err.status}") from err
+
+    def _record(self, method: str, path: str, started: float, **outcome: Any) -> None:
+        """Pass the outcome of a request to the traffic recorder, if recording."""
+
+        if self._recorder is not None:
+            self._recorder.record(method, path, started, SeatOutcome(**outcome))
+
+    def _backoff(self, attempt: int) -> float:
+        return full_jitter_backoff(attempt, self._backoff_factor, MAX_BACKOFF)
+
+    async def _async_backoff(self, attempt: int) -> None:
+        delay = self._backoff(attempt)
+        _ensure_budget(delay)
+        await asyncio.sleep(delay)
+
+    def _attempt_timeout(self) -> float:
+        """Return the request timeout, shortened to what is left of the deadline."""
+
+        _ensure_budget()
+        if (remaining := _remaining_budget()) is None:
+            return self._request_timeout
+        return min(self._request_timeout, remaining)
+
+    async def _async_send(self, method: str, url: str, **kwargs: Any) -> ClientResponse:
+        if self._token_manager is not None:
+            # Usually renewed ahead of time; otherwise requests share a single renewal.
+            await self._token_manager.async_ensure_valid()
+        if self._session is None:
+            return await self._oauth_session.async_request(method, url, **kwargs)
+        # Same token handling as OAuth2Session.async_request, on our own pool.
+        if self._token_manager is None:
+            await self._oauth_session.async_ensure_token_valid()
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers[hdrs.AUTHORIZATION] = f"Bearer {self._oauth_session.token['access_token']}"
+        return await self._session.request(method, url, headers=headers, **kwargs)
+
+    def _prune_caches(self, roster: dict[str, dict[str, Any]], pages: set[str]) -> None:
+        """Forget cached responses of roster pages and vehicles no longer in the roster.
+
+        Cursor pages get a new URL on every roster fetch, and removed vehicles
+        are never asked for again, so their entries would otherwise stay forever.
+        """
+
+        wanted = {f"{self._base_url}{path}" for path in pages}
+        wanted.update(f"{self._base_url}/vehicles/{vin}/status" for vin in roster)
+        for url in self._response_cache.keys() - wanted:
+            del self._response_cache[url]
+        for vin in self._vehicle_cache.keys() - roster.keys():
+            del self._vehicle_cache[vin]
+
+    def _store_validators(self, url: str, response: ClientResponse, payload: Any) -> None:
+        etag = response.headers.get(hdrs.ETAG)
+        last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        if etag is None and last_modified is None:
+            self._response_cache.pop(url, None)
+            return
+        self._response_cache[url] = _CachedResponse(etag, last_modified, payload)
+
+
+_deadline: ContextVar[float | None] = ContextVar("seat_connect_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(seconds: float) -> Iterator[None]:
+    """Bound every request made within the block to ``seconds`` from now.
+
+    The deadline is carried in a context variable, so it also covers the
+    tasks the client starts for roster pages and vehicles. Attempts are
+    shortened to the time that is left, and retries that cannot finish in
+    time raise SeatDeadlineExceededError instead of sleeping. Nested
+    deadlines never extend an outer one.
+    """
+
+    deadline = time.monotonic() + seconds
+    if (outer := _deadline.get()) is not None:
+        deadline = min(deadline, outer)
+    token = _deadline.set(deadline)
     try:
-        return float(value)
-    except (TypeError, ValueError):
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _remaining_budget() -> float | None:
+    if (deadline := _deadline.get()) is None:
         return None
+    return deadline - time.monotonic()
+
+
+def _ensure_budget(needed: float = 0.0) -> None:
+    """Raise if no more than ``needed`` seconds are left before the deadline."""
+
+    if (remaining := _remaining_budget()) is not None and remaining <= needed:
+        raise SeatDeadlineExceededError("Seat Connect refresh deadline exceeded")
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+def _endpoint_class(method: str, path: str) -> str:
+    """Return the circuit breaker a request is accounted to."""
+
+    if method != "GET" or "/actions/" in path:
+        return ENDPOINT_COMMAND
+    if path.endswith("/status"):
+        return ENDPOINT_STATUS
+    return ENDPOINT_ROSTER
+
+
+def _parse_roster_page(payload: Any) -> tuple[list[dict[str, Any]], str | None]:
+    """Return the vehicles of a roster page and the path of the next page, if any.
+
+    Both cursor (``nextCursor``) and offset (``offset``/``limit``/``total``)
+    pagination are understood; an unpaginated response is a single page.
+    """
+
+    if isinstance(payload, list):
+        return _validate_roster_entries(payload), None
+    if not isinstance(payload, dict):
+        raise SeatApiError("Unexpected payload from Seat Connect")
+    vehicles_raw = _validate_roster_entries(payload.get("vehicles", payload))
+    if cursor := payload.get("nextCursor"):
+        return vehicles_raw, f"{ROSTER_PATH}?{urlencode({'cursor': cursor})}"
+    total = payload.get("total")
+    if isinstance(total, int) and vehicles_raw:
+        try:
+            offset = int(payload.get("offset", 0)) + len(vehicles_raw)
+        except (TypeError, ValueError) as err:
+            raise SeatApiError("Unexpected roster offset from Seat Connect") from err
+        if offset < total:
+            query = {"offset": offset}
+            if (limit := payload.get("limit")) is not None:
+                query["limit"] = limit
+            return vehicles_raw, f"{ROSTER_PATH}?{urlencode(query)}"
+    return vehicles_raw, None
+
+
+def _validate_roster_entries(vehicles_raw: Any) -> list[dict[str, Any]]:
+    """Return the vehicles of a roster page, each of which must have a VIN."""
+
+    if not isinstance(vehicles_raw, list) or not all(
+        isinstance(vehicle, dict) and isinstance(vehicle.get("vin"), str)
+        for vehicle in vehicles_raw
+    ):
+        raise SeatApiError("Unexpected vehicle list from Seat Connect")
+    return vehicles_raw
+
+
+async def _async_read_payload(response: ClientResponse) -> tuple[Any, int]:
+    """Decode a response body according to its content type, and return its size."""
+
+    # Content-Length is absent for chunked and compressed responses; count what was read.
+    if not (body := await response.read()):
+        return None, 0
+    if response.content_type == "application/json":
+        return json.loads(body), len(body)
+    return body.decode(response.get_encoding()), len(body)
+
+
+def normalize_capabilities(values: Iterable[Any]) -> frozenset[str]:
+    """Return ``values`` upper-cased as a frozenset shared by every equal capability set."""
+
+    capabilities = frozenset(value.upper() for value in values if isinstance(value, str))
+    return _CAPABILITY_SETS.setdefault(capabilities, capabilities)
+
+
+# Capability sets are few and small, so every distinct one is kept.
+_CAPABILITY_SETS: dict[frozenset[str], frozenset[str]] = {frozenset(): frozenset()}
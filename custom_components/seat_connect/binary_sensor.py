@@ -17,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .api import SeatVehicleData
 from .const import DATA_ENTRIES, DOMAIN
 from .entity import SeatConnectEntity
+from .parser import status_entity_fields
 
 if TYPE_CHECKING:
     from .coordinator import SeatDataUpdateCoordinator
@@ -27,6 +28,7 @@ class SeatBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Binary sensor description for Seat Connect."""
 
     value_fn: Callable[[SeatVehicleData], bool | None]
+    depends_on: frozenset[str]
 
 
 BINARY_SENSORS: tuple[SeatBinarySensorEntityDescription, ...] = (
@@ -35,7 +37,7 @@ BINARY_SENSORS: tuple[SeatBinarySensorEntityDescription, ...] = (
         translation_key="plug_connected",
         name="Charging plug",
         device_class=BinarySensorDeviceClass.PLUG,
-        value_fn=lambda vehicle: vehicle.plug_connected,
+        **status_entity_fields("plug_connected"),
     ),
     SeatBinarySensorEntityDescription(
         key="doors_windows_open",
@@ -43,6 +45,7 @@ BINARY_SENSORS: tuple[SeatBinarySensorEntityDescription, ...] = (
         name="Doors or windows open",
         device_class=BinarySensorDeviceClass.OPENING,
         value_fn=lambda vehicle: _derive_open_state(vehicle),
+        depends_on=frozenset({"doors_closed", "windows_closed"}),
     ),
 )
 
@@ -84,6 +87,7 @@ class SeatConnectBinarySensorEntity(SeatConnectEntity[SeatVehicleData], BinarySe
     ) -> None:
         super().__init__(coordinator, vin, description.key)
         self.entity_description = description
+        self._depends_on = description.depends_on
 
     @property
     def is_on(self) -> bool | None:
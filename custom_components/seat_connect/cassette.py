@@ -0,0 +1,251 @@
+"""Record and replay Seat Connect API traffic."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import urlsplit
+
+from aiohttp import ClientError, ClientResponseError, RequestInfo, hdrs
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from .const import CASSETTE_MAX_INTERACTIONS
+
+CASSETTE_VERSION = 1
+
+# Response headers that influence the client; everything else is dropped.
+RECORDED_HEADERS = (
+    hdrs.ETAG,
+    hdrs.LAST_MODIFIED,
+    hdrs.RETRY_AFTER,
+    "RateLimit-Remaining",
+    "RateLimit-Reset",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+)
+REDACTED_KEYS = frozenset(
+    {"access_token", "refresh_token", "id_token", "token", "licensePlate", "email"}
+)
+REDACTED = "**REDACTED**"
+
+ERROR_TIMEOUT = "timeout"
+ERROR_NETWORK = "network"
+
+# Index of the VIN in a split path: ["", "vehicles", vin, ...].
+_VIN_SEGMENT = 2
+
+
+@dataclass(frozen=True, slots=True)
+class SeatOutcome:
+    """What a request got back: a response, or the kind of error that ended it."""
+
+    status: int | None = None
+    headers: Mapping[str, str] | None = None
+    body: Any = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class SeatInteraction:
+    """A single recorded request and its outcome."""
+
+    method: str
+    path: str
+    offset_ms: float
+    duration_ms: float
+    status: int | None = None
+    headers: dict[str, str] | None = None
+    body: Any = None
+    error: str | None = None
+
+
+class SeatCassetteRecorder:
+    """Collect redacted request/response pairs of a client.
+
+    VINs are replaced by stable aliases (``VIN0001``...) in paths and bodies,
+    tokens and other personal fields are masked and request headers are not
+    recorded at all. Only the most recent ``max_interactions`` are kept.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_interactions: int = CASSETTE_MAX_INTERACTIONS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._clock = clock
+        self._started = clock()
+        self._interactions: deque[SeatInteraction] = deque(maxlen=max_interactions)
+        self._aliases: dict[str, str] = {}
+
+    @property
+    def interactions(self) -> list[SeatInteraction]:
+        """Return the recorded interactions, oldest first."""
+
+        return list(self._interactions)
+
+    def record(self, method: str, path: str, started: float, outcome: SeatOutcome) -> None:
+        """Record the outcome of a request that was sent at ``started``."""
+
+        now = self._clock()
+        headers, body = outcome.headers, outcome.body
+        if body is not None:
+            self._learn_vins(body)
+        self._interactions.append(
+            SeatInteraction(
+                method=method,
+                path=self._redact_path(path),
+                offset_ms=round((started - self._started) * 1000, 1),
+                duration_ms=round((now - started) * 1000, 1),
+                status=outcome.status,
+                headers=None
+                if headers is None
+                else {name: headers[name] for name in RECORDED_HEADERS if name in headers},
+                body=None if body is None else self._redact(body),
+                error=outcome.error,
+            )
+        )
+
+    def dump(self) -> bytes:
+        """Return the cassette as gzip-compressed JSON."""
+
+        document = {
+            "version": CASSETTE_VERSION,
+            "interactions": [
+                {key: value for key, value in asdict(item).items() if value is not None}
+                for item in self._interactions
+            ],
+        }
+        return gzip.compress(json.dumps(document, separators=(",", ":")).encode())
+
+    def write(self, path: str) -> None:
+        """Write the cassette to ``path``. This does blocking I/O."""
+
+        with open(path, "wb") as file:
+            file.write(self.dump())
+
+    def _alias(self, vin: str) -> str:
+        if (alias := self._aliases.get(vin)) is None:
+            alias = self._aliases[vin] = f"VIN{len(self._aliases) + 1:04d}"
+        return alias
+
+    def _learn_vins(self, value: Any) -> None:
+        if isinstance(value, dict):
+            if isinstance(vin := value.get("vin"), str):
+                self._alias(vin)
+            for item in value.values():
+                self._learn_vins(item)
+        elif isinstance(value, list):
+            for item in value:
+                self._learn_vins(item)
+
+    def _redact_path(self, path: str) -> str:
+        base, _, query = path.partition("?")
+        parts = base.split("/")
+        if len(parts) > _VIN_SEGMENT and parts[1] == "vehicles":
+            parts[_VIN_SEGMENT] = self._alias(parts[_VIN_SEGMENT])
+        return "/".join(parts) + (f"?{query}" if query else "")
+
+    def _redact(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: REDACTED if key in REDACTED_KEYS else self._redact(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [self._redact(item) for item in value]
+        if isinstance(value, str) and value in self._aliases:
+            return self._aliases[value]
+        return value
+
+
+class SeatCassetteReplay:
+    """Serve recorded interactions to a ``SeatApiClient`` in place of its OAuth session.
+
+    Requests are matched on method and path; repeated requests get the
+    recorded responses in order, the last one being reused once exhausted.
+    Every response is delayed by its recorded duration divided by ``speed``;
+    a speed of 0 answers immediately.
+    """
+
+    def __init__(self, interactions: Iterable[SeatInteraction], *, speed: float = 1.0) -> None:
+        self._speed = speed
+        self._queues: dict[tuple[str, str], deque[SeatInteraction]] = defaultdict(deque)
+        for interaction in interactions:
+            self._queues[(interaction.method, interaction.path)].append(interaction)
+        self.unmatched: list[tuple[str, str]] = []
+
+    @classmethod
+    def from_bytes(cls, data: bytes, *, speed: float = 1.0) -> SeatCassetteReplay:
+        """Load a cassette produced by ``SeatCassetteRecorder.dump``."""
+
+        document = json.loads(gzip.decompress(data))
+        if document.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {document.get('version')}")
+        return cls((SeatInteraction(**item) for item in document["interactions"]), speed=speed)
+
+    @classmethod
+    def from_file(cls, path: str, *, speed: float = 1.0) -> SeatCassetteReplay:
+        """Load a cassette file. This does blocking I/O."""
+
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read(), speed=speed)
+
+    async def async_ensure_token_valid(self) -> None:
+        """Replayed traffic needs no token."""
+
+    async def async_request(self, method: str, url: str, **kwargs: Any) -> _ReplayResponse:
+        """Return the next recorded response for ``method`` and the path of ``url``."""
+
+        split = urlsplit(url)
+        path = split.path + (f"?{split.query}" if split.query else "")
+        queue = self._queues.get((method, path))
+        if not queue:
+            self.unmatched.append((method, path))
+            return _ReplayResponse(method, url, SeatInteraction(method, path, 0, 0, status=404))
+        interaction = queue.popleft() if len(queue) > 1 else queue[0]
+        if self._speed > 0 and interaction.duration_ms:
+            await asyncio.sleep(interaction.duration_ms / 1000 / self._speed)
+        if interaction.error == ERROR_TIMEOUT:
+            raise asyncio.TimeoutError
+        if interaction.error is not None:
+            raise ClientError(f"Recorded {interaction.error} error")
+        return _ReplayResponse(method, url, interaction)
+
+
+class _ReplayResponse:
+    """The parts of ``aiohttp.ClientResponse`` the client relies on."""
+
+    def __init__(self, method: str, url: str, interaction: SeatInteraction) -> None:
+        self._method = method
+        self._url = URL(url)
+        self._body = interaction.body
+        self.status = interaction.status or 200
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction.headers or {}))
+        self.content_type = "application/json" if self._body is not None else "text/plain"
+
+    def raise_for_status(self) -> None:
+        if self.status >= HTTPStatus.BAD_REQUEST:
+            raise ClientResponseError(
+                RequestInfo(self._url, self._method, CIMultiDictProxy(CIMultiDict())),
+                (),
+                status=self.status,
+                headers=self.headers,
+            )
+
+    async def read(self) -> bytes:
+        return b"" if self._body is None else json.dumps(self._body).encode()
+
+    def get_encoding(self) -> str:
+        return "utf-8"
+
+    def release(self) -> None:
+        return None
@@ -0,0 +1,124 @@
+"""Circuit breaking and retry backoff for the Seat Connect API."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_RESET_TIMEOUT,
+    CIRCUIT_RESET_TIMEOUT,
+    LOGGER_NAME,
+)
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+
+class SeatCircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class SeatCircuitBreaker:
+    """Fail fast once an endpoint class of the backend keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are rejected without being sent. Once ``reset_timeout`` has
+    passed a single probe is let through: success closes the circuit, failure
+    opens it again for twice as long, up to ``max_reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+        max_reset_timeout: float = CIRCUIT_MAX_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._base_reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._clock = clock
+        self._state = SeatCircuitState.CLOSED
+        self._failures = 0
+        self._reset_timeout = reset_timeout
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> SeatCircuitState:
+        """Return the current state, moving from open to half-open when due."""
+
+        if (
+            self._state is SeatCircuitState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = SeatCircuitState.HALF_OPEN
+            self._probe_started = None
+        return self._state
+
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe may be sent."""
+
+        if self.state is not SeatCircuitState.OPEN:
+            return 0.0
+        return max(self._opened_at + self._reset_timeout - self._clock(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+
+        state = self.state
+        if state is SeatCircuitState.CLOSED:
+            return True
+        if state is SeatCircuitState.OPEN:
+            return False
+        now = self._clock()
+        # One probe at a time; a probe that never reported back is replaced.
+        if self._probe_started is not None and now - self._probe_started < self._reset_timeout:
+            return False
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+
+        if self._state is not SeatCircuitState.CLOSED:
+            _LOGGER.info("Seat Connect %s requests recovered", self.name)
+        self._state = SeatCircuitState.CLOSED
+        self._failures = 0
+        self._reset_timeout = self._base_reset_timeout
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit if needed."""
+
+        self._failures += 1
+        if self.state is SeatCircuitState.HALF_OPEN:
+            self._reset_timeout = min(self._reset_timeout * 2, self._max_reset_timeout)
+        elif self._failures < self._failure_threshold:
+            return
+        if self._state is SeatCircuitState.CLOSED:
+            _LOGGER.warning(
+                "Seat Connect %s requests keep failing; pausing them for %.0fs",
+                self.name,
+                self._reset_timeout,
+            )
+        self._state = SeatCircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probe_started = None
+
+
+def full_jitter_backoff(attempt: int, base: float, cap: float) -> float:
+    """Return a random delay in ``[0, min(cap, base * 2 ** (attempt - 1))]``."""
+
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import SeatVehicleData
-from .const import DATA_ENTRIES, DOMAIN
+from .const import CAPABILITY_CLIMATE, DATA_ENTRIES, DOMAIN
 from .entity import SeatConnectEntity
 
 if TYPE_CHECKING:
@@ -36,9 +36,7 @@ async def async_setup_entry(
 
 
 def _supports_climate(vehicle: SeatVehicleData) -> bool:
-    if vehicle.capabilities and "CLIMATE" in {cap.upper() for cap in vehicle.capabilities}:
-        return True
-    return vehicle.climate_active is not None
+    return CAPABILITY_CLIMATE in vehicle.capabilities or vehicle.climate_active is not None
 
 
 class SeatConnectClimateEntity(SeatConnectEntity[SeatVehicleData], ClimateEntity):
@@ -46,6 +44,7 @@ class SeatConnectClimateEntity(SeatConnectEntity[SeatVehicleData], ClimateEntity
 
     _attr_hvac_modes = SUPPORTED_HVAC_MODES
     _attr_translation_key = "preconditioning"
+    _depends_on = frozenset({"climate_active", "capabilities"})
 
     def __init__(self, coordinator: "SeatDataUpdateCoordinator", vin: str) -> None:
         super().__init__(coordinator, vin, "climate")
@@ -56,12 +55,12 @@ class SeatConnectClimateEntity(SeatConnectEntity[SeatVehicleData], ClimateEntity
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         if hvac_mode == HVACMode.OFF:
-            await self.coordinator.client.async_stop_climate(self._vin)
+            command = await self.coordinator.client.async_stop_climate(self._vin)
         elif hvac_mode == HVACMode.HEAT:
-            await self.coordinator.client.async_start_climate(self._vin)
+            command = await self.coordinator.client.async_start_climate(self._vin)
         else:
             raise ValueError(f"Unsupported HVAC mode: {hvac_mode}")
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_track_command(command)
 
     @property
     def available(self) -> bool:
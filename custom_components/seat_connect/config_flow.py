@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, cast
 
@@ -16,22 +17,55 @@ else:  # pragma: no cover - runtime fallback for older HA versions
     ConfigFlowResult = FlowResult  # type: ignore[misc, assignment]
 
 from .const import (
+    CONF_ACTIVE_INTERVAL,
+    CONF_ASLEEP_INTERVAL,
+    CONF_PARKED_INTERVAL,
+    CONF_RECORD_TRAFFIC,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_ASLEEP_INTERVAL,
+    DEFAULT_PARKED_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    MAX_IDLE_INTERVAL,
     MAX_UPDATE_INTERVAL,
     MIN_UPDATE_INTERVAL,
 )
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class SeatConnectFlowHandler(config_entry_oauth2_flow.AbstractOAuth2FlowHandler, domain=DOMAIN):
     """Handle the OAuth2 config flow."""
 
     DOMAIN = DOMAIN
 
+    _reauth_entry: config_entries.ConfigEntry | None = None
+
+    @property
+    def logger(self) -> logging.Logger:
+        return _LOGGER
+
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> ConfigFlowResult:
+        """Sign in again after the refresh token was rejected."""
+
+        self._reauth_entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        if user_input is None:
+            return self.async_show_form(step_id="reauth_confirm")
+        return await self.async_step_user()
+
     async def async_oauth_create_entry(self, data: dict[str, Any]) -> ConfigFlowResult:
         unique_id = _extract_unique_id(data)
         await self.async_set_unique_id(unique_id)
+        if self._reauth_entry is not None:
+            if self._reauth_entry.unique_id != unique_id:
+                return self.async_abort(reason="wrong_account")
+            return self.async_update_reload_and_abort(self._reauth_entry, data=data)
         self._abort_if_unique_id_configured()
         title = data.get("title") or "SEAT Connect"
         return self.async_create_entry(title=title, data=data)
@@ -44,22 +78,50 @@ class SeatConnectOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input: Mapping[str, Any] | None = None) -> FlowResult:
         if user_input is not None:
-            return cast(
-                FlowResult,
-                self.async_create_entry(
-                    data={CONF_UPDATE_INTERVAL: user_input[CONF_UPDATE_INTERVAL]}
-                ),
-            )
+            return cast(FlowResult, self.async_create_entry(data=dict(user_input)))
 
-        default = self._entry.options.get(
-            CONF_UPDATE_INTERVAL, int(DEFAULT_UPDATE_INTERVAL.total_seconds())
-        )
+        options = self._entry.options
         schema = vol.Schema(
             {
-                vol.Required(CONF_UPDATE_INTERVAL, default=default): vol.All(
+                vol.Required(
+                    CONF_UPDATE_INTERVAL,
+                    default=options.get(
+                        CONF_UPDATE_INTERVAL, int(DEFAULT_UPDATE_INTERVAL.total_seconds())
+                    ),
+                ): vol.All(
                     vol.Coerce(int),
                     vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL),
-                )
+                ),
+                vol.Required(
+                    CONF_ACTIVE_INTERVAL,
+                    default=options.get(
+                        CONF_ACTIVE_INTERVAL, int(DEFAULT_ACTIVE_INTERVAL.total_seconds())
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL),
+                ),
+                vol.Required(
+                    CONF_PARKED_INTERVAL,
+                    default=options.get(
+                        CONF_PARKED_INTERVAL, int(DEFAULT_PARKED_INTERVAL.total_seconds())
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_IDLE_INTERVAL),
+                ),
+                vol.Required(
+                    CONF_ASLEEP_INTERVAL,
+                    default=options.get(
+                        CONF_ASLEEP_INTERVAL, int(DEFAULT_ASLEEP_INTERVAL.total_seconds())
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_IDLE_INTERVAL),
+                ),
+                vol.Required(
+                    CONF_RECORD_TRAFFIC, default=options.get(CONF_RECORD_TRAFFIC, False)
+                ): bool,
             }
         )
         return cast(FlowResult, self.async_show_form(step_id="init", data_schema=schema))
@@ -18,8 +18,54 @@ DEFAULT_UPDATE_INTERVAL = timedelta(seconds=90)
 CONF_UPDATE_INTERVAL = "update_interval"
 MIN_UPDATE_INTERVAL = 30
 MAX_UPDATE_INTERVAL = 600
+
+DEFAULT_ACTIVE_INTERVAL = timedelta(seconds=45)
+DEFAULT_PARKED_INTERVAL = timedelta(minutes=15)
+DEFAULT_ASLEEP_INTERVAL = timedelta(hours=1)
+CONF_ACTIVE_INTERVAL = "active_interval"
+CONF_PARKED_INTERVAL = "parked_interval"
+CONF_ASLEEP_INTERVAL = "asleep_interval"
+CONF_RECORD_TRAFFIC = "record_traffic"
+MAX_IDLE_INTERVAL = 6 * 3600
+PARKED_AFTER = timedelta(minutes=30)
+ASLEEP_AFTER = timedelta(hours=12)
+ROSTER_REFRESH_INTERVAL = timedelta(hours=6)
+
+CAPABILITY_CLIMATE = "CLIMATE"
+
 DATA_ENTRIES = "entries"
 DATA_SERVICES_REGISTERED = "services_registered"
+DATA_RATE_LIMITER = "rate_limiter"
+DATA_VINS = "vins"
+
+DEFAULT_CONCURRENCY = 4
+# Renew the OAuth token this many seconds before it expires.
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_RETRY_DELAY = 60
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+
+MAX_BACKOFF = 30.0
+# Share of the normal poll interval a refresh may take, retries included.
+REFRESH_DEADLINE_RATIO = 0.8
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30.0
+CIRCUIT_MAX_RESET_TIMEOUT = 600.0
+
+CASSETTE_MAX_INTERACTIONS = 5000
+CASSETTE_FILENAME = "seat_connect_{entry_id}.cassette.json.gz"
+
+DEFAULT_RATE_LIMIT = 5.0
+DEFAULT_RATE_LIMIT_BURST = 20
+MAX_RETRY_AFTER = 300
+
+COMMAND_POLL_DELAYS: tuple[float, ...] = (1.0, 1.0, 2.0, 3.0, 5.0)
+COMMAND_SETTLE_DELAY = 5.0
+COMMAND_TIMEOUT = timedelta(seconds=90)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = "seat_connect.{entry_id}"
+SNAPSHOT_SAVE_DELAY = 60
 
 API_BASE_URL = "https://my-seat.apps.emea.vwapps.io"
 AUTH_AUTHORIZE_URL = "https://identity.vwgroup.io/signin-service/v1/authorize"
@@ -31,5 +77,10 @@ SERVICE_START_CLIMATE = "start_climate"
 SERVICE_STOP_CLIMATE = "stop_climate"
 
 SERVICE_VIN = "vin"
+SERVICE_CONFIG_ENTRY_ID = "config_entry_id"
+
+SIGNAL_VEHICLE_UPDATED = "seat_connect_vehicle_updated_{entry_id}_{vin}"
+SIGNAL_VEHICLES_CHANGED = "seat_connect_vehicles_changed_{entry_id}"
+SIGNAL_FLEET_UPDATED = "seat_connect_fleet_updated_{entry_id}"
 
 LOGGER_NAME = "custom_components.seat_connect"
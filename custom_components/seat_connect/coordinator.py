@@ -2,20 +2,107 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, fields, replace
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import SeatApiClientProtocol, SeatApiError, SeatVehicleData
+from .aggregates import AGGREGATE_FIELDS, SeatFleetAggregates
+from .api import (
+    SeatApiClientProtocol,
+    SeatApiError,
+    SeatCommand,
+    SeatCommandStatus,
+    SeatPartialRefreshError,
+    SeatVehicleData,
+    normalize_capabilities,
+    request_deadline,
+)
+from .const import (
+    ASLEEP_AFTER,
+    COMMAND_POLL_DELAYS,
+    COMMAND_SETTLE_DELAY,
+    COMMAND_TIMEOUT,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_ASLEEP_INTERVAL,
+    DEFAULT_PARKED_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    PARKED_AFTER,
+    REFRESH_DEADLINE_RATIO,
+    ROSTER_REFRESH_INTERVAL,
+    SIGNAL_FLEET_UPDATED,
+    SIGNAL_VEHICLE_UPDATED,
+    SIGNAL_VEHICLES_CHANGED,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .metrics import SeatRefreshMetrics
+from .priority import SeatRequestPriority, request_priority
+from .scheduler import SeatPollScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+CHARGING_STATES = frozenset({"charging"})
+VEHICLE_FIELDS = frozenset(field.name for field in fields(SeatVehicleData))
+_NO_CHANGES: frozenset[str] = frozenset()
+
+# Vehicle fields a command is expected to change once the car has executed it.
+COMMAND_EFFECTS: dict[str, dict[str, Any]] = {
+    "lock": {"is_locked": True},
+    "unlock": {"is_locked": False},
+    "start_climate": {"climate_active": True},
+    "stop_climate": {"climate_active": False},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SeatPollingPolicy:
+    """Pick the poll interval of a vehicle from its last known state."""
+
+    normal: timedelta = DEFAULT_UPDATE_INTERVAL
+    active: timedelta = DEFAULT_ACTIVE_INTERVAL
+    parked: timedelta = DEFAULT_PARKED_INTERVAL
+    asleep: timedelta = DEFAULT_ASLEEP_INTERVAL
+    parked_after: timedelta = PARKED_AFTER
+    asleep_after: timedelta = ASLEEP_AFTER
+
+    def interval_for(self, vehicle: SeatVehicleData, unchanged_for: timedelta) -> timedelta:
+        """Return how often a vehicle that has not changed for a while is polled."""
+
+        if vehicle.climate_active or (
+            vehicle.charging_state is not None
+            and vehicle.charging_state.lower() in CHARGING_STATES
+        ):
+            return self.active
+        if unchanged_for >= self.asleep_after:
+            return self.asleep
+        # A plugged-in car may start charging at any time, keep an eye on it.
+        if vehicle.plug_connected or unchanged_for < self.parked_after:
+            return self.normal
+        return self.parked
+
 
 class SeatDataUpdateCoordinator(DataUpdateCoordinator[dict[str, SeatVehicleData]]):
-    """Coordinator responsible for polling the Seat API."""
+    """Coordinator responsible for polling the Seat API.
+
+    A full refresh of the account only happens on setup, on request and once
+    per roster interval. In between, each vehicle is polled in its own slot
+    and merged into ``data`` individually. How often a slot fires is decided
+    by the polling policy from the vehicle's last state. Refreshes and polls
+    run under a request deadline so they cannot overlap the next poll.
+    """
 
     def __init__(
         self,
@@ -24,18 +111,434 @@ class SeatDataUpdateCoordinator(DataUpdateCoordinator[dict[str, SeatVehicleData]
         client: SeatApiClientProtocol,
         entry: ConfigEntry,
         update_interval: timedelta,
+        policy: SeatPollingPolicy | None = None,
     ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name=f"Seat Connect ({entry.entry_id})",
-            update_interval=update_interval,
+            update_interval=ROSTER_REFRESH_INTERVAL,
         )
         self.client = client
         self.config_entry = entry
+        self._policy = policy or SeatPollingPolicy(normal=update_interval)
+        self._last_changed: dict[str, float] = {}
+        self._changed_fields: dict[str, frozenset[str]] | None = None
+        # VINs whose last refresh failed; their entities show the last good data as unavailable.
+        self._stale: set[str] = set()
+        self._pending: dict[str, dict[str, tuple[SeatCommand, Any]]] = {}
+        # What the backend last reported for vehicles shown with pending overrides.
+        self._reported: dict[str, SeatVehicleData] = {}
+        self._command_tasks: set[asyncio.Task[None]] = set()
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry.entry_id)
+        )
+        self._save_pending = False
+        self.refresh_metrics = SeatRefreshMetrics()
+        self.fleet = SeatFleetAggregates()
+        self._scheduler = SeatPollScheduler(
+            hass,
+            name=self.name,
+            interval=self._policy.normal,
+            refresh=self._async_poll_vehicle,
+        )
+
+    @property
+    def polling_policy(self) -> SeatPollingPolicy:
+        """Return the policy deciding the per-vehicle poll intervals."""
+
+        return self._policy
+
+    @polling_policy.setter
+    def polling_policy(self, value: SeatPollingPolicy) -> None:
+        self._policy = value
+        self._scheduler.async_set_interval(value.normal)
+        self._async_apply_policy(self.data or {})
+
+    @callback
+    def async_vehicle_changed(self, vin: str, depends_on: frozenset[str] | None) -> bool:
+        """Return True if a field in ``depends_on`` changed in the current update.
+
+        Outside of an update, or when the changes are unknown, every vehicle
+        counts as changed.
+        """
+
+        if self._changed_fields is None or depends_on is None:
+            return True
+        return not self._changed_fields.get(vin, _NO_CHANGES).isdisjoint(depends_on)
+
+    @callback
+    def async_vehicle_available(self, vin: str) -> bool:
+        """Return False while the last refresh of a vehicle failed."""
+
+        return vin not in self._stale
+
+    @property
+    def stale_vins(self) -> frozenset[str]:
+        """Return the VINs whose last refresh failed."""
+
+        return frozenset(self._stale)
+
+    def signal_vehicle_updated(self, vin: str) -> str:
+        """Return the dispatcher signal sent when a single vehicle was refreshed."""
+
+        return SIGNAL_VEHICLE_UPDATED.format(entry_id=self.config_entry.entry_id, vin=vin)
+
+    def signal_vehicles_changed(self) -> str:
+        """Return the dispatcher signal sent when the set of VINs changed.
+
+        It is sent with the new vehicles, before they are stored in ``data``.
+        """
+
+        return SIGNAL_VEHICLES_CHANGED.format(entry_id=self.config_entry.entry_id)
+
+    def signal_fleet_updated(self) -> str:
+        """Return the dispatcher signal sent when a single vehicle changed the fleet totals."""
+
+        return SIGNAL_FLEET_UPDATED.format(entry_id=self.config_entry.entry_id)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: object | None = None
+    ) -> CALLBACK_TYPE:
+        remove_listener = super().async_add_listener(update_callback, context)
+        if self.data and not self._scheduler.running:
+            self._scheduler.async_sync(self.data)
+            self._async_apply_policy(self.data)
+
+        @callback
+        def _remove_listener() -> None:
+            remove_listener()
+            if not self._listeners:
+                self._scheduler.async_stop()
+
+        return _remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        super().async_update_listeners()
+        self._changed_fields = None
+
+    @callback
+    def async_track_command(self, command: SeatCommand) -> None:
+        """Show the expected outcome of a command until the vehicle confirms it."""
+
+        self.async_track_commands((command,))
+
+    @callback
+    def async_track_commands(self, commands: Sequence[SeatCommand]) -> None:
+        """Show the expected outcome of commands until the vehicles confirm them.
+
+        The fields each command changes are patched into the vehicle data right
+        away and kept on top of every poll while a background task follows the
+        commands. Once all of them succeeded, failed or timed out, the affected
+        vehicles are refreshed together to reconcile with their real state.
+        """
+
+        if not commands:
+            return
+        for command in commands:
+            if (effects := COMMAND_EFFECTS.get(command.command)) and self.data and (
+                vehicle := self.data.get(command.vin)
+            ):
+                pending = self._pending.setdefault(command.vin, {})
+                for name, value in effects.items():
+                    pending[name] = (command, value)
+                self._async_merge_vehicle(command.vin, self._reported.get(command.vin, vehicle))
+        task = self.hass.async_create_background_task(
+            self._async_follow_commands(commands),
+            name=f"{self.name} {commands[0].command} x{len(commands)}",
+        )
+        self._command_tasks.add(task)
+        task.add_done_callback(self._command_tasks.discard)
+
+    async def async_restore(self) -> bool:
+        """Load the vehicles persisted by a previous run into ``data``.
+
+        Vehicles keep the time they last changed, so a car that stays parked
+        across a restart still moves on to the quieter polling tiers.
+        Returns False if there is no usable snapshot.
+        """
+
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+        try:
+            vehicles = {
+                vin: _vehicle_from_dict(item) for vin, item in stored["vehicles"].items()
+            }
+        except (KeyError, TypeError, AttributeError):
+            _LOGGER.warning("Ignoring unreadable vehicle snapshot for %s", self.name)
+            return False
+        if not vehicles:
+            return False
+        last_changed = stored.get("last_changed") or {}
+        now, wall_now = self.hass.loop.time(), time.time()
+        for vin in vehicles:
+            changed_at = last_changed.get(vin)
+            if not isinstance(changed_at, (int, float)):
+                changed_at = wall_now
+            self._last_changed[vin] = now - max(wall_now - changed_at, 0)
+        self.data = vehicles
+        for vin, vehicle in vehicles.items():
+            self.fleet.update(vin, vehicle)
+        return True
+
+    async def async_shutdown(self) -> None:
+        self._scheduler.async_stop()
+        for task in self._command_tasks:
+            task.cancel()
+        if self._save_pending:
+            await self._store.async_save(self._async_snapshot())
+        await super().async_shutdown()
 
     async def _async_update_data(self) -> dict[str, SeatVehicleData]:
+        started = time.perf_counter()
+        previous = self.data or {}
+        budget = self._full_refresh_budget(len(previous))
         try:
-            return await self.client.async_get_vehicle_data()
+            with nullcontext() if budget is None else request_deadline(budget):
+                data = await self.client.async_get_vehicle_data()
+        except SeatPartialRefreshError as err:
+            # Keep the last good snapshot of the failed vehicles; their slots retry them.
+            data = err.data
+            for vin in err.errors.keys() & previous.keys():
+                # Not ``previous``, which carries the effects of pending commands.
+                data[vin] = self._reported.get(vin, previous[vin])
+            self._stale = err.errors.keys() & data.keys()
+            self.logger.warning("%s: %s", self.name, err)
         except SeatApiError as err:
+            self.refresh_metrics.record((time.perf_counter() - started) * 1000, success=False)
             raise UpdateFailed(str(err)) from err
+        else:
+            self._stale = set()
+        self.refresh_metrics.record((time.perf_counter() - started) * 1000, success=True)
+        self._reported = {vin: data[vin] for vin in self._pending.keys() & data.keys()}
+        for vin, vehicle in self._reported.items():
+            data[vin] = self._async_apply_pending(vin, vehicle)
+        self._changed_fields = {
+            vin: self._async_track_change(vin, previous.get(vin), vehicle)
+            for vin, vehicle in data.items()
+        }
+        for vin in previous.keys() - data.keys():
+            self.fleet.remove(vin)
+        for vin, changed in self._changed_fields.items():
+            if not changed.isdisjoint(AGGREGATE_FIELDS):
+                self.fleet.update(vin, data[vin])
+        if self._listeners:
+            self._scheduler.async_sync(data)
+            self._async_apply_policy(data)
+        if previous.keys() != data.keys():
+            async_dispatcher_send(self.hass, self.signal_vehicles_changed(), data)
+        self._async_schedule_save()
+        return data
+
+    async def async_refresh_vehicle(self, vin: str) -> None:
+        """Refresh a single vehicle right away, e.g. to confirm a command.
+
+        Only the status of that vehicle is fetched. Its next scheduled poll
+        is pushed back by a full interval since it has just been refreshed.
+        """
+
+        await self.async_refresh_vehicles((vin,))
+
+    async def async_refresh_vehicles(self, vins: Iterable[str]) -> None:
+        """Refresh several vehicles right away, concurrently."""
+
+        vins = set(vins)
+        for vin in vins:
+            self._scheduler.async_postpone(vin)
+        # Someone is waiting for these, unlike the scheduled polls.
+        with request_priority(SeatRequestPriority.REFRESH):
+            await asyncio.gather(*(self._async_poll_vehicle(vin) for vin in vins))
+
+    async def _async_poll_vehicle(self, vin: str) -> None:
+        """Poll a single vehicle and merge it into the coordinator data."""
+
+        started = time.perf_counter()
+        try:
+            with request_deadline(self._refresh_budget()):
+                vehicle = await self.client.async_get_vehicle(vin)
+        except SeatApiError as err:
+            self.refresh_metrics.record_poll((time.perf_counter() - started) * 1000, success=False)
+            self.logger.debug("Error refreshing vehicle %s: %s", vin, err)
+            if self.data and vin in self.data and vin not in self._stale:
+                self._stale.add(vin)
+                self._async_notify_vehicle(vin, _NO_CHANGES)
+            return
+        self.refresh_metrics.record_poll((time.perf_counter() - started) * 1000, success=True)
+        self._async_merge_vehicle(vin, vehicle)
+
+    @callback
+    def _async_merge_vehicle(self, vin: str, vehicle: SeatVehicleData) -> None:
+        """Store a new snapshot of a vehicle and notify its entities if it changed."""
+
+        if not self.data or vin not in self.data:
+            return
+        if vin in self._pending:
+            self._reported[vin] = vehicle
+            vehicle = self._async_apply_pending(vin, vehicle)
+        else:
+            self._reported.pop(vin, None)
+        changed = self._async_track_change(vin, self.data[vin], vehicle)
+        self.data[vin] = vehicle
+        self._async_apply_policy({vin: vehicle})
+        recovered = vin in self._stale
+        self._stale.discard(vin)
+        if changed:
+            self._async_schedule_save()
+        if changed or recovered:
+            self._async_notify_vehicle(vin, changed)
+        if not changed.isdisjoint(AGGREGATE_FIELDS) and self.fleet.update(vin, vehicle):
+            async_dispatcher_send(self.hass, self.signal_fleet_updated())
+
+    @callback
+    def _async_notify_vehicle(self, vin: str, changed: frozenset[str]) -> None:
+        """Let the entities of a vehicle write their state if ``changed`` concerns them.
+
+        Entities also write when their availability flipped.
+        """
+
+        self._changed_fields = {vin: changed}
+        try:
+            async_dispatcher_send(self.hass, self.signal_vehicle_updated(vin))
+        finally:
+            self._changed_fields = None
+
+    def _refresh_budget(self) -> float:
+        """Return how long a refresh may take before it overlaps the next poll."""
+
+        return self._policy.normal.total_seconds() * REFRESH_DEADLINE_RATIO
+
+    def _full_refresh_budget(self, vehicles: int) -> float | None:
+        """Return how long a refresh of the whole account may take, None for no limit.
+
+        The shared rate limiter paces the status request of every vehicle, so
+        the budget grows by the time it needs for the known fleet. A refresh
+        without previous data has nothing to fall back on for the vehicles it
+        would cut off, so it is not bounded.
+        """
+
+        if not vehicles:
+            return None
+        budget = self._refresh_budget()
+        if (limiter := self.client.rate_limiter) is not None:
+            budget += vehicles / limiter.rate
+        return budget
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._save_pending = True
+        self._store.async_delay_save(self._async_snapshot, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _async_snapshot(self) -> dict[str, Any]:
+        """Return the vehicles as reported by the backend, without pending command effects."""
+
+        self._save_pending = False
+        vehicles = self.data or {}
+        # Loop time does not survive a restart; persist wall-clock times instead.
+        offset = time.time() - self.hass.loop.time()
+        return {
+            "vehicles": {
+                vin: _vehicle_to_dict(self._reported.get(vin, vehicle))
+                for vin, vehicle in vehicles.items()
+            },
+            "last_changed": {
+                vin: changed_at + offset
+                for vin, changed_at in self._last_changed.items()
+                if vin in vehicles
+            },
+        }
+
+    @callback
+    def _async_apply_pending(self, vin: str, vehicle: SeatVehicleData) -> SeatVehicleData:
+        overrides = {
+            name: value
+            for name, (_command, value) in self._pending[vin].items()
+            if getattr(vehicle, name) != value
+        }
+        return replace(vehicle, **overrides) if overrides else vehicle
+
+    async def _async_follow_commands(self, commands: Sequence[SeatCommand]) -> None:
+        await asyncio.gather(*(self._async_settle_command(command) for command in commands))
+        await self.async_refresh_vehicles(command.vin for command in commands)
+
+    async def _async_settle_command(self, command: SeatCommand) -> None:
+        status = await self._async_wait_for_command(command)
+        if status is SeatCommandStatus.FAILED:
+            self.logger.warning("Command %s failed for vehicle %s", command.command, command.vin)
+        elif status is SeatCommandStatus.PENDING:
+            self.logger.warning(
+                "Command %s for vehicle %s did not complete in time",
+                command.command,
+                command.vin,
+            )
+        if (pending := self._pending.get(command.vin)) is not None:
+            for name in [name for name, (cmd, _value) in pending.items() if cmd is command]:
+                del pending[name]
+            if not pending:
+                del self._pending[command.vin]
+
+    async def _async_wait_for_command(self, command: SeatCommand) -> SeatCommandStatus | None:
+        """Poll the command state with a short backoff; None if it cannot be tracked."""
+
+        if command.id is None:
+            await asyncio.sleep(COMMAND_SETTLE_DELAY)
+            return None
+        deadline = self.hass.loop.time() + COMMAND_TIMEOUT.total_seconds()
+        delays = itertools.chain(COMMAND_POLL_DELAYS, itertools.repeat(COMMAND_POLL_DELAYS[-1]))
+        for delay in delays:
+            if self.hass.loop.time() + delay > deadline:
+                break
+            await asyncio.sleep(delay)
+            try:
+                status = await self.client.async_get_command_status(command)
+            except SeatApiError as err:
+                self.logger.debug("Error polling command %s: %s", command.command, err)
+                continue
+            if status is not SeatCommandStatus.PENDING:
+                return status
+        return SeatCommandStatus.PENDING
+
+    @callback
+    def _async_track_change(
+        self, vin: str, previous: SeatVehicleData | None, vehicle: SeatVehicleData
+    ) -> frozenset[str]:
+        """Return the fields that differ between two snapshots of a vehicle."""
+
+        if previous is vehicle:
+            return _NO_CHANGES
+        if previous is None:
+            changed = VEHICLE_FIELDS
+        else:
+            changed = frozenset(
+                name
+                for name in VEHICLE_FIELDS
+                if getattr(previous, name) != getattr(vehicle, name)
+            )
+        if changed:
+            self._last_changed[vin] = self.hass.loop.time()
+        return changed
+
+    @callback
+    def _async_apply_policy(self, vehicles: Mapping[str, SeatVehicleData]) -> None:
+        now = self.hass.loop.time()
+        for vin, vehicle in vehicles.items():
+            unchanged_for = timedelta(seconds=now - self._last_changed.get(vin, now))
+            self._scheduler.async_set_vehicle_interval(
+                vin, self._policy.interval_for(vehicle, unchanged_for)
+            )
+
+
+def _vehicle_to_dict(vehicle: SeatVehicleData) -> dict[str, Any]:
+    data = asdict(vehicle)
+    data["capabilities"] = sorted(vehicle.capabilities)
+    return data
+
+
+def _vehicle_from_dict(data: Mapping[str, Any]) -> SeatVehicleData:
+    # Fields added or dropped since the snapshot was written are tolerated.
+    values = {key: value for key, value in data.items() if key in VEHICLE_FIELDS}
+    values["capabilities"] = normalize_capabilities(values.get("capabilities") or ())
+    return SeatVehicleData(**values)
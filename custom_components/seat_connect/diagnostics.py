@@ -0,0 +1,42 @@
+"""Diagnostics support for Seat Connect."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_ENTRIES, DATA_RATE_LIMITER, DOMAIN
+
+TO_REDACT = {"token", "access_token", "refresh_token", "unique_id", "title"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return request and refresh metrics of a config entry."""
+
+    runtime = hass.data[DOMAIN][DATA_ENTRIES][entry.entry_id]
+    client = runtime.client
+    coordinator = runtime.coordinator
+    limiter = hass.data[DOMAIN].get(DATA_RATE_LIMITER)
+    stats = client.connection_stats
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "vehicles": len(coordinator.data or {}),
+        "stale_vehicles": len(coordinator.stale_vins),
+        "last_update_success": coordinator.last_update_success,
+        "refresh": coordinator.refresh_metrics.as_dict(),
+        "endpoints": client.metrics.as_dict(),
+        "queue_wait": client.metrics.queue_wait_as_dict(),
+        "connections": None if stats is None else stats.as_dict(),
+        "circuit_breakers": {
+            name: breaker.state.value for name, breaker in client.circuit_breakers.items()
+        },
+        "rate_limiter": None
+        if limiter is None
+        else {"rate": limiter.rate, "paused_for": limiter.paused_for()},
+    }
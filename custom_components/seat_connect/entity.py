@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from typing import Generic, TypeVar
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import SeatVehicleData
@@ -18,12 +20,41 @@ class SeatConnectEntity(CoordinatorEntity[SeatDataUpdateCoordinator], Generic[T]
     """Base entity for Seat Connect devices."""
 
     _attr_has_entity_name = True
+    # Vehicle fields the state is derived from; None means all of them.
+    _depends_on: frozenset[str] | None = None
 
     def __init__(self, coordinator: SeatDataUpdateCoordinator, vin: str, key: str) -> None:
         super().__init__(coordinator)
         self._vin = vin
         self._key = key
         self._attr_unique_id = f"{vin}_{key}"
+        self._written_available: bool | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.signal_vehicle_updated(self._vin),
+                self._handle_coordinator_update,
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when a field this entity depends on has changed."""
+
+        available = self.available
+        if available == self._written_available and not self.coordinator.async_vehicle_changed(
+            self._vin, self._depends_on
+        ):
+            return
+        self._written_available = available
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        return super().available and self.coordinator.async_vehicle_available(self._vin)
 
     @property
     def _vehicle(self) -> SeatVehicleData:
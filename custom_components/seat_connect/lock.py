@@ -31,6 +31,7 @@ class SeatConnectLockEntity(SeatConnectEntity[SeatVehicleData], LockEntity):
     """Vehicle door lock."""
 
     _attr_translation_key = "vehicle_lock"
+    _depends_on = frozenset({"is_locked"})
 
     def __init__(self, coordinator: "SeatDataUpdateCoordinator", vin: str) -> None:
         super().__init__(coordinator, vin, "lock")
@@ -40,9 +41,9 @@ class SeatConnectLockEntity(SeatConnectEntity[SeatVehicleData], LockEntity):
         return self._vehicle.is_locked
 
     async def async_lock(self, **kwargs: Any) -> None:
-        await self.coordinator.client.async_lock_vehicle(self._vin)
-        await self.coordinator.async_request_refresh()
+        command = await self.coordinator.client.async_lock_vehicle(self._vin)
+        self.coordinator.async_track_command(command)
 
     async def async_unlock(self, **kwargs: Any) -> None:
-        await self.coordinator.client.async_unlock_vehicle(self._vin)
-        await self.coordinator.async_request_refresh()
+        command = await self.coordinator.client.async_unlock_vehicle(self._vin)
+        self.coordinator.async_track_command(command)
@@ -0,0 +1,217 @@
+"""Request and refresh metrics for Seat Connect."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any
+
+# Upper bounds of the latency buckets, in milliseconds.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram.
+
+    Recording is a bisect and two increments; percentiles are estimated as
+    the upper bound of the bucket they fall in, capped at the largest value
+    seen.
+    """
+
+    __slots__ = ("_counts", "count", "total_ms", "max_ms", "last_ms")
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms: float | None = None
+
+    def record(self, milliseconds: float) -> None:
+        """Add a single observation."""
+
+        self._counts[bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total_ms += milliseconds
+        self.last_ms = milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    def percentile(self, quantile: float) -> float | None:
+        """Return the estimated latency below which ``quantile`` of samples fall."""
+
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index == len(LATENCY_BUCKETS_MS):
+                    return self.max_ms
+                return min(LATENCY_BUCKETS_MS[index], self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary suitable for diagnostics."""
+
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters of a single endpoint template."""
+
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    server_errors: int = 0
+    network_errors: int = 0
+    bytes_received: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters suitable for diagnostics."""
+
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "server_errors": self.server_errors,
+            "network_errors": self.network_errors,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class SeatRequestMetrics:
+    """Per-endpoint request metrics of a Seat Connect client."""
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        # Time spent waiting for the rate limiter and a connection slot, by request priority.
+        self.queue_wait: dict[str, LatencyHistogram] = {}
+
+    def record_response(
+        self, path: str, status: int, milliseconds: float, size: int | None
+    ) -> None:
+        """Record an HTTP response, successful or not."""
+
+        metrics = self._endpoint(path)
+        metrics.requests += 1
+        metrics.latency.record(milliseconds)
+        if size:
+            metrics.bytes_received += size
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            metrics.rate_limited += 1
+        elif status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            metrics.server_errors += 1
+
+    def record_error(self, path: str, milliseconds: float) -> None:
+        """Record a request that got no response (network error or timeout)."""
+
+        metrics = self._endpoint(path)
+        metrics.requests += 1
+        metrics.network_errors += 1
+        metrics.latency.record(milliseconds)
+
+    def record_retry(self, path: str) -> None:
+        """Record that a request is sent again."""
+
+        self._endpoint(path).retries += 1
+
+    def record_queue_wait(self, priority: str, milliseconds: float) -> None:
+        """Record how long a request waited before it could be sent."""
+
+        if (histogram := self.queue_wait.get(priority)) is None:
+            histogram = self.queue_wait[priority] = LatencyHistogram()
+        histogram.record(milliseconds)
+
+    def total(self, attribute: str) -> int:
+        """Return the sum of a counter across all endpoints."""
+
+        return sum(getattr(metrics, attribute) for metrics in self.endpoints.values())
+
+    def latency_percentile(self, quantile: float) -> float | None:
+        """Return the highest per-endpoint latency percentile."""
+
+        values = [
+            value
+            for metrics in self.endpoints.values()
+            if (value := metrics.latency.percentile(quantile)) is not None
+        ]
+        return max(values, default=None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all endpoints suitable for diagnostics."""
+
+        return {template: metrics.as_dict() for template, metrics in self.endpoints.items()}
+
+    def queue_wait_as_dict(self) -> dict[str, Any]:
+        """Return the queue waits suitable for diagnostics."""
+
+        return {priority: histogram.as_dict() for priority, histogram in self.queue_wait.items()}
+
+    def _endpoint(self, path: str) -> EndpointMetrics:
+        template = endpoint_template(path)
+        if (metrics := self.endpoints.get(template)) is None:
+            metrics = self.endpoints[template] = EndpointMetrics()
+        return metrics
+
+
+@dataclass(slots=True)
+class SeatRefreshMetrics:
+    """Duration and outcome of full coordinator refreshes and per-vehicle polls."""
+
+    failures: int = 0
+    duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    poll_failures: int = 0
+    polls: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def record(self, milliseconds: float, *, success: bool) -> None:
+        """Record a finished refresh."""
+
+        self.duration.record(milliseconds)
+        if not success:
+            self.failures += 1
+
+    def record_poll(self, milliseconds: float, *, success: bool) -> None:
+        """Record a finished poll of a single vehicle."""
+
+        self.polls.record(milliseconds)
+        if not success:
+            self.poll_failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the refresh summary suitable for diagnostics."""
+
+        return {
+            "failures": self.failures,
+            "duration": self.duration.as_dict(),
+            "polls": {"failures": self.poll_failures, "duration": self.polls.as_dict()},
+        }
+
+
+# Indexes in a split path: ["", "vehicles", vin, "actions", command, id].
+_VIN_SEGMENT = 2
+_COMMAND_ID_SEGMENT = 5
+
+
+def endpoint_template(path: str) -> str:
+    """Return ``path`` with VINs and command ids replaced by placeholders."""
+
+    parts = path.partition("?")[0].split("/")
+    if len(parts) > _VIN_SEGMENT and parts[1] == "vehicles":
+        parts[_VIN_SEGMENT] = "{vin}"
+    if len(parts) > _COMMAND_ID_SEGMENT and parts[3] == "actions":
+        parts[_COMMAND_ID_SEGMENT] = "{id}"
+    return "/".join(parts)
@@ -0,0 +1,134 @@
+"""Declarative normalization of Seat Connect status payloads."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from dataclasses import fields as dataclass_fields
+from operator import attrgetter
+from typing import Any
+
+_EMPTY: Mapping[str, Any] = {}
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class SeatStatusField:
+    """Where a vehicle attribute is found in the status payload and how it is read.
+
+    ``kind`` is ``float``, ``bool`` or None to take the value as sent. Values
+    that cannot be converted to a float become None. A bool is derived from
+    any value that is present, even null. ``default`` replaces a missing value.
+    """
+
+    name: str
+    path: tuple[str, ...]
+    kind: type | None = None
+    default: Any = None
+
+
+STATUS_FIELDS: dict[str, SeatStatusField] = {
+    field.name: field
+    for field in (
+        SeatStatusField("battery_soc", ("battery", "stateOfCharge"), float),
+        SeatStatusField("battery_range_km", ("battery", "remainingRangeKm"), float),
+        SeatStatusField("charging_power_kw", ("charging", "powerKw"), float),
+        SeatStatusField("charging_state", ("charging", "state")),
+        SeatStatusField("plug_connected", ("charging", "plugConnected"), bool),
+        SeatStatusField("doors_closed", ("doors", "allClosed")),
+        SeatStatusField("windows_closed", ("doors", "windowsClosed")),
+        SeatStatusField("is_locked", ("locks", "locked")),
+        SeatStatusField("climate_active", ("climate", "active")),
+    )
+}
+
+
+def status_entity_fields(name: str) -> dict[str, Any]:
+    """Return the ``value_fn`` and ``depends_on`` of an entity showing a status field."""
+
+    if name not in STATUS_FIELDS:
+        raise KeyError(f"Unknown status field {name}")
+    return {"value_fn": attrgetter(name), "depends_on": frozenset({name})}
+
+
+def compile_status_parser(
+    factory: type, fields: Iterable[SeatStatusField]
+) -> Callable[..., Any]:
+    """Return a function building the dataclass ``factory`` from a status payload.
+
+    The fields of ``factory`` that are not in the table become the remaining
+    parameters, e.g. ``parse(status, vin, name, model, capabilities)``. Like
+    ``dataclasses`` does for ``__init__``, the table is turned into the source
+    of a single function once: every nested object is looked up once, ints
+    and floats skip the generic coercion and the instance is created with
+    positional arguments.
+    """
+
+    by_name = {field.name: field for field in fields}
+    names = [field.name for field in dataclass_fields(factory)]
+    if unknown := by_name.keys() - set(names):
+        raise ValueError(f"{factory.__name__} has no fields {sorted(unknown)}")
+    namespace: dict[str, Any] = {
+        "_factory": factory,
+        "_EMPTY": _EMPTY,
+        "_MISSING": _MISSING,
+        "_float": _coerce_float,
+    }
+    lines: list[str] = []
+    containers: dict[tuple[str, ...], str] = {(): "status"}
+    parameters: list[str] = ["status"]
+    arguments: list[str] = []
+
+    def _container(path: tuple[str, ...]) -> str:
+        if (variable := containers.get(path)) is None:
+            parent = _container(path[:-1])
+            variable = containers[path] = f"_c{len(containers)}"
+            lines.append(f"    {variable} = {parent}.get({path[-1]!r}) or _EMPTY")
+        return variable
+
+    for index, name in enumerate(names):
+        if (field := by_name.get(name)) is None:
+            parameters.append(name)
+            arguments.append(f"        {name},")
+            continue
+        value = f"{_container(field.path[:-1])}.get({field.path[-1]!r}"
+        if field.kind is float:
+            value = (
+                f"_v if (_v := {value})).__class__ is float"
+                " else float(_v) if _v.__class__ is int else _float(_v)"
+            )
+        elif field.kind is bool:
+            value = f"None if (_v := {value}, _MISSING)) is _MISSING else bool(_v)"
+        elif field.kind is None:
+            value = f"{value})"
+        else:
+            raise ValueError(f"Unsupported kind {field.kind!r} of status field {name}")
+        if field.default is not None:
+            namespace[f"_d{index}"] = field.default
+            value = f"_d{index} if (_v := ({value})) is None else _v"
+        arguments.append(f"        {value},  # {name}")
+
+    source = "\n".join(
+        [
+            f"def parse({', '.join(parameters)}):",
+            *lines,
+            "    return _factory(",
+            *arguments,
+            "    )",
+        ]
+    )
+    exec(compile(source, "<seat_connect status parser>", "exec"), namespace)
+    parse: Callable[..., Any] = namespace["parse"]
+    parse.__doc__ = source
+    return parse
+
+
+def _coerce_float(value: Any) -> float | None:
+    """Return a float if possible."""
+
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,91 @@
+"""Priority-aware request slots for Seat Connect."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+
+class SeatRequestPriority(IntEnum):
+    """Order in which queued requests get a free connection slot; lower goes first."""
+
+    COMMAND = 0
+    REFRESH = 1
+    POLL = 2
+
+
+_priority: ContextVar[SeatRequestPriority] = ContextVar(
+    "seat_connect_priority", default=SeatRequestPriority.POLL
+)
+
+
+def current_priority() -> SeatRequestPriority:
+    """Return the priority of requests made in the current context."""
+
+    return _priority.get()
+
+
+@contextmanager
+def request_priority(priority: SeatRequestPriority) -> Iterator[None]:
+    """Send the requests made within the block, and tasks started from it, at ``priority``."""
+
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class SeatPrioritySemaphore:
+    """Semaphore that hands a released slot to the most urgent waiter.
+
+    Waiters of equal priority are served in arrival order, so background
+    polls still make progress while no command is queued.
+    """
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: SeatRequestPriority) -> None:
+        """Wait for a free slot."""
+
+        # Slots are only left over while nobody is queued.
+        if self._value > 0:
+            self._value -= 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted right before the cancellation; pass it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Give a slot back, to the next waiter if there is one."""
+
+        while self._waiters:
+            _priority, _seq, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+    @asynccontextmanager
+    async def slot(self, priority: SeatRequestPriority) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
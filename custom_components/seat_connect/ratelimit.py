@@ -0,0 +1,164 @@
+"""Account-wide request rate limiting for Seat Connect."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from aiohttp import hdrs
+
+from .const import DEFAULT_RATE_LIMIT, DEFAULT_RATE_LIMIT_BURST, LOGGER_NAME
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+HEADER_RATELIMIT_REMAINING = ("RateLimit-Remaining", "X-RateLimit-Remaining")
+HEADER_RATELIMIT_RESET = ("RateLimit-Reset", "X-RateLimit-Reset")
+
+# Reset values larger than this are epoch timestamps rather than deltas.
+_EPOCH_THRESHOLD = 10**9
+
+
+class SeatRateLimiter:
+    """Token bucket shared by every Seat Connect client of a Home Assistant instance.
+
+    Requests take one token each; tokens refill at ``rate`` per second up to
+    ``burst``. When the backend signals throttling, the bucket is paused for
+    the requested time and the rate is halved, then recovers additively with
+    every successful response. Requests waiting for a token are served by
+    priority (lower first), then in arrival order.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = DEFAULT_RATE_LIMIT,
+        burst: int = DEFAULT_RATE_LIMIT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_rate = rate
+        self._min_rate = rate / 16
+        self._rate = rate
+        self._burst = float(burst)
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def rate(self) -> float:
+        """Return the current number of requests allowed per second."""
+
+        return self._rate
+
+    def paused_for(self) -> float:
+        """Return the seconds left until requests may be sent again."""
+
+        return max(self._paused_until - self._clock(), 0.0)
+
+    async def async_acquire(self, priority: int = 0) -> None:
+        """Wait until a request of ``priority`` may be sent."""
+
+        if not self._waiters and self._async_take() == 0:
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        if self._timer is None:
+            self._async_dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The token was taken right before the cancellation; give it back.
+                self._tokens = min(self._tokens + 1, self._burst)
+                if self._timer is None:
+                    self._async_dispatch()
+            raise
+
+    def async_throttle(self, delay: float) -> None:
+        """Pause all requests for ``delay`` seconds and slow down afterwards."""
+
+        self._paused_until = max(self._paused_until, self._clock() + delay)
+        self._rate = max(self._rate / 2, self._min_rate)
+        _LOGGER.debug(
+            "Seat Connect throttled for %.1fs, continuing at %.2f requests/s", delay, self._rate
+        )
+
+    def async_update(self, headers: Mapping[str, str]) -> None:
+        """Record a successful response and honor any rate-limit headers on it."""
+
+        if self._rate < self._max_rate:
+            self._rate = min(self._rate + self._max_rate / 16, self._max_rate)
+        remaining = _first_header(headers, HEADER_RATELIMIT_REMAINING)
+        if remaining is None or remaining.strip() != "0":
+            return
+        reset = _first_header(headers, HEADER_RATELIMIT_RESET)
+        if reset is None:
+            return
+        try:
+            value = float(reset)
+        except ValueError:
+            return
+        if value > _EPOCH_THRESHOLD:
+            value -= time.time()
+        if value > 0:
+            self._paused_until = max(self._paused_until, self._clock() + value)
+
+    def _async_dispatch(self) -> None:
+        """Hand tokens to the most urgent waiters and wake up again for the next one."""
+
+        self._timer = None
+        while self._waiters:
+            if self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+                continue
+            if (delay := self._async_take()) > 0:
+                self._timer = asyncio.get_running_loop().call_later(delay, self._async_dispatch)
+                return
+            heapq.heappop(self._waiters)[2].set_result(None)
+
+    def _async_take(self) -> float:
+        """Take a token and return 0, or return how long to wait for one."""
+
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._tokens = min(self._tokens + (now - self._updated) * self._rate, self._burst)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self._rate
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Return the delay requested by a Retry-After header, in seconds."""
+
+    if not headers or (value := headers.get(hdrs.RETRY_AFTER)) is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _first_header(headers: Mapping[str, str], names: tuple[str, ...]) -> str | None:
+    for name in names:
+        if (value := headers.get(name)) is not None:
+            return value
+    return None
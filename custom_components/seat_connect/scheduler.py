@@ -0,0 +1,171 @@
+"""Per-vehicle poll scheduling for Seat Connect."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_at
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _VehicleSlot:
+    """Timer state of a single VIN."""
+
+    due: float
+    interval: float | None = None
+    unsub: CALLBACK_TYPE | None = None
+    task: asyncio.Task[None] | None = None
+
+
+class SeatPollScheduler:
+    """Spread per-VIN refreshes evenly across the poll interval.
+
+    Every VIN owns a slot with its own timer, so requests are issued at a
+    steady rate instead of in one burst and a slow vehicle only delays
+    itself. A VIN is never refreshed concurrently with itself: the next run
+    is scheduled once the previous one has finished. Slots poll at the
+    default interval unless a VIN-specific one was set.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        name: str,
+        interval: timedelta,
+        refresh: Callable[[str], Coroutine[Any, Any, None]],
+    ) -> None:
+        self._hass = hass
+        self._name = name
+        self._interval = interval.total_seconds()
+        self._refresh = refresh
+        self._slots: dict[str, _VehicleSlot] = {}
+
+    @property
+    def interval(self) -> timedelta:
+        """Return the time between two refreshes of the same VIN."""
+
+        return timedelta(seconds=self._interval)
+
+    @property
+    def running(self) -> bool:
+        """Return True while any VIN has a slot."""
+
+        return bool(self._slots)
+
+    @callback
+    def async_sync(self, vins: Iterable[str]) -> None:
+        """Track exactly the given VINs, re-spreading slots when the set changes."""
+
+        wanted = sorted(vins)
+        if wanted == sorted(self._slots):
+            return
+        for vin in set(self._slots) - set(wanted):
+            self._async_cancel(self._slots.pop(vin))
+        self._async_spread(wanted)
+
+    @callback
+    def async_set_interval(self, interval: timedelta) -> None:
+        """Change the poll interval and re-spread the existing slots."""
+
+        seconds = interval.total_seconds()
+        if seconds == self._interval:
+            return
+        self._interval = seconds
+        self._async_spread(sorted(self._slots))
+
+    @callback
+    def async_set_vehicle_interval(self, vin: str, interval: timedelta | None) -> None:
+        """Poll a single VIN at its own interval, or the default one if None."""
+
+        if (slot := self._slots.get(vin)) is None:
+            return
+        seconds = None if interval is None else interval.total_seconds()
+        if seconds == slot.interval:
+            return
+        previous = self._slot_interval(slot)
+        slot.interval = seconds
+        if slot.task is not None:
+            # The next run is planned from the new interval once this one ends.
+            return
+        # Move the pending run by the difference so the slot keeps its phase.
+        slot.due = max(slot.due + self._slot_interval(slot) - previous, self._hass.loop.time())
+        self._async_arm(vin, slot)
+
+    @callback
+    def async_postpone(self, vin: str) -> None:
+        """Restart the interval of a VIN that was just refreshed out of band."""
+
+        if (slot := self._slots.get(vin)) is None or slot.task is not None:
+            return
+        slot.due = self._hass.loop.time() + self._slot_interval(slot)
+        self._async_arm(vin, slot)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel all timers and in-flight refreshes."""
+
+        for slot in self._slots.values():
+            self._async_cancel(slot)
+        self._slots.clear()
+
+    @callback
+    def _async_spread(self, vins: list[str]) -> None:
+        if not vins:
+            return
+        now = self._hass.loop.time()
+        step = self._interval / len(vins)
+        for index, vin in enumerate(vins):
+            slot = self._slots.get(vin)
+            if slot is None:
+                slot = self._slots[vin] = _VehicleSlot(due=0)
+            slot.due = now + step * (index + 1)
+            if slot.task is None:
+                self._async_arm(vin, slot)
+
+    @callback
+    def _async_arm(self, vin: str, slot: _VehicleSlot) -> None:
+        if slot.unsub is not None:
+            slot.unsub()
+
+        @callback
+        def _fire(_now: datetime) -> None:
+            slot.unsub = None
+            slot.task = self._hass.async_create_background_task(
+                self._async_run(vin, slot), name=f"{self._name} refresh {vin}"
+            )
+
+        slot.unsub = async_call_at(self._hass, HassJob(_fire, cancel_on_shutdown=True), slot.due)
+
+    async def _async_run(self, vin: str, slot: _VehicleSlot) -> None:
+        try:
+            await self._refresh(vin)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error refreshing %s", vin)
+        finally:
+            slot.task = None
+        if self._slots.get(vin) is not slot:
+            return
+        # Keep the phase of the slot; only slip if the refresh overran it.
+        slot.due = max(slot.due + self._slot_interval(slot), self._hass.loop.time())
+        self._async_arm(vin, slot)
+
+    def _slot_interval(self, slot: _VehicleSlot) -> float:
+        return self._interval if slot.interval is None else slot.interval
+
+    @callback
+    def _async_cancel(self, slot: _VehicleSlot) -> None:
+        if slot.unsub is not None:
+            slot.unsub()
+            slot.unsub = None
+        if slot.task is not None:
+            slot.task.cancel()
+            slot.task = None
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Callable
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,23 +13,39 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfLength, UnitOfPower
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfLength,
+    UnitOfPower,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .aggregates import SeatFleetAggregates
 from .api import SeatVehicleData
 from .const import DATA_ENTRIES, DOMAIN
 from .entity import SeatConnectEntity
+from .parser import status_entity_fields
 
 if TYPE_CHECKING:
     from .coordinator import SeatDataUpdateCoordinator
 
+# Only the diagnostic sensors poll; vehicle sensors are pushed by the coordinator.
+SCAN_INTERVAL = timedelta(seconds=60)
+
 
 @dataclass(frozen=True, kw_only=True)
 class SeatSensorEntityDescription(SensorEntityDescription):
     """Seat sensor metadata."""
 
     value_fn: Callable[[SeatVehicleData], float | int | str | None]
+    depends_on: frozenset[str]
 
 
 SENSOR_DESCRIPTIONS: tuple[SeatSensorEntityDescription, ...] = (
@@ -39,7 +56,7 @@ SENSOR_DESCRIPTIONS: tuple[SeatSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda vehicle: vehicle.battery_soc,
+        **status_entity_fields("battery_soc"),
     ),
     SeatSensorEntityDescription(
         key="range",
@@ -48,7 +65,7 @@ SENSOR_DESCRIPTIONS: tuple[SeatSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
         icon="mdi:road-variant",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda vehicle: vehicle.battery_range_km,
+        **status_entity_fields("battery_range_km"),
     ),
     SeatSensorEntityDescription(
         key="charging_power",
@@ -57,14 +74,164 @@ SENSOR_DESCRIPTIONS: tuple[SeatSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda vehicle: vehicle.charging_power_kw,
+        **status_entity_fields("charging_power_kw"),
     ),
     SeatSensorEntityDescription(
         key="charging_state",
         translation_key="charging_state",
         name="Charging state",
         icon="mdi:ev-station",
-        value_fn=lambda vehicle: vehicle.charging_state,
+        **status_entity_fields("charging_state"),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SeatFleetSensorEntityDescription(SensorEntityDescription):
+    """Seat fleet sensor metadata."""
+
+    value_fn: Callable[[SeatFleetAggregates], float | int | None]
+
+
+FLEET_SENSOR_DESCRIPTIONS: tuple[SeatFleetSensorEntityDescription, ...] = (
+    SeatFleetSensorEntityDescription(
+        key="fleet_average_soc",
+        translation_key="fleet_average_soc",
+        name="Average battery SoC",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:battery-50",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.average_soc,
+    ),
+    SeatFleetSensorEntityDescription(
+        key="fleet_range",
+        translation_key="fleet_range",
+        name="Total electric range",
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        icon="mdi:road-variant",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.total_range_km,
+    ),
+    SeatFleetSensorEntityDescription(
+        key="fleet_charging_power",
+        translation_key="fleet_charging_power",
+        name="Total charging power",
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.charging_power_kw,
+    ),
+    SeatFleetSensorEntityDescription(
+        key="fleet_plugged_in",
+        translation_key="fleet_plugged_in",
+        name="Vehicles plugged in",
+        icon="mdi:power-plug",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.plugged_in,
+    ),
+    SeatFleetSensorEntityDescription(
+        key="fleet_doors_open",
+        translation_key="fleet_doors_open",
+        name="Vehicles with doors open",
+        icon="mdi:car-door",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.doors_open,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SeatDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Seat diagnostic sensor metadata."""
+
+    value_fn: Callable[["SeatDataUpdateCoordinator"], float | int | None]
+    attributes_fn: Callable[["SeatDataUpdateCoordinator"], dict[str, Any]] | None = None
+
+
+def _connection_reuse(coordinator: "SeatDataUpdateCoordinator") -> float | None:
+    stats = coordinator.client.connection_stats
+    if stats is None or (ratio := stats.reuse_ratio) is None:
+        return None
+    return round(ratio * 100, 1)
+
+
+DIAGNOSTIC_SENSOR_DESCRIPTIONS: tuple[SeatDiagnosticSensorEntityDescription, ...] = (
+    SeatDiagnosticSensorEntityDescription(
+        key="refresh_duration",
+        translation_key="refresh_duration",
+        name="Refresh duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.refresh_metrics.duration.last_ms,
+        attributes_fn=lambda coordinator: coordinator.refresh_metrics.as_dict(),
+    ),
+    SeatDiagnosticSensorEntityDescription(
+        key="poll_duration_p95",
+        translation_key="poll_duration_p95",
+        name="Vehicle poll duration (p95)",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.refresh_metrics.polls.percentile(0.95),
+    ),
+    SeatDiagnosticSensorEntityDescription(
+        key="request_latency_p95",
+        translation_key="request_latency_p95",
+        name="Request latency (p95)",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.client.metrics.latency_percentile(0.95),
+        attributes_fn=lambda coordinator: {
+            template: metrics.latency.as_dict()
+            for template, metrics in coordinator.client.metrics.endpoints.items()
+        },
+    ),
+    SeatDiagnosticSensorEntityDescription(
+        key="requests",
+        translation_key="requests",
+        name="Requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.metrics.total("requests"),
+    ),
+    SeatDiagnosticSensorEntityDescription(
+        key="retries",
+        translation_key="retries",
+        name="Retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.metrics.total("retries"),
+    ),
+    SeatDiagnosticSensorEntityDescription(
+        key="rate_limited",
+        translation_key="rate_limited",
+        name="Rate limited responses",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.metrics.total("rate_limited"),
+    ),
+    SeatDiagnosticSensorEntityDescription(
+        key="server_errors",
+        translation_key="server_errors",
+        name="Server errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.metrics.total("server_errors"),
+    ),
+    SeatDiagnosticSensorEntityDescription(
+        key="data_received",
+        translation_key="data_received",
+        name="Data received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.metrics.total("bytes_received"),
+    ),
+    SeatDiagnosticSensorEntityDescription(
+        key="connection_reuse",
+        translation_key="connection_reuse",
+        name="Connection reuse",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_connection_reuse,
     ),
 )
 
@@ -77,11 +244,19 @@ async def async_setup_entry(
     coordinator: SeatDataUpdateCoordinator = hass.data[DOMAIN][DATA_ENTRIES][
         entry.entry_id
     ].coordinator
-    entities = [
+    entities: list[SensorEntity] = [
         SeatConnectSensorEntity(coordinator, vin, description)
         for vin in coordinator.data or {}
         for description in SENSOR_DESCRIPTIONS
     ]
+    entities.extend(
+        SeatConnectFleetSensorEntity(coordinator, description)
+        for description in FLEET_SENSOR_DESCRIPTIONS
+    )
+    entities.extend(
+        SeatConnectDiagnosticSensorEntity(coordinator, description)
+        for description in DIAGNOSTIC_SENSOR_DESCRIPTIONS
+    )
     async_add_entities(entities)
 
 
@@ -98,7 +273,91 @@ class SeatConnectSensorEntity(SeatConnectEntity[SeatVehicleData], SensorEntity):
     ) -> None:
         super().__init__(coordinator, vin, description.key)
         self.entity_description = description
+        self._depends_on = description.depends_on
 
     @property
     def native_value(self) -> float | int | str | None:
         return self.entity_description.value_fn(self._vehicle)
+
+
+class SeatConnectFleetSensorEntity(
+    CoordinatorEntity["SeatDataUpdateCoordinator"], SensorEntity
+):
+    """Aggregate over every vehicle of a Seat Connect account."""
+
+    entity_description: SeatFleetSensorEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: "SeatDataUpdateCoordinator",
+        description: SeatFleetSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+        self._attr_device_info = _account_device_info(coordinator)
+        self._written: tuple[bool, float | int | None] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.signal_fleet_updated(),
+                self._handle_coordinator_update,
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when the aggregate or the availability moved."""
+
+        written = (self.available, self.native_value)
+        if written == self._written:
+            return
+        self._written = written
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> float | int | None:
+        return self.entity_description.value_fn(self.coordinator.fleet)
+
+
+class SeatConnectDiagnosticSensorEntity(SensorEntity):
+    """Request and refresh metrics of a Seat Connect account."""
+
+    entity_description: SeatDiagnosticSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: "SeatDataUpdateCoordinator",
+        description: SeatDiagnosticSensorEntityDescription,
+    ) -> None:
+        self.entity_description = description
+        self._coordinator = coordinator
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_device_info = _account_device_info(coordinator)
+
+    @property
+    def native_value(self) -> float | int | None:
+        return self.entity_description.value_fn(self._coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._coordinator)
+
+
+def _account_device_info(coordinator: "SeatDataUpdateCoordinator") -> DeviceInfo:
+    return DeviceInfo(
+        identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        manufacturer="SEAT",
+        name=coordinator.config_entry.title or "SEAT Connect",
+        entry_type=DeviceEntryType.SERVICE,
+    )
@@ -0,0 +1,96 @@
+"""Pooled HTTP session for the Seat Connect API."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+
+from aiohttp import (
+    ClientSession,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsCacheHitParams,
+    TraceDnsCacheMissParams,
+    hdrs,
+)
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
+
+from .const import DNS_CACHE_TTL, KEEPALIVE_TIMEOUT
+
+
+@dataclass(slots=True)
+class SeatConnectionStats:
+    """Counters describing how well connections to the Seat API are reused."""
+
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """Return the share of requests served by an already open connection."""
+
+        total = self.connections_created + self.connections_reused
+        return None if total == 0 else self.connections_reused / total
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the counters suitable for diagnostics."""
+
+        return {**asdict(self), "reuse_ratio": self.reuse_ratio}
+
+
+def async_create_seat_session(*, concurrency: int) -> tuple[ClientSession, SeatConnectionStats]:
+    """Create a session dedicated to one Seat Connect client.
+
+    Its connector keeps up to ``concurrency`` connections to the API host alive
+    and shares one TLS context between them, so status polls skip the DNS
+    lookup and TLS handshake. The caller owns the session and must close it.
+    """
+
+    stats = SeatConnectionStats()
+    connector = TCPConnector(
+        limit_per_host=concurrency,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        ssl=get_default_context(),
+    )
+    session = ClientSession(
+        connector=connector,
+        headers={hdrs.USER_AGENT: SERVER_SOFTWARE},
+        trace_configs=[_async_trace_config(stats)],
+    )
+    return session, stats
+
+
+def _async_trace_config(stats: SeatConnectionStats) -> TraceConfig:
+    async def _created(
+        _session: ClientSession, _ctx: SimpleNamespace, _params: TraceConnectionCreateEndParams
+    ) -> None:
+        stats.connections_created += 1
+
+    async def _reused(
+        _session: ClientSession, _ctx: SimpleNamespace, _params: TraceConnectionReuseconnParams
+    ) -> None:
+        stats.connections_reused += 1
+
+    async def _dns_hit(
+        _session: ClientSession, _ctx: SimpleNamespace, _params: TraceDnsCacheHitParams
+    ) -> None:
+        stats.dns_cache_hits += 1
+
+    async def _dns_miss(
+        _session: ClientSession, _ctx: SimpleNamespace, _params: TraceDnsCacheMissParams
+    ) -> None:
+        stats.dns_cache_misses += 1
+
+    trace_config = TraceConfig()
+    trace_config.on_connection_create_end.append(_created)
+    trace_config.on_connection_reuseconn.append(_reused)
+    trace_config.on_dns_cache_hit.append(_dns_hit)
+    trace_config.on_dns_cache_miss.append(_dns_miss)
+    return trace_config
+
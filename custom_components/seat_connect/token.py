@@ -0,0 +1,144 @@
+"""Ahead-of-time OAuth token renewal for Seat Connect."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from http import HTTPStatus
+
+from aiohttp import ClientResponseError
+from homeassistant.core import CALLBACK_TYPE, HassJob, callback
+from homeassistant.helpers.config_entry_oauth2_flow import (
+    CLOCK_OUT_OF_SYNC_MAX_SEC,
+    OAuth2Session,
+)
+from homeassistant.helpers.event import async_call_later
+
+from .const import TOKEN_REFRESH_MARGIN, TOKEN_RETRY_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SeatTokenManager:
+    """Renew the OAuth token of an account before requests need it.
+
+    Once started, the token is renewed ``refresh_margin`` seconds before it
+    expires, so polls and commands find a valid token instead of waiting for
+    the identity service. A request that still finds the token about to
+    expire joins the renewal in flight rather than starting another one.
+    """
+
+    def __init__(
+        self,
+        oauth_session: OAuth2Session,
+        *,
+        refresh_margin: float = TOKEN_REFRESH_MARGIN,
+        retry_delay: float = TOKEN_RETRY_DELAY,
+    ) -> None:
+        self._oauth_session = oauth_session
+        self._hass = oauth_session.hass
+        self._refresh_margin = refresh_margin
+        self._retry_delay = retry_delay
+        self._renewal: asyncio.Task[None] | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._running = False
+        self.renewals = 0
+
+    def expires_in(self) -> float | None:
+        """Return the seconds until the token expires, None if unknown."""
+
+        expires_at = self._oauth_session.token.get("expires_at")
+        if expires_at is None:
+            return None
+        return float(expires_at) - time.time()
+
+    async def async_ensure_valid(self) -> None:
+        """Return once the token is valid, renewing it if it is about to expire."""
+
+        expires_in = self.expires_in()
+        if expires_in is not None and expires_in <= CLOCK_OUT_OF_SYNC_MAX_SEC:
+            await asyncio.shield(self._async_renewal())
+
+    @callback
+    def async_start(self) -> None:
+        """Renew the token in the background ahead of every expiry."""
+
+        self._running = True
+        self._async_schedule(self._next_delay())
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop renewing the token in the background."""
+
+        self._running = False
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    def _next_delay(self) -> float | None:
+        if (expires_in := self.expires_in()) is None:
+            return None
+        return max(expires_in - self._refresh_margin, 0)
+
+    @callback
+    def _async_schedule(self, delay: float | None) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if delay is None or not self._running:
+            return
+
+        @callback
+        def _fire(_now: datetime) -> None:
+            self._unsub_timer = None
+            self._async_renewal()
+
+        self._unsub_timer = async_call_later(
+            self._hass, delay, HassJob(_fire, cancel_on_shutdown=True)
+        )
+
+    @callback
+    def _async_renewal(self) -> asyncio.Task[None]:
+        """Return the renewal in flight, starting one if there is none."""
+
+        if self._renewal is None:
+            self._renewal = self._hass.async_create_background_task(
+                self._async_renew(), name=f"{self._oauth_session.config_entry.title} token"
+            )
+            self._renewal.add_done_callback(self._async_renewal_done)
+        return self._renewal
+
+    async def _async_renew(self) -> None:
+        session = self._oauth_session
+        token = await session.implementation.async_refresh_token(session.token)
+        self._hass.config_entries.async_update_entry(
+            session.config_entry, data={**session.config_entry.data, "token": token}
+        )
+        self.renewals += 1
+
+    @callback
+    def _async_renewal_done(self, task: asyncio.Task[None]) -> None:
+        self._renewal = None
+        if task.cancelled():
+            return
+        if (err := task.exception()) is not None:
+            if _is_rejected_grant(err):
+                # Retrying cannot help; the user has to sign in again.
+                _LOGGER.warning("Seat Connect rejected the refresh token: %s", err)
+                self._oauth_session.config_entry.async_start_reauth(self._hass)
+                return
+            _LOGGER.warning("Could not renew the Seat Connect token: %s", err)
+            self._async_schedule(self._retry_delay)
+            return
+        self._async_schedule(self._next_delay())
+
+
+def _is_rejected_grant(err: BaseException) -> bool:
+    """Return True if the identity service refused the refresh token itself."""
+
+    return isinstance(err, ClientResponseError) and err.status in (
+        HTTPStatus.BAD_REQUEST,
+        HTTPStatus.UNAUTHORIZED,
+    )
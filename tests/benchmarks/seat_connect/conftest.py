@@ -0,0 +1,168 @@
+"""Fixtures and reporting for the Seat Connect benchmarks.
+
+The benchmarks only run when selected with ``pytest -m benchmark``. Results
+are printed at the end of the session and written as JSON to the path in
+``SEAT_BENCHMARK_JSON`` if it is set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fake_seat_api import FakeSeatApi, FakeSeatApiConfig
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.seat_connect.api import SeatApiClient
+from custom_components.seat_connect.const import DOMAIN
+from custom_components.seat_connect.session import async_create_seat_session
+
+_RESULTS: list[BenchmarkResult] = []
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """One measured scenario."""
+
+    name: str
+    fleet_size: int
+    wall_time_s: float = 0.0
+    requests: int = 0
+    peak_memory_kib: float = 0.0
+    state_writes: int | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Record wall time and peak traced memory of the block."""
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.wall_time_s = time.perf_counter() - started
+            self.peak_memory_kib = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with `pytest -m benchmark`")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if not _RESULTS:
+        return
+    terminalreporter.section("Seat Connect benchmarks")
+    terminalreporter.write_line(
+        f"{'scenario':<40}{'VINs':>6}{'wall s':>9}{'requests':>10}{'peak KiB':>10}{'writes':>8}"
+    )
+    for result in _RESULTS:
+        writes = "-" if result.state_writes is None else str(result.state_writes)
+        terminalreporter.write_line(
+            f"{result.name:<40}{result.fleet_size:>6}{result.wall_time_s:>9.3f}"
+            f"{result.requests:>10}{result.peak_memory_kib:>10.0f}{writes:>8}"
+        )
+    if path := os.environ.get("SEAT_BENCHMARK_JSON"):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump([asdict(result) for result in _RESULTS], file, indent=2)
+
+
+@pytest.fixture(autouse=True)
+def enable_event_loop_debug(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Measure with the event loop in production mode, not debug mode."""
+
+    event_loop.set_debug(False)
+
+
+@pytest.fixture
+def config_entry() -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="benchmark",
+        data={"token": {"access_token": "benchmark", "refresh_token": "benchmark"}},
+    )
+
+
+@pytest.fixture
+def benchmark_result() -> Callable[[str, int], BenchmarkResult]:
+    """Return a factory for results that are reported at the end of the session."""
+
+    def _create(name: str, fleet_size: int) -> BenchmarkResult:
+        result = BenchmarkResult(name=name, fleet_size=fleet_size)
+        _RESULTS.append(result)
+        return result
+
+    return _create
+
+
+@pytest.fixture
+async def fake_seat_api(
+    socket_enabled: None,
+) -> AsyncIterator[Callable[[FakeSeatApiConfig], Awaitable[FakeSeatApi]]]:
+    """Return a factory starting local Seat API servers on the loopback interface."""
+
+    servers: list[FakeSeatApi] = []
+
+    async def _start(config: FakeSeatApiConfig) -> FakeSeatApi:
+        server = FakeSeatApi(config)
+        await server.start()
+        servers.append(server)
+        return server
+
+    yield _start
+    for server in servers:
+        await server.close()
+
+
+@pytest.fixture
+async def seat_client() -> AsyncIterator[Callable[..., SeatApiClient]]:
+    """Return a factory for clients with their own pooled session."""
+
+    sessions = []
+
+    def _create(server: FakeSeatApi, **kwargs: Any) -> SeatApiClient:
+        session, stats = async_create_seat_session(concurrency=kwargs.get("concurrency", 4))
+        sessions.append(session)
+        oauth_session = MagicMock()
+        oauth_session.async_ensure_token_valid = AsyncMock()
+        oauth_session.token = {"access_token": "benchmark"}
+        return SeatApiClient(
+            oauth_session,
+            base_url=server.base_url,
+            session=session,
+            connection_stats=stats,
+            **kwargs,
+        )
+
+    yield _create
+    for session in sessions:
+        await session.close()
+
+
+@pytest.fixture
+def seat_fleet(
+    fake_seat_api: Callable[[FakeSeatApiConfig], Awaitable[FakeSeatApi]],
+    seat_client: Callable[..., SeatApiClient],
+) -> Callable[..., Awaitable[tuple[FakeSeatApi, SeatApiClient]]]:
+    """Return a factory starting a local server and a client connected to it."""
+
+    async def _start(config: FakeSeatApiConfig, **kwargs: Any) -> tuple[FakeSeatApi, SeatApiClient]:
+        server = await fake_seat_api(config)
+        return server, seat_client(server, **kwargs)
+
+    return _start
@@ -0,0 +1,168 @@
+"""Local stand-in for the Seat Connect API used by the benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import hdrs, web
+from aiohttp.test_utils import TestServer
+
+
+@dataclass(slots=True)
+class FakeSeatApiConfig:
+    """Shape and failure behaviour of the synthetic fleet."""
+
+    fleet_size: int = 1
+    page_size: int = 100
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit_ratio: float = 0.0
+    server_error_ratio: float = 0.0
+    # Share of status requests answered with a changed payload.
+    change_ratio: float = 0.0
+    seed: int = 0
+
+
+@dataclass(slots=True)
+class FakeSeatApiStats:
+    """What the server saw."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    not_modified: int = 0
+    rate_limited: int = 0
+    server_errors: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.requests.values())
+
+    def reset(self) -> None:
+        self.requests.clear()
+        self.not_modified = self.rate_limited = self.server_errors = 0
+
+
+class FakeSeatApi:
+    """Serve ``/vehicles``, ``/vehicles/{vin}/status`` and ``/actions/*`` for a fleet.
+
+    The roster is paginated with ``nextCursor``, status responses carry an
+    ETag and honour ``If-None-Match``, and every request can be delayed or
+    answered with 429/503 at the configured ratios.
+    """
+
+    def __init__(self, config: FakeSeatApiConfig) -> None:
+        self.config = config
+        self.stats = FakeSeatApiStats()
+        self.vins = [f"VSSZZZK1ZPB{index:06d}" for index in range(config.fleet_size)]
+        self._random = random.Random(config.seed)
+        self._status = {vin: initial_status(index) for index, vin in enumerate(self.vins)}
+        self._actions: dict[str, str] = {}
+        self._server: TestServer | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None
+        return str(self._server.make_url("")).rstrip("/")
+
+    async def start(self) -> None:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/vehicles", self._vehicles)
+        app.router.add_get("/vehicles/{vin}/status", self._vehicle_status)
+        app.router.add_post("/vehicles/{vin}/actions/{command}", self._action)
+        app.router.add_get("/vehicles/{vin}/actions/{command}/{id}", self._action_status)
+        self._server = TestServer(app)
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            await self._server.close()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        route = request.match_info.route.resource
+        self.stats.requests[route.canonical if route is not None else request.path] += 1
+        if self.config.latency or self.config.jitter:
+            await asyncio.sleep(self.config.latency + self._random.uniform(0, self.config.jitter))
+        roll = self._random.random()
+        if roll < self.config.rate_limit_ratio:
+            self.stats.rate_limited += 1
+            return web.Response(status=429, headers={hdrs.RETRY_AFTER: "0"})
+        if roll < self.config.rate_limit_ratio + self.config.server_error_ratio:
+            self.stats.server_errors += 1
+            return web.Response(status=503)
+        return await handler(request)
+
+    async def _vehicles(self, request: web.Request) -> web.Response:
+        start = int(request.query.get("cursor", 0))
+        end = start + self.config.page_size
+        payload: dict[str, Any] = {"vehicles": [_roster_entry(vin) for vin in self.vins[start:end]]}
+        if end < len(self.vins):
+            payload["nextCursor"] = str(end)
+        return self._json(request, payload)
+
+    async def _vehicle_status(self, request: web.Request) -> web.Response:
+        vin = request.match_info["vin"]
+        if (status := self._status.get(vin)) is None:
+            raise web.HTTPNotFound
+        if self._random.random() < self.config.change_ratio:
+            battery = status["battery"]
+            battery["stateOfCharge"] = (battery["stateOfCharge"] + 1) % 101
+        return self._json(request, status)
+
+    async def _action(self, request: web.Request) -> web.Response:
+        vin = request.match_info["vin"]
+        command = request.match_info["command"]
+        if vin not in self._status:
+            raise web.HTTPNotFound
+        action_id = str(len(self._actions) + 1)
+        self._actions[action_id] = command
+        status = self._status[vin]
+        if command in ("lock", "unlock"):
+            status["locks"]["locked"] = command == "lock"
+        elif command in ("start_climate", "stop_climate"):
+            status["climate"]["active"] = command == "start_climate"
+        return web.json_response({"id": action_id}, status=202)
+
+    async def _action_status(self, request: web.Request) -> web.Response:
+        if request.match_info["id"] not in self._actions:
+            raise web.HTTPNotFound
+        return web.json_response({"status": "succeeded"})
+
+    def _json(self, request: web.Request, payload: Any) -> web.Response:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            self.stats.not_modified += 1
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+        return web.Response(body=body, content_type="application/json", headers={hdrs.ETAG: etag})
+
+
+def _roster_entry(vin: str) -> dict[str, Any]:
+    return {
+        "vin": vin,
+        "nickname": f"Car {vin[-4:]}",
+        "model": "Born",
+        "capabilities": ["CLIMATE"],
+    }
+
+
+def initial_status(index: int) -> dict[str, Any]:
+    """Return the status the ``index``-th vehicle of the fleet starts with."""
+
+    charging = index % 5 == 0
+    return {
+        "battery": {"stateOfCharge": 40 + index % 60, "remainingRangeKm": 150 + index % 250},
+        "charging": {
+            "state": "charging" if charging else "readyForCharging",
+            "powerKw": 11.0 if charging else 0.0,
+            "plugConnected": charging,
+        },
+        "locks": {"locked": index % 2 == 0},
+        "climate": {"active": False},
+        "doors": {"allClosed": True, "windowsClosed": True},
+    }
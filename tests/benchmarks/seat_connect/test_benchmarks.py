@@ -0,0 +1,279 @@
+"""Synthetic-fleet benchmarks for the Seat Connect client, coordinator and entities.
+
+Every scenario runs against the local stand-in server, so no network access
+is needed. Request counts and state writes are deterministic and asserted to
+catch regressions; timings and memory are reported only, except that the
+compiled status parser must not be slower than the legacy one.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from fake_seat_api import FakeSeatApiConfig, initial_status
+from homeassistant.const import EVENT_STATE_CHANGED
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from custom_components.seat_connect import (
+    SeatConnectRuntimeData,
+    binary_sensor,
+    climate,
+    lock,
+    sensor,
+)
+from custom_components.seat_connect.api import SeatVehicleData
+from custom_components.seat_connect.const import DATA_ENTRIES, DOMAIN
+from custom_components.seat_connect.coordinator import (
+    SeatDataUpdateCoordinator,
+    SeatPollingPolicy,
+)
+from custom_components.seat_connect.parser import STATUS_FIELDS, compile_status_parser
+from custom_components.seat_connect.ratelimit import SeatRateLimiter
+
+pytestmark = pytest.mark.benchmark
+
+PAGE_SIZE = 100
+
+
+@pytest.mark.parametrize("fleet_size", [1, 100, 2000])
+async def test_client_refresh_scaling(fake_seat_api, seat_client, benchmark_result, fleet_size):
+    server = await fake_seat_api(FakeSeatApiConfig(fleet_size=fleet_size, page_size=PAGE_SIZE))
+    client = seat_client(server)
+    pages = -(-fleet_size // PAGE_SIZE)
+
+    cold = benchmark_result("client refresh (cold)", fleet_size)
+    with cold.measure():
+        data = await client.async_get_vehicle_data()
+    cold.requests = server.stats.total
+    assert len(data) == fleet_size
+    assert cold.requests == pages + fleet_size
+
+    server.stats.reset()
+    warm = benchmark_result("client refresh (304, cached roster)", fleet_size)
+    with warm.measure():
+        again = await client.async_get_vehicle_data()
+    warm.requests = server.stats.total
+    warm.extra["not_modified"] = server.stats.not_modified
+    assert warm.requests == fleet_size
+    assert server.stats.not_modified == fleet_size
+    assert all(again[vin] is data[vin] for vin in data)
+    if client.connection_stats is not None:
+        warm.extra["connection_reuse"] = client.connection_stats.reuse_ratio
+
+
+@pytest.mark.parametrize("fleet_size", [200])
+async def test_client_refresh_under_latency_and_faults(
+    fake_seat_api, seat_client, benchmark_result, fleet_size
+):
+    server = await fake_seat_api(
+        FakeSeatApiConfig(
+            fleet_size=fleet_size,
+            page_size=PAGE_SIZE,
+            latency=0.005,
+            jitter=0.005,
+            rate_limit_ratio=0.02,
+            server_error_ratio=0.02,
+            seed=1,
+        )
+    )
+    client = seat_client(
+        server,
+        backoff_factor=0.01,
+        max_retries=5,
+        rate_limiter=SeatRateLimiter(rate=1000, burst=1000),
+    )
+
+    result = benchmark_result("client refresh (latency, 429/5xx)", fleet_size)
+    with result.measure():
+        data = await client.async_get_vehicle_data()
+    result.requests = server.stats.total
+    result.extra["retries"] = client.metrics.total("retries")
+    result.extra["rate_limited"] = server.stats.rate_limited
+    result.extra["server_errors"] = server.stats.server_errors
+    assert len(data) == fleet_size
+    assert result.requests == -(-fleet_size // PAGE_SIZE) + fleet_size + result.extra["retries"]
+
+
+@pytest.mark.parametrize("fleet_size", [1, 50, 250])
+async def test_coordinator_entity_state_writes(
+    hass, config_entry, seat_fleet, benchmark_result, fleet_size
+):
+    config_entry.add_to_hass(hass)
+    server, client = await seat_fleet(FakeSeatApiConfig(fleet_size=fleet_size, page_size=PAGE_SIZE))
+    # Keep the per-VIN slots from firing in the middle of a measurement.
+    idle = timedelta(days=1)
+    coordinator = SeatDataUpdateCoordinator(
+        hass,
+        client=client,
+        entry=config_entry,
+        update_interval=idle,
+        policy=SeatPollingPolicy(normal=idle, active=idle, parked=idle, asleep=idle),
+    )
+    hass.data.setdefault(DOMAIN, {}).setdefault(DATA_ENTRIES, {})[config_entry.entry_id] = (
+        SeatConnectRuntimeData(client=client, coordinator=coordinator)
+    )
+    writes = 0
+
+    def _count(_event: Any) -> None:
+        nonlocal writes
+        writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count)
+
+    setup = benchmark_result("coordinator first refresh + entities", fleet_size)
+    with setup.measure():
+        await coordinator.async_refresh()
+        for module in (sensor, binary_sensor, lock, climate):
+            entities: list[Any] = []
+            await module.async_setup_entry(hass, config_entry, entities.extend)
+            platform = MockEntityPlatform(hass, domain=module.__name__.rsplit(".", 1)[-1])
+            await platform.async_add_entities(entities)
+        await hass.async_block_till_done()
+    setup.requests = server.stats.total
+    setup.state_writes = writes
+    entity_count = len(hass.states.async_all())
+
+    try:
+        server.stats.reset()
+        writes = 0
+        unchanged = benchmark_result("coordinator refresh (unchanged)", fleet_size)
+        with unchanged.measure():
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+        unchanged.requests = server.stats.total
+        unchanged.state_writes = writes
+        assert unchanged.requests == fleet_size
+        assert unchanged.state_writes == 0
+
+        server.config.change_ratio = 1.0
+        server.stats.reset()
+        writes = 0
+        polled = benchmark_result("per-VIN polls (SoC changed)", fleet_size)
+        with polled.measure():
+            await coordinator.async_refresh_vehicles(list(coordinator.data))
+            await hass.async_block_till_done()
+        polled.requests = server.stats.total
+        polled.state_writes = writes
+        polled.extra["entities"] = entity_count
+        assert polled.requests == fleet_size
+        # The state of charge sensor of every vehicle depends on the change, and the
+        # fleet average is written whenever its rounded value moves.
+        assert fleet_size < polled.state_writes <= 2 * fleet_size
+    finally:
+        unsub()
+        await coordinator.async_shutdown()
+
+
+@pytest.mark.parametrize("fleet_size", [400])
+async def test_coordinator_refresh_paced_by_rate_limiter(
+    hass, config_entry, seat_fleet, benchmark_result, fleet_size
+):
+    config_entry.add_to_hass(hass)
+    limiter = SeatRateLimiter(rate=200, burst=20)
+    server, client = await seat_fleet(
+        FakeSeatApiConfig(fleet_size=fleet_size, page_size=PAGE_SIZE), rate_limiter=limiter
+    )
+    # The rate limiter needs far longer than the 0.8s poll budget for the fleet.
+    interval = timedelta(seconds=1)
+    coordinator = SeatDataUpdateCoordinator(
+        hass,
+        client=client,
+        entry=config_entry,
+        update_interval=interval,
+        policy=SeatPollingPolicy(normal=interval),
+    )
+
+    try:
+        first = benchmark_result("coordinator first refresh (rate limited)", fleet_size)
+        with first.measure():
+            await coordinator.async_refresh()
+        first.requests = server.stats.total
+        assert coordinator.last_update_success
+        assert len(coordinator.data) == fleet_size
+
+        server.stats.reset()
+        again = benchmark_result("coordinator refresh (rate limited)", fleet_size)
+        with again.measure():
+            await coordinator.async_refresh()
+        again.requests = server.stats.total
+        again.extra["rate"] = limiter.rate
+        assert again.wall_time_s > fleet_size / limiter.rate / 2
+        assert len(coordinator.data) == fleet_size
+        assert not coordinator.stale_vins
+    finally:
+        await coordinator.async_shutdown()
+
+
+@pytest.mark.parametrize("fleet_size", [2000])
+def test_status_parsing(benchmark_result, fleet_size):
+    statuses = [initial_status(index) for index in range(fleet_size)]
+    vins = [f"VIN{index:014d}" for index in range(fleet_size)]
+    capabilities = frozenset({"CLIMATE"})
+    parse_status = compile_status_parser(SeatVehicleData, STATUS_FIELDS.values())
+
+    def _compiled() -> list[SeatVehicleData]:
+        return [
+            parse_status(status, vin=vin, name=vin, model="Born", capabilities=capabilities)
+            for vin, status in zip(vins, statuses, strict=True)
+        ]
+
+    def _legacy() -> list[SeatVehicleData]:
+        return [
+            _legacy_parse(vin, status, capabilities)
+            for vin, status in zip(vins, statuses, strict=True)
+        ]
+
+    result = benchmark_result("status parsing (compiled field table)", fleet_size)
+    with result.measure():
+        parsed = _compiled()
+    assert parsed == _legacy()
+    for name, parse in (("compiled_us", _compiled), ("legacy_us", _legacy)):
+        best = min(_timed(parse) for _ in range(20))
+        result.extra[name] = round(best / fleet_size * 1e6, 3)
+    assert result.extra["compiled_us"] <= result.extra["legacy_us"]
+
+
+def _timed(parse: Any) -> float:
+    started = time.perf_counter()
+    parse()
+    return time.perf_counter() - started
+
+
+def _legacy_parse(
+    vin: str, status: dict[str, Any], capabilities: frozenset[str]
+) -> SeatVehicleData:
+    """Normalize a status payload like the client did before the field table."""
+
+    def _coerce_float(value: Any) -> float | None:
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    battery = status.get("battery", {})
+    charging = status.get("charging", {})
+    locks = status.get("locks", {})
+    climate = status.get("climate", {})
+    doors = status.get("doors", {})
+    return SeatVehicleData(
+        vin=vin,
+        name=vin,
+        model="Born",
+        battery_soc=_coerce_float(battery.get("stateOfCharge")),
+        battery_range_km=_coerce_float(battery.get("remainingRangeKm")),
+        charging_power_kw=_coerce_float(charging.get("powerKw")),
+        charging_state=charging.get("state"),
+        plug_connected=(
+            bool(charging.get("plugConnected")) if "plugConnected" in charging else None
+        ),
+        doors_closed=doors.get("allClosed"),
+        windows_closed=doors.get("windowsClosed"),
+        is_locked=locks.get("locked"),
+        climate_active=climate.get("active"),
+        capabilities=capabilities,
+    )
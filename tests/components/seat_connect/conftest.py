@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from unittest.mock import AsyncMock, patch
+
 import pytest
+from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.seat_connect import SeatConnectRuntimeData, async_setup_entry
 from custom_components.seat_connect.api import SeatVehicleData
-from custom_components.seat_connect.const import DOMAIN
+from custom_components.seat_connect.const import DATA_ENTRIES, DOMAIN
 
 
 @pytest.fixture
@@ -25,7 +30,7 @@ def vehicle_data() -> dict[str, SeatVehicleData]:
             windows_closed=True,
             is_locked=False,
             climate_active=False,
-            capabilities={"CLIMATE"},
+            capabilities=frozenset({"CLIMATE"}),
         )
     }
 
@@ -39,3 +44,37 @@ def config_entry() -> MockConfigEntry:
         options={}
     )
     return entry
+
+
+@pytest.fixture
+def setup_integration(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> Callable[[AsyncMock], Awaitable[SeatConnectRuntimeData]]:
+    """Return a function setting up the config entry around a mocked API client.
+
+    Platforms are not forwarded and the first refresh is skipped, so the
+    coordinator starts without data.
+    """
+
+    async def _setup(client: AsyncMock) -> SeatConnectRuntimeData:
+        config_entry.add_to_hass(hass)
+        hass.config_entries.async_forward_entry_setups = AsyncMock()
+        with (
+            patch("custom_components.seat_connect.SeatApiClient", return_value=client),
+            patch(
+                "custom_components.seat_connect.__init__.config_entry_oauth2_flow.async_get_config_entry_implementation",
+                AsyncMock(),
+            ),
+            patch(
+                "custom_components.seat_connect.__init__.config_entry_oauth2_flow.OAuth2Session",
+                return_value=AsyncMock(token=config_entry.data["token"]),
+            ),
+            patch(
+                "custom_components.seat_connect.coordinator.SeatDataUpdateCoordinator.async_config_entry_first_refresh",
+                AsyncMock(),
+            ),
+        ):
+            assert await async_setup_entry(hass, config_entry)
+        return hass.data[DOMAIN][DATA_ENTRIES][config_entry.entry_id]
+
+    return _setup
@@ -0,0 +1,575 @@
+"""Tests for the Seat Connect API client."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import ClientResponseError, web
+from aiohttp.test_utils import TestServer
+from multidict import CIMultiDict
+
+from custom_components.seat_connect.api import (
+    SeatApiClient,
+    SeatApiError,
+    SeatApiRateLimitError,
+    SeatCircuitOpenError,
+    SeatCommand,
+    SeatCommandStatus,
+    SeatDeadlineExceededError,
+    SeatPartialRefreshError,
+    SeatVehicleData,
+    SeatVehicleNotFoundError,
+    normalize_capabilities,
+    request_deadline,
+)
+from custom_components.seat_connect.cassette import SeatCassetteRecorder, SeatCassetteReplay
+from custom_components.seat_connect.circuit_breaker import (
+    SeatCircuitBreaker,
+    SeatCircuitState,
+    full_jitter_backoff,
+)
+from custom_components.seat_connect.const import API_BASE_URL
+from custom_components.seat_connect.parser import (
+    STATUS_FIELDS,
+    SeatStatusField,
+    compile_status_parser,
+)
+from custom_components.seat_connect.priority import SeatRequestPriority, request_priority
+from custom_components.seat_connect.ratelimit import SeatRateLimiter, parse_retry_after
+from custom_components.seat_connect.session import async_create_seat_session
+
+VIN = "VIN123"
+ROSTER = {"vehicles": [{"vin": VIN, "nickname": "Born", "capabilities": ["CLIMATE"]}]}
+STATUS = {"battery": {"stateOfCharge": 80}, "locks": {"locked": True}}
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp client response."""
+
+    def __init__(
+        self, status: int = 200, payload: Any = None, headers: dict[str, str] | None = None
+    ) -> None:
+        self.status = status
+        self.headers = CIMultiDict(headers or {})
+        self.content_type = "application/json"
+        self.read = AsyncMock(return_value=b"" if payload is None else json.dumps(payload).encode())
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise ClientResponseError(MagicMock(), (), status=self.status, headers=self.headers)
+
+    def release(self) -> None:
+        return None
+
+
+def _make_client(
+    *responses: _FakeResponse, **kwargs: Any
+) -> tuple[SeatApiClient, AsyncMock]:
+    oauth_session = MagicMock()
+    oauth_session.async_request = AsyncMock(side_effect=list(responses))
+    client = SeatApiClient(oauth_session, backoff_factor=0, **kwargs)
+    return client, oauth_session.async_request
+
+
+async def test_conditional_get_reuses_vehicle_on_not_modified():
+    client, request = _make_client(
+        _FakeResponse(payload=ROSTER, headers={"ETag": '"roster-1"'}),
+        _FakeResponse(payload=STATUS, headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        _FakeResponse(status=304),
+        _FakeResponse(status=304),
+        roster_refresh_interval=timedelta(0),
+    )
+
+    first = await client.async_get_vehicle_data()
+    second = await client.async_get_vehicle_data()
+
+    assert second[VIN] is first[VIN]
+    assert first[VIN].battery_soc == 80
+    roster_call, status_call = request.await_args_list[2:]
+    assert roster_call.kwargs["headers"]["If-None-Match"] == '"roster-1"'
+    assert status_call.kwargs["headers"]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    # Counted from the body read, without a Content-Length; a 304 transfers none.
+    status = client.metrics.endpoints["/vehicles/{vin}/status"]
+    assert status.bytes_received == len(json.dumps(STATUS))
+
+
+async def test_request_without_validators_is_unconditional():
+    client, request = _make_client(
+        _FakeResponse(payload=ROSTER),
+        _FakeResponse(payload=STATUS),
+        _FakeResponse(payload=ROSTER),
+        _FakeResponse(payload={**STATUS, "locks": {"locked": False}}),
+        roster_refresh_interval=timedelta(0),
+    )
+
+    await client.async_get_vehicle_data()
+    data = await client.async_get_vehicle_data()
+
+    assert data[VIN].is_locked is False
+    assert all("headers" not in call.kwargs for call in request.await_args_list)
+
+
+async def test_roster_is_cached_until_invalidated():
+    client, request = _make_client(
+        _FakeResponse(payload=ROSTER),
+        _FakeResponse(payload=STATUS),
+        _FakeResponse(payload=STATUS),
+        _FakeResponse(payload=ROSTER),
+        _FakeResponse(payload=STATUS),
+    )
+
+    await client.async_get_vehicle_data()
+    await client.async_get_vehicle_data()
+    client.invalidate_roster()
+    await client.async_get_vehicle_data()
+
+    paths = [call.args[1].rsplit("/", 1)[-1] for call in request.await_args_list]
+    assert paths == ["vehicles", "status", "status", "vehicles", "status"]
+
+
+async def test_capabilities_are_normalized_and_shared():
+    roster = {
+        "vehicles": [
+            {"vin": VIN, "capabilities": ["climate"]},
+            {"vin": "VIN456", "capabilities": ["CLIMATE"]},
+        ]
+    }
+    client, _ = _make_client(
+        _FakeResponse(payload=roster),
+        _FakeResponse(payload=STATUS),
+        _FakeResponse(payload=STATUS),
+    )
+
+    data = await client.async_get_vehicle_data()
+
+    assert data[VIN].capabilities == frozenset({"CLIMATE"})
+    assert data[VIN].capabilities is data["VIN456"].capabilities
+    assert normalize_capabilities(["Climate"]) is data[VIN].capabilities
+
+
+async def test_failing_vehicle_does_not_discard_the_others():
+    roster = {"vehicles": [{"vin": VIN}, {"vin": "VIN456"}]}
+    client, _ = _make_client(
+        _FakeResponse(payload=roster),
+        _FakeResponse(payload=STATUS),
+        _FakeResponse(status=404),
+    )
+
+    with pytest.raises(SeatPartialRefreshError) as err:
+        await client.async_get_vehicle_data()
+
+    assert list(err.value.data) == [VIN]
+    assert list(err.value.errors) == ["VIN456"]
+    assert isinstance(err.value.errors["VIN456"], SeatVehicleNotFoundError)
+
+
+async def test_roster_survives_status_outages_but_not_removed_vehicles():
+    client, request = _make_client(
+        _FakeResponse(payload=ROSTER),
+        _FakeResponse(status=503),
+        _FakeResponse(status=404),
+        _FakeResponse(payload=ROSTER),
+        _FakeResponse(payload=STATUS),
+        max_retries=0,
+    )
+
+    with pytest.raises(SeatApiError):
+        await client.async_get_vehicle(VIN)
+    breaker = client.circuit_breakers["status"]
+    while breaker.state is not SeatCircuitState.OPEN:
+        breaker.record_failure()
+    with pytest.raises(SeatCircuitOpenError):
+        await client.async_get_vehicle(VIN)
+    breaker.record_success()
+    with pytest.raises(SeatVehicleNotFoundError):
+        await client.async_get_vehicle(VIN)
+    await client.async_get_vehicle(VIN)
+
+    paths = [call.args[1].rsplit("/", 1)[-1] for call in request.await_args_list]
+    assert paths == ["vehicles", "status", "status", "vehicles", "status"]
+
+
+async def test_paginated_roster_overlaps_status_requests():
+    first_status_sent = asyncio.Event()
+    second_vehicle = {"vin": "VIN456", "nickname": "Leon"}
+
+    async def _request(method: str, url: str, **kwargs: Any) -> _FakeResponse:
+        if url.endswith("/vehicles"):
+            return _FakeResponse(payload={**ROSTER, "nextCursor": "page 2"})
+        if url.endswith("/vehicles?cursor=page+2"):
+            # Only answers once the first page's status request is in flight.
+            await asyncio.wait_for(first_status_sent.wait(), 1)
+            return _FakeResponse(payload={"vehicles": [second_vehicle]})
+        if url.endswith(f"/{VIN}/status"):
+            first_status_sent.set()
+        return _FakeResponse(payload=STATUS)
+
+    oauth_session = MagicMock()
+    oauth_session.async_request = AsyncMock(side_effect=_request)
+    client = SeatApiClient(oauth_session)
+
+    data = await client.async_get_vehicle_data()
+
+    assert list(data) == [VIN, "VIN456"]
+    assert data["VIN456"].name == "Leon"
+    assert oauth_session.async_request.await_count == 4
+
+
+@pytest.mark.parametrize(
+    "roster",
+    [
+        {"vehicles": ROSTER["vehicles"], "offset": None, "total": 2},
+        {"vehicles": [{"nickname": "Born"}]},
+        [None],
+    ],
+)
+async def test_malformed_roster_raises_api_error(roster):
+    client, _ = _make_client(_FakeResponse(payload=roster))
+
+    with pytest.raises(SeatApiError):
+        await client.async_get_vehicle_data()
+
+
+async def test_caches_forget_old_roster_pages_and_removed_vehicles():
+    pages = {
+        "/vehicles": {"vehicles": [{"vin": VIN}], "nextCursor": "a"},
+        "/vehicles?cursor=a": {"vehicles": [{"vin": "VIN456"}]},
+    }
+
+    async def _request(method: str, url: str, **kwargs: Any) -> _FakeResponse:
+        path = url.removeprefix("https://seat.test")
+        return _FakeResponse(payload=pages.get(path, STATUS), headers={"ETag": f'"{path}"'})
+
+    oauth_session = MagicMock()
+    oauth_session.async_request = AsyncMock(side_effect=_request)
+    client = SeatApiClient(
+        oauth_session, base_url="https://seat.test", roster_refresh_interval=timedelta(0)
+    )
+    await client.async_get_vehicle_data()
+    assert len(client._response_cache) == 4
+
+    pages["/vehicles"] = {"vehicles": [{"vin": VIN}], "nextCursor": "b"}
+    pages["/vehicles?cursor=b"] = {"vehicles": []}
+    data = await client.async_get_vehicle_data()
+
+    assert list(data) == [VIN]
+    assert sorted(client._response_cache) == [
+        "https://seat.test/vehicles",
+        "https://seat.test/vehicles/VIN123/status",
+        "https://seat.test/vehicles?cursor=b",
+    ]
+    assert list(client._vehicle_cache) == [VIN]
+
+
+async def test_concurrent_identical_gets_share_one_request():
+    release = asyncio.Event()
+
+    async def _request(method: str, url: str, **kwargs: Any) -> _FakeResponse:
+        await release.wait()
+        return _FakeResponse(payload=ROSTER if url.endswith("/vehicles") else STATUS)
+
+    oauth_session = MagicMock()
+    oauth_session.async_request = AsyncMock(side_effect=_request)
+    client = SeatApiClient(oauth_session)
+
+    calls = asyncio.gather(*(client.async_get_vehicle(VIN) for _ in range(3)))
+    await asyncio.sleep(0)
+    release.set()
+    first, second, third = await calls
+
+    assert first is second is third
+    assert oauth_session.async_request.await_count == 2
+
+
+async def test_urgent_get_does_not_join_a_background_poll():
+    release = asyncio.Event()
+
+    async def _request(method: str, url: str, **kwargs: Any) -> _FakeResponse:
+        if url.endswith("/status"):
+            await release.wait()
+        return _FakeResponse(payload=ROSTER if url.endswith("/vehicles") else STATUS)
+
+    oauth_session = MagicMock()
+    oauth_session.async_request = AsyncMock(side_effect=_request)
+    client = SeatApiClient(oauth_session)
+    release.set()
+    await client.async_get_vehicle_data()
+    release.clear()
+
+    poll = asyncio.create_task(client.async_get_vehicle(VIN))
+    await asyncio.sleep(0)
+    with request_priority(SeatRequestPriority.REFRESH):
+        refresh = asyncio.create_task(client.async_get_vehicle(VIN))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(poll, refresh)
+
+    assert [call.args[1] for call in oauth_session.async_request.await_args_list[2:]] == [
+        f"{API_BASE_URL}/vehicles/{VIN}/status"
+    ] * 2
+
+
+async def test_shared_get_runs_under_the_loosest_deadline_of_its_callers():
+    async def _request(method: str, url: str, **kwargs: Any) -> _FakeResponse:
+        if url.endswith("/status"):
+            await asyncio.sleep(0.2)
+        return _FakeResponse(payload=ROSTER if url.endswith("/vehicles") else STATUS)
+
+    async def _get_within_deadline() -> SeatVehicleData:
+        with request_deadline(0.05):
+            return await client.async_get_vehicle(VIN)
+
+    oauth_session = MagicMock()
+    oauth_session.async_request = AsyncMock(side_effect=_request)
+    client = SeatApiClient(oauth_session)
+    await client.async_get_vehicle_data()
+
+    hurried, patient = await asyncio.gather(
+        _get_within_deadline(), client.async_get_vehicle(VIN), return_exceptions=True
+    )
+
+    assert isinstance(hurried, SeatDeadlineExceededError)
+    assert patient.battery_soc == 80
+    assert oauth_session.async_request.await_count == 3
+
+
+async def test_rate_limit_honors_retry_after_across_clients():
+    limiter = SeatRateLimiter(rate=10, burst=10)
+    client, request = _make_client(
+        _FakeResponse(status=429, headers={"Retry-After": "0"}),
+        _FakeResponse(payload=ROSTER),
+        _FakeResponse(payload=STATUS),
+        rate_limiter=limiter,
+    )
+    other, _ = _make_client(
+        _FakeResponse(status=429, headers={"Retry-After": "3600"}), rate_limiter=limiter
+    )
+
+    await client.async_get_vehicle_data()
+    assert request.await_count == 3
+    assert limiter.rate < 10
+
+    with pytest.raises(SeatApiRateLimitError):
+        await other.async_get_vehicle_data()
+    assert limiter.paused_for() > 3000
+    with pytest.raises(SeatApiRateLimitError):
+        await client.async_get_vehicle("VIN123")
+    assert request.await_count == 3
+
+
+async def test_rate_recovers_and_honors_headers_on_not_modified():
+    limiter = SeatRateLimiter(rate=10, burst=100)
+    not_modified = [_FakeResponse(status=304) for _ in range(8)]
+    client, _ = _make_client(
+        _FakeResponse(payload=ROSTER),
+        _FakeResponse(payload=STATUS, headers={"ETag": '"status-1"'}),
+        _FakeResponse(status=429, headers={"Retry-After": "0"}),
+        *not_modified,
+        _FakeResponse(status=304, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "60"}),
+        rate_limiter=limiter,
+    )
+
+    await client.async_get_vehicle(VIN)
+    await client.async_get_vehicle(VIN)
+    assert limiter.rate == 10 / 2 + 10 / 16
+    for _ in not_modified[1:]:
+        await client.async_get_vehicle(VIN)
+    assert limiter.rate == 10
+    assert limiter.paused_for() == 0
+
+    await client.async_get_vehicle(VIN)
+    assert limiter.paused_for() > 50
+
+
+async def test_dedicated_session_reuses_connections_and_sends_bearer(socket_enabled):
+    seen_auth: list[str | None] = []
+
+    async def _vehicles(request: web.Request) -> web.Response:
+        seen_auth.append(request.headers.get("Authorization"))
+        return web.json_response(ROSTER)
+
+    async def _status(request: web.Request) -> web.Response:
+        seen_auth.append(request.headers.get("Authorization"))
+        return web.json_response(STATUS)
+
+    app = web.Application()
+    app.router.add_get("/vehicles", _vehicles)
+    app.router.add_get(f"/vehicles/{VIN}/status", _status)
+    server = TestServer(app)
+    await server.start_server()
+    session, stats = async_create_seat_session(concurrency=1)
+    oauth_session = MagicMock()
+    oauth_session.async_ensure_token_valid = AsyncMock()
+    oauth_session.token = {"access_token": "token"}
+    client = SeatApiClient(
+        oauth_session,
+        base_url=str(server.make_url("")),
+        session=session,
+        connection_stats=stats,
+    )
+    try:
+        for _ in range(3):
+            await client.async_get_vehicle_data()
+    finally:
+        await session.close()
+        await server.close()
+
+    assert seen_auth == ["Bearer token"] * 4
+    assert client.connection_stats is stats
+    status = client.metrics.endpoints["/vehicles/{vin}/status"]
+    assert status.requests == 3
+    assert status.bytes_received > 0
+    assert status.latency.count == 3
+    assert stats.connections_created == 1
+    assert stats.connections_reused == 3
+    assert stats.reuse_ratio == 0.75
+
+
+async def test_recorded_cassette_replays_without_vins_or_tokens():
+    recorder = SeatCassetteRecorder()
+    client, _ = _make_client(
+        _FakeResponse(payload={**ROSTER, "token": "secret"}, headers={"ETag": '"r"'}),
+        _FakeResponse(status=503),
+        _FakeResponse(payload=STATUS),
+        recorder=recorder,
+    )
+    recorded = await client.async_get_vehicle_data()
+    cassette = recorder.dump()
+
+    assert b"VIN123" not in gzip.decompress(cassette)
+    assert b"secret" not in gzip.decompress(cassette)
+    assert [item.status for item in recorder.interactions] == [200, 503, 200]
+    assert recorder.interactions[1].path == "/vehicles/VIN0001/status"
+
+    replay = SeatCassetteReplay.from_bytes(cassette, speed=0)
+    replayed_client = SeatApiClient(replay, backoff_factor=0)
+    replayed = await replayed_client.async_get_vehicle_data()
+
+    assert list(replayed) == ["VIN0001"]
+    assert replayed["VIN0001"].battery_soc == recorded[VIN].battery_soc
+    assert replayed_client.metrics.total("server_errors") == 1
+    assert replay.unmatched == []
+
+
+async def test_request_deadline_shortens_attempts_without_tripping_breakers():
+    async def _slow_request(*_args: Any, **_kwargs: Any) -> _FakeResponse:
+        await asyncio.sleep(1)
+        return _FakeResponse(payload=ROSTER)
+
+    oauth_session = MagicMock()
+    oauth_session.async_request = AsyncMock(side_effect=_slow_request)
+    client = SeatApiClient(oauth_session, request_timeout=30, backoff_factor=0)
+
+    with request_deadline(0.05), pytest.raises(SeatDeadlineExceededError):
+        await client.async_get_vehicle_data()
+    with request_deadline(0), pytest.raises(SeatDeadlineExceededError):
+        await client.async_get_vehicle_data()
+
+    assert oauth_session.async_request.await_count == 1
+    assert client.circuit_breakers["roster"].state is SeatCircuitState.CLOSED
+
+
+async def test_circuit_opens_after_failures_and_fails_fast():
+    client, request = _make_client(
+        *(_FakeResponse(status=503) for _ in range(5)), max_retries=4
+    )
+
+    with pytest.raises(SeatApiError):
+        await client.async_get_vehicle(VIN)
+    assert request.await_count == 5
+    assert client.circuit_breakers["roster"].state is SeatCircuitState.OPEN
+
+    with pytest.raises(SeatCircuitOpenError):
+        await client.async_get_vehicle(VIN)
+    assert request.await_count == 5
+    assert client.circuit_breakers["status"].state is SeatCircuitState.CLOSED
+
+
+def test_circuit_breaker_probes_once_when_half_open():
+    now = 0.0
+    breaker = SeatCircuitBreaker(
+        "status", failure_threshold=2, reset_timeout=10, clock=lambda: now
+    )
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    assert breaker.retry_in() == 10
+
+    now = 10.0
+    assert breaker.state is SeatCircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.retry_in() == 20
+
+    now = 30.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state is SeatCircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_full_jitter_backoff_is_capped():
+    assert all(0 <= full_jitter_backoff(attempt, 2, 5) <= 5 for attempt in range(1, 10))
+    assert full_jitter_backoff(1, 0, 5) == 0
+
+
+def test_status_parser_coerces_and_tolerates_missing_sections():
+    parse = compile_status_parser(
+        SeatVehicleData,
+        [
+            *STATUS_FIELDS.values(),
+            SeatStatusField("charging_state", ("charging", "state"), default="unknown"),
+        ],
+    )
+    vehicle = parse(
+        {"battery": {"stateOfCharge": 80, "remainingRangeKm": "n/a"}, "charging": None},
+        vin=VIN,
+        name="Born",
+        model="Born",
+        capabilities=frozenset(),
+    )
+    assert vehicle.battery_soc == 80.0
+    assert isinstance(vehicle.battery_soc, float)
+    assert vehicle.battery_range_km is None
+    assert vehicle.charging_state == "unknown"
+    assert vehicle.plug_connected is None
+    assert vehicle.is_locked is None
+
+    vehicle = parse({"charging": {"plugConnected": None}}, VIN, "Born", "Born", frozenset())
+    assert vehicle.plug_connected is False
+
+    with pytest.raises(ValueError):
+        compile_status_parser(SeatVehicleData, [SeatStatusField("odometer", ("mileage",))])
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"Retry-After": "12"}) == 12
+    assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+
+
+async def test_command_returns_trackable_id():
+    client, request = _make_client(
+        _FakeResponse(payload={"requestId": 42}),
+        _FakeResponse(payload={"status": "IN_PROGRESS"}),
+        _FakeResponse(payload={"status": "Success"}),
+    )
+
+    command = await client.async_lock_vehicle(VIN)
+
+    assert command == SeatCommand(VIN, "lock", "42")
+    assert await client.async_get_command_status(command) is SeatCommandStatus.PENDING
+    assert await client.async_get_command_status(command) is SeatCommandStatus.SUCCEEDED
+    assert request.await_args_list[-1].args == (
+        "GET",
+        f"https://my-seat.apps.emea.vwapps.io/vehicles/{VIN}/actions/lock/42",
+    )
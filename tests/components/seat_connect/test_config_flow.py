@@ -5,6 +5,7 @@ from __future__ import annotations
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.seat_connect.config_flow import (
+    SeatConnectFlowHandler,
     SeatConnectOptionsFlowHandler,
     _extract_unique_id,
 )
@@ -25,6 +26,18 @@ async def test_options_flow_allows_updating_interval(hass, config_entry):
     assert result["data"][CONF_UPDATE_INTERVAL] == MIN_UPDATE_INTERVAL
 
 
+async def test_reauth_flow_asks_to_sign_in_again(hass, config_entry):
+    config_entry.add_to_hass(hass)
+    flow = SeatConnectFlowHandler()
+    flow.hass = hass
+    flow.context = {"source": "reauth", "entry_id": config_entry.entry_id}
+
+    result = await flow.async_step_reauth(config_entry.data)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "reauth_confirm"
+
+
 def test_extract_unique_id_prefers_userinfo():
     token = {"userinfo": {"sub": "abc"}}
     assert _extract_unique_id({"token": token}) == "abc"
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import asdict, replace
 from datetime import timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from custom_components.seat_connect.coordinator import SeatDataUpdateCoordinator
+from custom_components.seat_connect.api import (
+    SeatApiError,
+    SeatCommand,
+    SeatPartialRefreshError,
+)
+from custom_components.seat_connect.const import STORAGE_KEY, STORAGE_VERSION
+from custom_components.seat_connect.coordinator import (
+    SeatDataUpdateCoordinator,
+    SeatPollingPolicy,
+)
 
 
 @pytest.mark.asyncio
@@ -27,3 +40,143 @@ async def test_coordinator_fetches_vehicle_data(hass, vehicle_data, config_entry
 
     assert coordinator.data == vehicle_data
     client.async_get_vehicle_data.assert_awaited()
+
+
+async def test_coordinator_restores_persisted_snapshot(hass, vehicle_data, config_entry):
+    config_entry.add_to_hass(hass)
+    client = AsyncMock()
+    client.async_get_vehicle_data.return_value = vehicle_data
+
+    coordinator = SeatDataUpdateCoordinator(
+        hass,
+        client=client,
+        entry=config_entry,
+        update_interval=timedelta(seconds=60),
+    )
+    assert not await coordinator.async_restore()
+    await coordinator.async_refresh()
+    await coordinator.async_shutdown()
+
+    restored = SeatDataUpdateCoordinator(
+        hass,
+        client=AsyncMock(),
+        entry=config_entry,
+        update_interval=timedelta(seconds=60),
+    )
+    assert await restored.async_restore()
+    assert restored.data == vehicle_data
+
+
+async def test_snapshot_leaves_out_pending_command_effects(
+    hass, hass_storage, vehicle_data, config_entry
+):
+    config_entry.add_to_hass(hass)
+    client = AsyncMock()
+    client.async_get_vehicle_data.return_value = vehicle_data
+    coordinator = SeatDataUpdateCoordinator(
+        hass,
+        client=client,
+        entry=config_entry,
+        update_interval=timedelta(seconds=60),
+    )
+    await coordinator.async_refresh()
+
+    coordinator.async_track_command(SeatCommand("VIN123", "lock", "1"))
+    assert coordinator.data["VIN123"].is_locked is True
+    # A failed refresh of the vehicle must not mistake the effects for its state.
+    client.async_get_vehicle_data.side_effect = SeatPartialRefreshError(
+        {}, {"VIN123": SeatApiError("boom")}
+    )
+    await coordinator.async_refresh()
+    assert coordinator.data["VIN123"].is_locked is True
+    await coordinator.async_shutdown()
+
+    stored = hass_storage[STORAGE_KEY.format(entry_id=config_entry.entry_id)]["data"]
+    assert stored["vehicles"]["VIN123"]["is_locked"] is False
+    assert time.time() - stored["last_changed"]["VIN123"] < 60
+
+
+async def test_restored_vehicle_keeps_aging_into_quieter_tiers(
+    hass, hass_storage, vehicle_data, config_entry
+):
+    config_entry.add_to_hass(hass)
+    parked = replace(vehicle_data["VIN123"], charging_state=None, plug_connected=False)
+    hass_storage[STORAGE_KEY.format(entry_id=config_entry.entry_id)] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY.format(entry_id=config_entry.entry_id),
+        "data": {
+            "vehicles": {"VIN123": {**asdict(parked), "capabilities": ["CLIMATE"]}},
+            "last_changed": {"VIN123": time.time() - 7200},
+        },
+    }
+    client = AsyncMock()
+    client.async_get_vehicle_data.return_value = {"VIN123": parked}
+    coordinator = SeatDataUpdateCoordinator(
+        hass,
+        client=client,
+        entry=config_entry,
+        update_interval=timedelta(seconds=60),
+    )
+    assert await coordinator.async_restore()
+
+    with patch.object(
+        SeatPollingPolicy, "interval_for", autospec=True, return_value=timedelta(minutes=15)
+    ) as interval_for:
+        remove_listener = coordinator.async_add_listener(lambda: None)
+        await coordinator.async_refresh()
+
+    _policy, vehicle, unchanged_for = interval_for.call_args.args
+    assert vehicle == parked
+    assert unchanged_for > timedelta(hours=1)
+    remove_listener()
+
+
+async def test_vehicles_are_polled_in_staggered_slots(hass, vehicle_data, config_entry):
+    config_entry.add_to_hass(hass)
+    first = replace(vehicle_data["VIN123"], charging_state=None)
+    fleet = {"VIN123": first, "VIN456": replace(first, vin="VIN456")}
+    client = AsyncMock()
+    client.async_get_vehicle_data.return_value = fleet
+    client.async_get_vehicle.side_effect = lambda vin: replace(fleet[vin], battery_soc=50)
+
+    coordinator = SeatDataUpdateCoordinator(
+        hass,
+        client=client,
+        entry=config_entry,
+        update_interval=timedelta(seconds=60),
+    )
+    await coordinator.async_refresh()
+    remove_listener = coordinator.async_add_listener(lambda: None)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    client.async_get_vehicle.assert_awaited_once_with("VIN123")
+    assert coordinator.data["VIN123"].battery_soc == 50
+    assert coordinator.data["VIN456"].battery_soc == 80
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    client.async_get_vehicle.assert_awaited_with("VIN456")
+    assert coordinator.data["VIN456"].battery_soc == 50
+    assert coordinator.refresh_metrics.duration.count == 1
+    assert coordinator.refresh_metrics.polls.count == 2
+
+    remove_listener()
+
+
+def test_polling_policy_tiers(vehicle_data):
+    policy = SeatPollingPolicy(
+        normal=timedelta(seconds=90),
+        active=timedelta(seconds=30),
+        parked=timedelta(minutes=15),
+        asleep=timedelta(hours=1),
+    )
+    charging = vehicle_data["VIN123"]
+    parked = replace(charging, charging_state="readyForCharging", plug_connected=False)
+
+    assert policy.interval_for(charging, timedelta(days=3)) == policy.active
+    assert policy.interval_for(parked, timedelta(minutes=5)) == policy.normal
+    assert policy.interval_for(parked, timedelta(hours=1)) == policy.parked
+    assert policy.interval_for(parked, timedelta(days=3)) == policy.asleep
+    plugged = replace(parked, plug_connected=True)
+    assert policy.interval_for(plugged, timedelta(hours=1)) == policy.normal
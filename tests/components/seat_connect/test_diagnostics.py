@@ -0,0 +1,38 @@
+"""Tests for Seat Connect diagnostics."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from custom_components.seat_connect import SeatConnectRuntimeData
+from custom_components.seat_connect.api import SeatApiClient
+from custom_components.seat_connect.const import DATA_ENTRIES, DOMAIN
+from custom_components.seat_connect.coordinator import SeatDataUpdateCoordinator
+from custom_components.seat_connect.diagnostics import async_get_config_entry_diagnostics
+
+
+async def test_diagnostics_report_metrics_without_secrets(hass, config_entry, vehicle_data):
+    config_entry.add_to_hass(hass)
+    client = SeatApiClient(MagicMock())
+    client.metrics.record_response("/vehicles/VIN123/status", 200, 150, 256)
+    client.metrics.record_queue_wait("command", 3)
+    coordinator = SeatDataUpdateCoordinator(
+        hass, client=client, entry=config_entry, update_interval=timedelta(seconds=60)
+    )
+    coordinator.data = vehicle_data
+    coordinator.refresh_metrics.record(900, success=True)
+    hass.data[DOMAIN] = {
+        DATA_ENTRIES: {config_entry.entry_id: SeatConnectRuntimeData(client, coordinator)}
+    }
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert diagnostics["entry"]["data"]["token"] == "**REDACTED**"
+    assert diagnostics["vehicles"] == 1
+    assert diagnostics["refresh"]["duration"]["count"] == 1
+    assert diagnostics["endpoints"]["/vehicles/{vin}/status"]["bytes_received"] == 256
+    assert diagnostics["queue_wait"]["command"]["count"] == 1
+    assert diagnostics["circuit_breakers"]["status"] == "closed"
+    assert diagnostics["connections"] is None
+    assert diagnostics["rate_limiter"] is None
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
 from datetime import timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.climate import HVACMode
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
+from custom_components.seat_connect.api import (
+    SeatApiError,
+    SeatCommand,
+    SeatCommandStatus,
+    SeatPartialRefreshError,
+)
 from custom_components.seat_connect.binary_sensor import (
     BINARY_SENSORS,
     SeatConnectBinarySensorEntity,
@@ -16,7 +25,9 @@ from custom_components.seat_connect.climate import SeatConnectClimateEntity
 from custom_components.seat_connect.coordinator import SeatDataUpdateCoordinator
 from custom_components.seat_connect.lock import SeatConnectLockEntity
 from custom_components.seat_connect.sensor import (
+    FLEET_SENSOR_DESCRIPTIONS,
     SENSOR_DESCRIPTIONS,
+    SeatConnectFleetSensorEntity,
     SeatConnectSensorEntity,
 )
 
@@ -28,10 +39,12 @@ async def coordinator(hass, vehicle_data, config_entry):
     config_entry.add_to_hass(hass)
     client = AsyncMock()
     client.async_get_vehicle_data.return_value = vehicle_data
-    client.async_lock_vehicle = AsyncMock()
-    client.async_unlock_vehicle = AsyncMock()
-    client.async_start_climate = AsyncMock()
-    client.async_stop_climate = AsyncMock()
+    client.async_get_vehicle.return_value = vehicle_data[VIN]
+    client.async_lock_vehicle = AsyncMock(return_value=SeatCommand(VIN, "lock", "1"))
+    client.async_unlock_vehicle = AsyncMock(return_value=SeatCommand(VIN, "unlock", "2"))
+    client.async_start_climate = AsyncMock(return_value=SeatCommand(VIN, "start_climate"))
+    client.async_stop_climate = AsyncMock(return_value=SeatCommand(VIN, "stop_climate"))
+    client.async_get_command_status.return_value = SeatCommandStatus.SUCCEEDED
 
     coordinator = SeatDataUpdateCoordinator(
         hass,
@@ -40,7 +53,8 @@ async def coordinator(hass, vehicle_data, config_entry):
         update_interval=timedelta(seconds=60),
     )
     await coordinator.async_refresh()
-    return coordinator
+    yield coordinator
+    await coordinator.async_shutdown()
 
 
 def test_sensor_reports_soc(coordinator):
@@ -62,9 +76,109 @@ async def test_lock_entity_triggers_client_commands(coordinator):
     coordinator.client.async_unlock_vehicle.assert_awaited_with(VIN)
 
 
+async def test_lock_command_is_optimistic_until_confirmed(coordinator, vehicle_data):
+    entity = SeatConnectLockEntity(coordinator, VIN)
+    coordinator.client.async_get_vehicle.return_value = replace(
+        vehicle_data[VIN], is_locked=True
+    )
+
+    with patch("custom_components.seat_connect.coordinator.COMMAND_POLL_DELAYS", (0,)):
+        await entity.async_lock()
+        assert entity.is_locked is True
+        await asyncio.gather(*coordinator._command_tasks)
+
+    coordinator.client.async_get_command_status.assert_awaited_once_with(
+        SeatCommand(VIN, "lock", "1")
+    )
+    coordinator.client.async_get_vehicle.assert_awaited_with(VIN)
+    coordinator.client.async_get_vehicle_data.assert_awaited_once()
+    assert entity.is_locked is True
+
+
 @pytest.mark.asyncio
 async def test_climate_entity_starts_preconditioning(coordinator):
     entity = SeatConnectClimateEntity(coordinator, VIN)
     assert entity.hvac_mode == HVACMode.OFF
     await entity.async_set_hvac_mode(HVACMode.HEAT)
     coordinator.client.async_start_climate.assert_awaited_with(VIN)
+
+
+async def test_entities_only_write_when_their_fields_change(coordinator, vehicle_data):
+    sensor = SeatConnectSensorEntity(coordinator, VIN, SENSOR_DESCRIPTIONS[0])
+    lock = SeatConnectLockEntity(coordinator, VIN)
+    sensor.async_write_ha_state = MagicMock()
+    lock.async_write_ha_state = MagicMock()
+    coordinator.async_add_listener(sensor._handle_coordinator_update)
+    coordinator.async_add_listener(lock._handle_coordinator_update)
+
+    await coordinator.async_refresh()
+    sensor.async_write_ha_state.reset_mock()
+    lock.async_write_ha_state.reset_mock()
+
+    coordinator.client.async_get_vehicle_data.return_value = {
+        VIN: replace(vehicle_data[VIN], is_locked=True)
+    }
+    await coordinator.async_refresh()
+
+    sensor.async_write_ha_state.assert_not_called()
+    lock.async_write_ha_state.assert_called_once()
+    await coordinator.async_shutdown()
+
+
+async def test_fleet_sensors_follow_changed_vehicles_only(hass, coordinator, vehicle_data):
+    average_soc, _, _, plugged_in, _ = (
+        SeatConnectFleetSensorEntity(coordinator, description)
+        for description in FLEET_SENSOR_DESCRIPTIONS
+    )
+    for entity in (average_soc, plugged_in):
+        entity.async_write_ha_state = MagicMock()
+        coordinator.async_add_listener(entity._handle_coordinator_update)
+    fleet_updates = MagicMock()
+    async_dispatcher_connect(hass, coordinator.signal_fleet_updated(), fleet_updates)
+
+    await coordinator.async_refresh()
+    assert (average_soc.native_value, plugged_in.native_value) == (80, 1)
+    average_soc.async_write_ha_state.reset_mock()
+    plugged_in.async_write_ha_state.reset_mock()
+
+    coordinator.client.async_get_vehicle_data.return_value = {
+        VIN: replace(vehicle_data[VIN], plug_connected=False)
+    }
+    await coordinator.async_refresh()
+
+    assert plugged_in.native_value == 0
+    plugged_in.async_write_ha_state.assert_called_once()
+    average_soc.async_write_ha_state.assert_not_called()
+
+    coordinator.client.async_get_vehicle.return_value = replace(
+        vehicle_data[VIN], plug_connected=False, battery_soc=60
+    )
+    await coordinator.async_refresh_vehicle(VIN)
+    await hass.async_block_till_done()
+
+    assert average_soc.native_value == 60
+    fleet_updates.assert_called_once()
+    await coordinator.async_shutdown()
+
+
+async def test_only_the_failing_vehicle_goes_stale(coordinator, vehicle_data):
+    other = replace(vehicle_data[VIN], vin="VIN456", name="Leon")
+    coordinator.client.async_get_vehicle_data.return_value = {**vehicle_data, "VIN456": other}
+    await coordinator.async_refresh()
+    healthy = SeatConnectSensorEntity(coordinator, VIN, SENSOR_DESCRIPTIONS[0])
+    failing = SeatConnectSensorEntity(coordinator, "VIN456", SENSOR_DESCRIPTIONS[0])
+
+    coordinator.client.async_get_vehicle_data.side_effect = SeatPartialRefreshError(
+        {VIN: replace(vehicle_data[VIN], battery_soc=70)}, {"VIN456": SeatApiError("boom")}
+    )
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert healthy.available and healthy.native_value == 70
+    assert not failing.available and failing.native_value == 80
+
+    coordinator.client.async_get_vehicle.return_value = other
+    await coordinator.async_refresh_vehicle("VIN456")
+
+    assert failing.available
+    assert coordinator.stale_vins == frozenset()
@@ -0,0 +1,43 @@
+"""Tests for Seat Connect metrics."""
+
+from __future__ import annotations
+
+from custom_components.seat_connect.metrics import (
+    LatencyHistogram,
+    SeatRequestMetrics,
+    endpoint_template,
+)
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.5) is None
+    for milliseconds in (5, 20, 40, 80, 90, 95, 120, 200, 400, 70000):
+        histogram.record(milliseconds)
+
+    assert histogram.percentile(0.5) == 100
+    assert histogram.percentile(0.9) == 500
+    assert histogram.percentile(0.99) == 70000
+    assert histogram.as_dict()["count"] == 10
+
+
+def test_request_metrics_group_by_endpoint_template():
+    metrics = SeatRequestMetrics()
+    metrics.record_response("/vehicles/VIN1/status", 200, 120, 512)
+    metrics.record_response("/vehicles/VIN2/status", 503, 80, None)
+    metrics.record_response("/vehicles?cursor=abc", 429, 10, None)
+    metrics.record_error("/vehicles/VIN1/actions/lock/42", 30000)
+    metrics.record_retry("/vehicles/VIN2/status")
+
+    status = metrics.endpoints["/vehicles/{vin}/status"]
+    assert (status.requests, status.server_errors, status.retries) == (2, 1, 1)
+    assert status.bytes_received == 512
+    assert metrics.endpoints["/vehicles"].rate_limited == 1
+    assert metrics.endpoints["/vehicles/{vin}/actions/lock/{id}"].network_errors == 1
+    assert metrics.total("requests") == 4
+    assert metrics.latency_percentile(0.95) == 30000
+
+
+def test_endpoint_template():
+    assert endpoint_template("/vehicles") == "/vehicles"
+    assert endpoint_template("/vehicles/VIN1/actions/lock") == "/vehicles/{vin}/actions/lock"
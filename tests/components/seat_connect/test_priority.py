@@ -0,0 +1,85 @@
+"""Tests for Seat Connect request priorities."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.seat_connect.priority import (
+    SeatPrioritySemaphore,
+    SeatRequestPriority,
+    current_priority,
+    request_priority,
+)
+from custom_components.seat_connect.ratelimit import SeatRateLimiter
+
+
+async def test_released_slot_goes_to_most_urgent_waiter():
+    slots = SeatPrioritySemaphore(1)
+    order: list[str] = []
+
+    async def _request(name: str, priority: SeatRequestPriority) -> None:
+        async with slots.slot(priority):
+            order.append(name)
+
+    await slots.acquire(SeatRequestPriority.POLL)
+    tasks = [
+        asyncio.create_task(_request("poll 1", SeatRequestPriority.POLL)),
+        asyncio.create_task(_request("poll 2", SeatRequestPriority.POLL)),
+        asyncio.create_task(_request("refresh", SeatRequestPriority.REFRESH)),
+        asyncio.create_task(_request("lock", SeatRequestPriority.COMMAND)),
+    ]
+    await asyncio.sleep(0)
+    slots.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["lock", "refresh", "poll 1", "poll 2"]
+
+
+async def test_cancelled_waiter_does_not_leak_its_slot():
+    slots = SeatPrioritySemaphore(1)
+    await slots.acquire(SeatRequestPriority.POLL)
+    waiter = asyncio.create_task(slots.acquire(SeatRequestPriority.COMMAND))
+    await asyncio.sleep(0)
+
+    slots.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    await asyncio.wait_for(slots.acquire(SeatRequestPriority.POLL), 1)
+
+
+async def test_rate_limiter_serves_commands_before_queued_polls():
+    limiter = SeatRateLimiter(rate=100, burst=1)
+    order: list[str] = []
+
+    async def _request(name: str, priority: SeatRequestPriority) -> None:
+        await limiter.async_acquire(priority)
+        order.append(name)
+
+    await limiter.async_acquire(SeatRequestPriority.POLL)
+    polls = [
+        asyncio.create_task(_request(f"poll {index}", SeatRequestPriority.POLL))
+        for index in range(3)
+    ]
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(_request("cancelled", SeatRequestPriority.COMMAND))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.wait_for(_request("lock", SeatRequestPriority.COMMAND), 1)
+    await asyncio.wait_for(asyncio.gather(*polls), 1)
+
+    assert order == ["lock", "poll 0", "poll 1", "poll 2"]
+
+
+async def test_priority_is_inherited_by_tasks():
+    assert current_priority() is SeatRequestPriority.POLL
+    with request_priority(SeatRequestPriority.REFRESH):
+        assert await asyncio.create_task(_async_priority()) is SeatRequestPriority.REFRESH
+    assert current_priority() is SeatRequestPriority.POLL
+
+
+async def _async_priority() -> SeatRequestPriority:
+    return current_priority()
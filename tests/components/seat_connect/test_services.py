@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from dataclasses import replace
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.exceptions import HomeAssistantError
 
-from custom_components.seat_connect import async_setup_entry
+from custom_components.seat_connect.api import SeatApiError, SeatCommand
 from custom_components.seat_connect.const import (
-    DATA_ENTRIES,
+    CONF_UPDATE_INTERVAL,
+    DATA_VINS,
     DOMAIN,
+    SERVICE_CONFIG_ENTRY_ID,
     SERVICE_LOCK,
     SERVICE_VIN,
 )
@@ -19,38 +23,11 @@ VIN = "VIN123"
 
 
 @pytest.mark.asyncio
-async def test_lock_service_invokes_api(hass, config_entry, vehicle_data):
-    config_entry.add_to_hass(hass)
+async def test_lock_service_invokes_api(hass, setup_integration, vehicle_data):
     mock_client = AsyncMock()
     mock_client.async_get_vehicle_data.return_value = vehicle_data
-
-    hass.config_entries.async_forward_entry_setups = AsyncMock()
-
-    impl_mock = AsyncMock()
-    get_impl_mock = AsyncMock(return_value=impl_mock)
-    oauth_session = AsyncMock()
-
-    with (
-        patch("custom_components.seat_connect.__init__.SeatApiClient", return_value=mock_client),
-        patch(
-            "custom_components.seat_connect.__init__.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            get_impl_mock,
-        ),
-        patch(
-            "custom_components.seat_connect.__init__.config_entry_oauth2_flow.OAuth2Session",
-            return_value=oauth_session,
-        ),
-        patch(
-            "custom_components.seat_connect.coordinator.SeatDataUpdateCoordinator.async_config_entry_first_refresh",
-            AsyncMock(),
-        ),
-    ):
-        assert await async_setup_entry(hass, config_entry)
-
-    runtime = hass.data[DOMAIN][DATA_ENTRIES][config_entry.entry_id]
-    runtime.client = mock_client
-    runtime.coordinator.client = mock_client
-    runtime.coordinator.async_request_refresh = AsyncMock()
+    runtime = await setup_integration(mock_client)
+    runtime.coordinator.async_track_commands = MagicMock()
     runtime.coordinator.data = vehicle_data
 
     await hass.services.async_call(
@@ -61,41 +38,17 @@ async def test_lock_service_invokes_api(hass, config_entry, vehicle_data):
     )
 
     mock_client.async_lock_vehicle.assert_awaited_with(VIN)
+    runtime.coordinator.async_track_commands.assert_called_once_with(
+        [mock_client.async_lock_vehicle.return_value]
+    )
 
 
 @pytest.mark.asyncio
-async def test_service_raises_for_unknown_vin(hass, config_entry, vehicle_data):
-    config_entry.add_to_hass(hass)
+async def test_service_raises_for_unknown_vin(hass, setup_integration, vehicle_data):
     mock_client = AsyncMock()
     mock_client.async_get_vehicle_data.return_value = vehicle_data
-
-    hass.config_entries.async_forward_entry_setups = AsyncMock()
-
-    impl_mock = AsyncMock()
-    get_impl_mock = AsyncMock(return_value=impl_mock)
-    oauth_session = AsyncMock()
-
-    with (
-        patch("custom_components.seat_connect.__init__.SeatApiClient", return_value=mock_client),
-        patch(
-            "custom_components.seat_connect.__init__.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            get_impl_mock,
-        ),
-        patch(
-            "custom_components.seat_connect.__init__.config_entry_oauth2_flow.OAuth2Session",
-            return_value=oauth_session,
-        ),
-        patch(
-            "custom_components.seat_connect.coordinator.SeatDataUpdateCoordinator.async_config_entry_first_refresh",
-            AsyncMock(),
-        ),
-    ):
-        assert await async_setup_entry(hass, config_entry)
-
-    runtime = hass.data[DOMAIN][DATA_ENTRIES][config_entry.entry_id]
-    runtime.client = mock_client
-    runtime.coordinator.client = mock_client
-    runtime.coordinator.async_request_refresh = AsyncMock()
+    runtime = await setup_integration(mock_client)
+    runtime.coordinator.async_track_commands = MagicMock()
     runtime.coordinator.data = vehicle_data
 
     with pytest.raises(HomeAssistantError):
@@ -105,3 +58,112 @@ async def test_service_raises_for_unknown_vin(hass, config_entry, vehicle_data):
             {SERVICE_VIN: "UNKNOWN"},
             blocking=True,
         )
+
+
+@pytest.mark.asyncio
+async def test_lock_service_handles_fleet_with_response(
+    hass, config_entry, setup_integration, vehicle_data
+):
+    fleet = {**vehicle_data, "VIN456": replace(vehicle_data[VIN], vin="VIN456")}
+    mock_client = AsyncMock()
+    mock_client.async_lock_vehicle.side_effect = lambda vin: (
+        SeatCommand(vin, "lock", "1") if vin == VIN else _raise(SeatApiError("offline"))
+    )
+    runtime = await setup_integration(mock_client)
+    runtime.coordinator.async_track_commands = MagicMock()
+    runtime.coordinator.data = fleet
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_LOCK,
+        {SERVICE_CONFIG_ENTRY_ID: config_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        "results": {
+            VIN: {"success": True, "command_id": "1"},
+            "VIN456": {"success": False, "error": "offline"},
+        }
+    }
+    runtime.coordinator.async_track_commands.assert_called_once_with(
+        [SeatCommand(VIN, "lock", "1")]
+    )
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOCK, {SERVICE_VIN: [VIN, "VIN456"]}, blocking=True
+        )
+
+    # Unknown VINs are reported alongside the others instead of failing the call.
+    runtime.coordinator.async_track_commands.reset_mock()
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_LOCK,
+        {SERVICE_VIN: [VIN, "UNKNOWN"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "results": {
+            VIN: {"success": True, "command_id": "1"},
+            "UNKNOWN": {"success": False, "error": "No runtime loaded for VIN UNKNOWN"},
+        }
+    }
+
+    # A command that was sent is followed even when another one fails unexpectedly.
+    runtime.coordinator.async_track_commands.reset_mock()
+    mock_client.async_lock_vehicle.side_effect = lambda vin: (
+        SeatCommand(vin, "lock", "1") if vin == VIN else _raise(RuntimeError("boom"))
+    )
+    with pytest.raises(RuntimeError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOCK, {SERVICE_VIN: ["VIN456", VIN]}, blocking=True
+        )
+    runtime.coordinator.async_track_commands.assert_called_once_with(
+        [SeatCommand(VIN, "lock", "1")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_resolves_vin_from_index(hass, setup_integration, vehicle_data):
+    mock_client = AsyncMock()
+    mock_client.async_get_vehicle_data.return_value = vehicle_data
+    runtime = await setup_integration(mock_client)
+    runtime.coordinator.async_track_commands = MagicMock()
+    assert hass.data[DOMAIN][DATA_VINS] == {}
+
+    await runtime.coordinator.async_refresh()
+    assert hass.data[DOMAIN][DATA_VINS] == {VIN: runtime}
+
+    mock_client.async_get_vehicle_data.return_value = {
+        "VIN456": replace(vehicle_data[VIN], vin="VIN456")
+    }
+    await runtime.coordinator.async_refresh()
+    assert hass.data[DOMAIN][DATA_VINS] == {"VIN456": runtime}
+
+    # The index keeps serving the VIN while the coordinator has no data.
+    runtime.coordinator.data = None
+    await hass.services.async_call(DOMAIN, SERVICE_LOCK, {SERVICE_VIN: "VIN456"}, blocking=True)
+    mock_client.async_lock_vehicle.assert_awaited_once_with("VIN456")
+
+
+async def test_token_renewal_does_not_refresh_the_account(hass, config_entry, setup_integration):
+    runtime = await setup_integration(AsyncMock(recorder=None))
+    runtime.coordinator.async_request_refresh = AsyncMock()
+
+    hass.config_entries.async_update_entry(
+        config_entry, data={"token": {"access_token": "renewed", "refresh_token": "refresh"}}
+    )
+    await hass.async_block_till_done()
+    runtime.coordinator.async_request_refresh.assert_not_awaited()
+
+    hass.config_entries.async_update_entry(config_entry, options={CONF_UPDATE_INTERVAL: 120})
+    await hass.async_block_till_done()
+    runtime.coordinator.async_request_refresh.assert_awaited_once()
+    assert runtime.coordinator.polling_policy.normal == timedelta(seconds=120)
+
+
+def _raise(err: Exception) -> SeatCommand:
+    raise err
@@ -0,0 +1,76 @@
+"""Tests for Seat Connect token renewal."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import ClientResponseError
+from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.seat_connect.token import SeatTokenManager
+
+
+def _session(hass, config_entry, expires_in: float) -> tuple[OAuth2Session, AsyncMock]:
+    config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        config_entry,
+        data={"token": {"access_token": "old", "expires_at": time.time() + expires_in}},
+    )
+
+    implementation = MagicMock()
+    implementation.async_refresh_token = AsyncMock(
+        side_effect=lambda _token: {"access_token": "new", "expires_at": time.time() + 3600}
+    )
+    return OAuth2Session(hass, config_entry, implementation), implementation.async_refresh_token
+
+
+async def test_concurrent_requests_share_one_renewal(hass, config_entry):
+    session, refresh = _session(hass, config_entry, expires_in=5)
+    manager = SeatTokenManager(session)
+
+    await asyncio.gather(*(manager.async_ensure_valid() for _ in range(5)))
+
+    refresh.assert_awaited_once()
+    assert session.token["access_token"] == "new"
+    await manager.async_ensure_valid()
+    refresh.assert_awaited_once()
+
+
+async def test_token_is_renewed_ahead_of_expiry(hass, config_entry):
+    session, refresh = _session(hass, config_entry, expires_in=400)
+    manager = SeatTokenManager(session, refresh_margin=300)
+    manager.async_start()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=50))
+    await hass.async_block_till_done()
+    refresh.assert_not_awaited()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=101))
+    await hass.async_block_till_done()
+    refresh.assert_awaited_once()
+    assert manager.renewals == 1
+    assert session.token["access_token"] == "new"
+
+    manager.async_stop()
+
+
+async def test_rejected_refresh_token_starts_reauth_instead_of_retrying(hass, config_entry):
+    session, refresh = _session(hass, config_entry, expires_in=400)
+    refresh.side_effect = ClientResponseError(MagicMock(), (), status=400)
+    manager = SeatTokenManager(session, refresh_margin=300, retry_delay=10)
+    manager.async_start()
+
+    with patch.object(type(config_entry), "async_start_reauth") as start_reauth:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=101))
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=200))
+        await hass.async_block_till_done()
+
+    refresh.assert_awaited_once()
+    start_reauth.assert_called_once_with(hass)
+    manager.async_stop()